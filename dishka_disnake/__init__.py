@@ -124,11 +124,31 @@ __version__ = "0.1.4"
 __author__ = "kipoha"
 
 
-from dishka_disnake.injector import inject, inject_loose
-from dishka_disnake.setup import setup_dishka
+from typing import TYPE_CHECKING
+
+from dishka_disnake.base.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from dishka_disnake.injector import inject, inject_loose, Cached
+    from dishka_disnake.injector.checks import check
+    from dishka_disnake.injector.timeouts import DependencyTimeoutError, resolve_timeout
+    from dishka_disnake.setup import setup_dishka, warmup_dishka
 
 __all__ = [
     "inject",
     "inject_loose",
+    "Cached",
+    "check",
+    "resolve_timeout",
+    "DependencyTimeoutError",
     "setup_dishka",
+    "warmup_dishka",
 ]
+
+# submodules are imported on first attribute access
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "dishka_disnake.injector": ("inject", "inject_loose", "Cached"),
+    "dishka_disnake.injector.checks": ("check",),
+    "dishka_disnake.injector.timeouts": ("resolve_timeout", "DependencyTimeoutError"),
+    "dishka_disnake.setup": ("setup_dishka", "warmup_dishka"),
+})
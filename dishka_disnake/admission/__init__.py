@@ -0,0 +1,218 @@
+"""
+Admission control for injected handlers when the event loop is overloaded.
+
+```py
+from dishka_disnake import setup_dishka
+from dishka_disnake.admission import AdmissionController, Priority
+
+setup_dishka(container, admission=AdmissionController(max_lag=0.2, max_inflight=300))
+
+
+class ModCog(Cog):
+
+    @slash_command(name="ban", priority=Priority.CRITICAL)
+    async def ban(self, interaction: AppCmdInter, service: FromDishka[ModerationService]): ...
+
+    @slash_command(name="meme", priority=Priority.LOW)
+    async def meme(self, interaction: AppCmdInter, memes: FromDishka[MemeService]): ...
+```
+
+The controller measures the event loop lag and counts running handlers.
+While either is over its limit:
+
+- ``CRITICAL`` handlers are always started;
+- ``HIGH`` and ``NORMAL`` ones wait up to ``queue_timeout`` for capacity,
+  ``HIGH`` first;
+- ``LOW`` ones are rejected at once.
+
+Rejected interactions get an ephemeral ``busy_message`` and the handler
+is not called, so no scope is opened and no dependency is resolved.
+"""
+
+import asyncio
+
+from collections import deque
+from enum import IntEnum
+from functools import wraps
+from typing import Any, Callable, Coroutine, Deque, Dict, Optional, TypeVar
+
+from dishka_disnake.base.interaction import find_interaction, reject_interaction
+from dishka_disnake.base.lag import LagMonitor, lag_monitor
+from dishka_disnake.state_management import State
+
+
+__all__ = ("AdmissionController", "AdmissionStats", "Priority", "admission_wrapper")
+
+R = TypeVar("R")
+
+
+class Priority(IntEnum):
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+    CRITICAL = 3
+
+
+class AdmissionStats:
+    __slots__ = ("admitted", "queued", "shed", "lag", "inflight")
+
+    def __init__(self) -> None:
+        self.admitted: Dict[str, int] = {priority.name: 0 for priority in Priority}
+        self.queued: Dict[str, int] = {priority.name: 0 for priority in Priority}
+        self.shed: Dict[str, int] = {priority.name: 0 for priority in Priority}
+        self.lag = 0.0
+        self.inflight = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "admitted": dict(self.admitted),
+            "queued": dict(self.queued),
+            "shed": dict(self.shed),
+            "lag": self.lag,
+            "inflight": self.inflight,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<AdmissionStats admitted={sum(self.admitted.values())} "
+            f"queued={sum(self.queued.values())} shed={sum(self.shed.values())} "
+            f"lag={self.lag * 1000:.1f}ms inflight={self.inflight}>"
+        )
+
+
+class AdmissionController:
+    """
+    Decides whether an injected handler may start.
+
+    ``max_lag`` is the event loop lag (seconds) and ``max_inflight`` the number of
+    running handlers above which the bot counts as overloaded. The lag is sampled
+    every ``interval`` seconds by the monitor shared with the :class:`.Watchdog`,
+    from the first admission on.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_lag: float = 0.25,
+        max_inflight: int = 500,
+        queue_timeout: float = 1.5,
+        interval: float = 0.1,
+        busy_message: str = "The bot is busy right now, please try again in a moment.",
+    ) -> None:
+        self.max_lag = max_lag
+        self.max_inflight = max_inflight
+        self.queue_timeout = queue_timeout
+        self.interval = interval
+        self.busy_message = busy_message
+        self.stats = AdmissionStats()
+
+        self._waiters: Dict[Priority, Deque["asyncio.Future[None]"]] = {
+            Priority.HIGH: deque(),
+            Priority.NORMAL: deque(),
+        }
+        self.closed = False
+        self._monitor: Optional[LagMonitor] = None
+
+    @property
+    def overloaded(self) -> bool:
+        return self.stats.lag > self.max_lag or self.stats.inflight >= self.max_inflight
+
+    def start(self) -> None:
+        """Start sampling the loop lag; done automatically by the first admission."""
+        self.closed = False
+        if self._monitor is None or not self._monitor.running:
+            self._monitor = lag_monitor()
+            self._monitor.subscribe(self._on_lag, self.interval)
+
+    async def close(self) -> None:
+        """Stop sampling; calls admitted afterwards see the last sampled lag."""
+        self.closed = True
+        if self._monitor is not None:
+            await self._monitor.unsubscribe(self._on_lag)
+            self._monitor = None
+
+    def _on_lag(self, lag: float) -> None:
+        self.stats.lag = lag
+        self._wake()
+
+    def _wake(self) -> None:
+        for priority in (Priority.HIGH, Priority.NORMAL):
+            waiters = self._waiters[priority]
+            while waiters and not self.overloaded:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    # the slot is taken on behalf of the waiter
+                    self.stats.inflight += 1
+                    waiter.set_result(None)
+
+    async def admit(self, priority: Priority) -> bool:
+        """Wait for capacity; returns ``False`` if the call must be rejected."""
+        if not self.closed:
+            self.start()
+
+        if priority is Priority.CRITICAL or not self.overloaded:
+            self.stats.inflight += 1
+            self.stats.admitted[priority.name] += 1
+            return True
+
+        if priority is Priority.LOW:
+            self.stats.shed[priority.name] += 1
+            return False
+
+        self.stats.queued[priority.name] += 1
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if waiter.done():
+                # admitted right at the deadline
+                self.stats.admitted[priority.name] += 1
+                return True
+            waiter.cancel()
+            self._waiters[priority].remove(waiter)
+            self.stats.shed[priority.name] += 1
+            return False
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                waiter.cancel()
+                self._waiters[priority].remove(waiter)
+            raise
+
+        self.stats.admitted[priority.name] += 1
+        return True
+
+    def release(self) -> None:
+        self.stats.inflight -= 1
+        self._wake()
+
+    async def reject(self, interaction: Any) -> None:
+        await reject_interaction(interaction, self.busy_message)
+
+
+def admission_wrapper(
+    func: Callable[..., Coroutine[Any, Any, R]],
+    priority: Priority = Priority.NORMAL,
+) -> Callable[..., Coroutine[Any, Any, Optional[R]]]:
+    """Admit calls of ``func`` through the controller passed to ``setup_dishka``, if any."""
+    priority = Priority(priority)
+
+    @wraps(func)
+    async def admitting_wrapper(*args, **kwargs):
+        controller: Optional[AdmissionController] = State.admission
+        if controller is None:
+            return await func(*args, **kwargs)
+
+        if not await controller.admit(priority):
+            await controller.reject(find_interaction(args, kwargs))
+            return None
+
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            controller.release()
+
+    admitting_wrapper.__dishka_priority__ = priority  # type: ignore[attr-defined]
+    return admitting_wrapper
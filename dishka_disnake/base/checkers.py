@@ -4,6 +4,11 @@ import builtins
 from typing import get_origin, get_args
 
 
+def type_name(tp: object) -> str:
+    """Name of a dependency type in messages, stats and labels, the repr of generic aliases."""
+    return getattr(tp, "__qualname__", None) or repr(tp)
+
+
 def is_builtin_type(tp: object) -> bool:
     return tp in vars(builtins).values()
 
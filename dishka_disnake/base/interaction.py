@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import logging
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from disnake import Interaction
+
+_log = logging.getLogger(__name__)
+
+
+def find_interaction(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[Interaction]:
+    """
+    Find the interaction among callback arguments.
+
+    Slash commands receive it as a keyword (see ``call_param_func``),
+    components and modals positionally.
+    """
+    # disnake is already loaded once interactions exist,
+    # importing it here keeps it out of `import dishka_disnake`
+    from disnake import Interaction
+
+    for arg in args:
+        if isinstance(arg, Interaction):
+            return arg
+
+    for value in kwargs.values():
+        if isinstance(value, Interaction):
+            return value
+
+    return None
+
+
+_COMMAND_KINDS = {"chat_input": "slash", "user": "user", "message": "message"}
+
+
+def interaction_kind(interaction: Any) -> str:
+    """``slash``, ``user``, ``message``, ``component``, ``modal`` or ``other``."""
+    from disnake import ApplicationCommandInteraction, MessageInteraction, ModalInteraction
+
+    if isinstance(interaction, ApplicationCommandInteraction):
+        return _COMMAND_KINDS.get(interaction.data.type.name, "other")
+    if isinstance(interaction, MessageInteraction):
+        return "component"
+    if isinstance(interaction, ModalInteraction):
+        return "modal"
+    return "other"
+
+
+def interaction_attributes(interaction: Any) -> Dict[str, Any]:
+    """Identifying fields of ``interaction``: kind, command name or custom id, guild and user."""
+    if interaction is None:
+        return {}
+
+    attributes: Dict[str, Any] = {"kind": interaction_kind(interaction)}
+    data = getattr(interaction, "data", None)
+    name = getattr(data, "name", None)
+    if name is not None:
+        attributes["command"] = name
+    custom_id = getattr(data, "custom_id", None)
+    if custom_id is not None:
+        attributes["custom_id"] = custom_id
+    if interaction.guild_id is not None:
+        attributes["guild_id"] = interaction.guild_id
+    attributes["user_id"] = interaction.author.id
+    return attributes
+
+
+def replace_interaction(
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    interaction: Any,
+    replacement: Any,
+) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """
+    Return copies of ``args``/``kwargs`` with ``interaction`` swapped for ``replacement``.
+    """
+    new_args = tuple(replacement if arg is interaction else arg for arg in args)
+    new_kwargs = {
+        key: replacement if value is interaction else value
+        for key, value in kwargs.items()
+    }
+    return new_args, new_kwargs
+
+
+async def reject_interaction(interaction: Any, message: str) -> None:
+    """
+    Answer ``interaction`` with an ephemeral ``message`` instead of calling its handler,
+    unless there is none or it was already answered. Failing to send is only logged.
+    """
+    from disnake import HTTPException
+
+    from dishka_disnake.commands.recording import RecordingInteraction
+
+    if isinstance(interaction, RecordingInteraction):
+        # the rejection must not be cached or replayed to coalesced calls
+        interaction.replayable = False
+        interaction = interaction.interaction
+
+    if interaction is None or interaction.response.is_done():
+        return
+    try:
+        await interaction.response.send_message(message, ephemeral=True)
+    except HTTPException as exc:
+        _log.debug("Failed to send %r: %s", message, exc)
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+
+from typing import Callable, Dict, Optional
+
+from dishka_disnake.state_management import State
+
+
+__all__ = ("LagMonitor", "lag_monitor")
+
+_log = logging.getLogger(__name__)
+
+LagListener = Callable[[float], None]
+
+
+class LagMonitor:
+    """
+    Measures the event loop lag: how much later than asked a sleep wakes up.
+
+    One task samples it for every listener, at the shortest interval they asked
+    for, and passes each sample to all of them. It runs while someone listens.
+    """
+
+    def __init__(self) -> None:
+        self.lag = 0.0
+        self._listeners: Dict[LagListener, float] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def interval(self) -> float:
+        return min(self._listeners.values(), default=1.0)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, listener: LagListener, interval: float) -> None:
+        """Call ``listener`` with a sample at least every ``interval`` seconds; needs a running loop."""
+        self._listeners[listener] = interval
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(
+                self._sample(), name="dishka-disnake: lag monitor"
+            )
+
+    async def unsubscribe(self, listener: LagListener) -> None:
+        self._listeners.pop(listener, None)
+        if not self._listeners and self._task is not None:
+            self._task.cancel()
+            await asyncio.wait((self._task,))
+            self._task = None
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # a shorter interval asked for meanwhile applies from the next sample
+            interval = self.interval
+            started = loop.time()
+            await asyncio.sleep(interval)
+            self.lag = max(0.0, loop.time() - started - interval)
+            for listener in list(self._listeners):
+                try:
+                    listener(self.lag)
+                except Exception:
+                    _log.exception("Lag listener %r failed", listener)
+
+
+def lag_monitor() -> LagMonitor:
+    """The monitor shared by the admission controller and the watchdog."""
+    monitor: Optional[LagMonitor] = State.lag_monitor
+    if monitor is None:
+        monitor = State.lag_monitor = LagMonitor()
+    return monitor
@@ -0,0 +1,54 @@
+import importlib
+import sys
+
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+__all__ = ("lazy_exports",)
+
+
+class _LazyModule(ModuleType):
+    __lazy_exports__: Dict[str, str]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # importing a submodule binds it on its package: keep exports sharing
+        # its name (``ui.button``, ``ui.select``) pointing to the decorator
+        if isinstance(value, ModuleType) and name in self.__lazy_exports__:
+            return
+        super().__setattr__(name, value)
+
+
+def lazy_exports(
+    module_name: str,
+    exports: Dict[str, Iterable[str]],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    PEP 562 ``__getattr__`` and ``__dir__`` importing each exported name
+    from its submodule on first access.
+
+    ``exports`` maps a submodule to the names it provides::
+
+        __getattr__, __dir__ = lazy_exports(__name__, {
+            "dishka_disnake.injector": ("inject", "inject_loose"),
+        })
+    """
+    origins = {name: submodule for submodule, names in exports.items() for name in names}
+    module = sys.modules[module_name]
+    module.__class__ = _LazyModule
+    module.__lazy_exports__ = origins  # type: ignore[attr-defined]
+
+    def __getattr__(name: str) -> Any:
+        submodule = origins.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(submodule), name)
+        # later lookups don't reach __getattr__
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(origins))
+
+    return __getattr__, __dir__
@@ -1,12 +1,16 @@
 import inspect
 
-from typing import Callable
+from typing import Callable, Optional
 
 from dishka_disnake.base.checkers import is_disnake_annotation
+from dishka_disnake.injector import extract_fromdishka
 
 
-def rebuild_signature(func: Callable) -> inspect.Signature:
-    sig = inspect.signature(func)
+def rebuild_signature(
+    func: Callable,
+    signature: Optional[inspect.Signature] = None,
+) -> inspect.Signature:
+    sig = signature if signature is not None else inspect.signature(func)
     params = []
 
     params_ = sig.parameters.items()
@@ -22,6 +26,10 @@ def rebuild_signature(func: Callable) -> inspect.Signature:
             params.append(param)
             continue
 
+        # explicit FromDishka[...] is injected even for disnake/dishka_disnake types
+        if extract_fromdishka(param.annotation) is not None:
+            continue
+
         if is_disnake_annotation(param.annotation):
             params.append(param)
             continue
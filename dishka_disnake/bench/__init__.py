@@ -0,0 +1,355 @@
+"""
+Microbenchmarks of the injector and of decorating handlers and components.
+
+    python -m dishka_disnake.bench --output before.json
+    python -m dishka_disnake.bench --output after.json --compare before.json
+    python -m dishka_disnake.bench --filter inject --repeat 10
+
+Each benchmark is timed like :mod:`timeit`: ``repeat`` rounds of ``number``
+operations (chosen so a round takes at least ``min_time``), with the garbage
+collector disabled. Times are seconds per operation; the minimum is the most
+stable figure to compare between releases, on the same machine. The JSON output
+holds the timings and the environment they were measured in.
+
+Benchmarks replace the container given to ``setup_dishka`` while they run,
+and restore it afterwards.
+"""
+
+import asyncio
+import gc
+import importlib.metadata
+import inspect
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Pattern, Union
+
+import disnake
+
+from dishka import FromDishka, Provider, Scope, make_async_container, provide
+
+import dishka_disnake
+
+from dishka_disnake.base.checkers import is_dependency
+from dishka_disnake.base.sign import rebuild_signature
+from dishka_disnake.injector import extract_fromdishka, inject
+from dishka_disnake.injector.wrap import wrap_injector
+from dishka_disnake.state_management import State
+from dishka_disnake.testing import InteractionFactory
+from dishka_disnake.ui import Button, button
+
+
+__all__ = ("BENCHMARKS", "Benchmark", "Timing", "compare", "environment", "run")
+
+
+class Timing(NamedTuple):
+    name: str
+    number: int
+    times: List[float]  # seconds per operation, one per round
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "number": self.number,
+            "repeat": len(self.times),
+            "min": min(self.times),
+            "median": statistics.median(self.times),
+            "mean": statistics.fmean(self.times),
+            "stdev": statistics.stdev(self.times) if len(self.times) > 1 else 0.0,
+            "times": self.times,
+        }
+
+
+class Benchmark(NamedTuple):
+    name: str
+    description: str
+    # returns the operation to time, sync or async, once the event loop runs
+    setup: Callable[[], Callable[[], Any]]
+    is_async: bool = False
+
+
+# dependencies are types of the bot, types of dishka_disnake are never injected without FromDishka
+class Repo:
+    __module__ = "bot.services"
+
+
+class Cache:
+    __module__ = "bot.services"
+
+
+class Clock:
+    __module__ = "bot.services"
+
+
+class _Provider(Provider):
+    scope = Scope.REQUEST
+
+    repo = provide(Repo)
+    cache = provide(Cache, scope=Scope.APP)
+    clock = provide(Clock)
+
+
+async def _handler(
+    inter: disnake.ApplicationCommandInteraction,
+    repo: FromDishka[Repo],
+    cache: FromDishka[Cache],
+    clock: Clock,
+    count: int = 1,
+    reason: str = "",
+) -> None:
+    pass
+
+
+async def _plain_handler(inter: disnake.ApplicationCommandInteraction, count: int = 1) -> None:
+    pass
+
+
+_ANNOTATIONS = (
+    inspect.Parameter.empty,
+    int,
+    Optional[str],
+    disnake.ApplicationCommandInteraction,
+    disnake.Member,
+    Repo,
+    FromDishka[Repo],
+    Optional[Clock],
+)
+
+
+def _setup_call(handler: Callable[..., Awaitable[Any]], wrap: bool) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        func = inject(handler) if wrap else handler
+        inter = InteractionFactory().slash("bench", {"count": 2})
+        return lambda: func(inter=inter, count=2)
+
+    return setup
+
+
+def _setup_classify(classify: Callable[[Any], Any]) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        def op() -> None:
+            for annotation in _ANNOTATIONS:
+                classify(annotation)
+
+        return op
+
+    return setup
+
+
+def _setup_rebuild_signature() -> Callable[[], Any]:
+    signature = inspect.signature(_handler)
+    return lambda: rebuild_signature(_handler, signature)
+
+
+def _setup_component_subclass() -> Callable[[], Any]:
+    async def callback(self: Any, interaction: disnake.MessageInteraction, repo: FromDishka[Repo]) -> None:
+        pass
+
+    namespace = {"callback": callback}
+    return lambda: type("BenchButton", (Button,), dict(namespace))
+
+
+def _setup_view() -> Callable[[], Any]:
+    async def callback(
+        self: Any, component: Any, interaction: disnake.MessageInteraction, repo: FromDishka[Repo]
+    ) -> None:
+        pass
+
+    namespace = {f"button_{i}": button(label=str(i), custom_id=f"bench:{i}")(callback) for i in range(5)}
+    view = type("BenchView", (disnake.ui.View,), namespace)
+    return view
+
+
+BENCHMARKS = (
+    Benchmark(
+        "call.plain",
+        "await of an undecorated handler, the baseline of inject.call",
+        _setup_call(_plain_handler, wrap=False),
+        is_async=True,
+    ),
+    Benchmark(
+        "inject.call",
+        "await of an injected handler with 3 dependencies (2 per request, 1 per app)",
+        _setup_call(_handler, wrap=True),
+        is_async=True,
+    ),
+    Benchmark(
+        "wrap_injector",
+        "decorating a handler with 3 dependencies and 3 disnake parameters",
+        lambda: lambda: wrap_injector(_handler),
+    ),
+    Benchmark(
+        "rebuild_signature",
+        "signature of that handler without its dependencies",
+        _setup_rebuild_signature,
+    ),
+    Benchmark(
+        "is_dependency",
+        f"classifying {len(_ANNOTATIONS)} annotations",
+        _setup_classify(is_dependency),
+    ),
+    Benchmark(
+        "extract_fromdishka",
+        f"unwrapping {len(_ANNOTATIONS)} annotations",
+        _setup_classify(extract_fromdishka),
+    ),
+    Benchmark(
+        "component.subclass",
+        "WrappedDishkaComponent.__init_subclass__: defining a Button subclass with a callback",
+        _setup_component_subclass,
+    ),
+    Benchmark(
+        "view.init",
+        "constructing a View with 5 wrapped buttons",
+        _setup_view,
+    ),
+)
+
+
+def _autorange(op: Callable[[], Any], min_time: float) -> int:
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            op()
+        if time.perf_counter() - started >= min_time:
+            return number
+        number *= 2
+
+
+async def _autorange_async(op: Callable[[], Any], min_time: float) -> int:
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            await op()
+        if time.perf_counter() - started >= min_time:
+            return number
+        number *= 2
+
+
+async def _time(benchmark: Benchmark, repeat: int, number: Optional[int], min_time: float) -> Timing:
+    op = benchmark.setup()
+    if number is None:
+        if benchmark.is_async:
+            number = await _autorange_async(op, min_time)
+        else:
+            number = _autorange(op, min_time)
+
+    times = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            if benchmark.is_async:
+                for _ in range(number):
+                    await op()
+            else:
+                for _ in range(number):
+                    op()
+            times.append((time.perf_counter() - started) / number)
+            gc.collect()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return Timing(benchmark.name, number, times)
+
+
+def _version(distribution: str) -> Optional[str]:
+    try:
+        return importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    """Interpreter, machine and library versions the timings were measured with."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "dishka_disnake": dishka_disnake.__version__,
+        "dishka": _version("dishka"),
+        "disnake": disnake.__version__,
+    }
+
+
+async def _run(
+    benchmarks: List[Benchmark],
+    repeat: int,
+    number: Optional[int],
+    min_time: float,
+    progress: Optional[Callable[[Timing], None]],
+) -> List[Timing]:
+    container = make_async_container(_Provider())
+    saved = dict(State._store)
+    State._store.clear()
+    State.container = container
+    try:
+        timings = []
+        for benchmark in benchmarks:
+            timing = await _time(benchmark, repeat, number, min_time)
+            timings.append(timing)
+            if progress is not None:
+                progress(timing)
+        return timings
+    finally:
+        State._store.clear()
+        State._store.update(saved)
+        await container.close()
+
+
+def run(
+    *,
+    pattern: Optional[Union[str, Pattern[str]]] = None,
+    repeat: int = 5,
+    number: Optional[int] = None,
+    min_time: float = 0.2,
+    progress: Optional[Callable[[Timing], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run the benchmarks whose name matches ``pattern`` (all by default) and return
+    the JSON document: ``{"environment": {...}, "benchmarks": [...]}``.
+    ``progress`` is called with each timing once measured.
+    """
+    if repeat <= 0:
+        raise ValueError("repeat must be positive")
+
+    regex = re.compile(pattern) if pattern is not None else None
+    selected = [b for b in BENCHMARKS if regex is None or regex.search(b.name)]
+    descriptions = {b.name: b.description for b in selected}
+
+    timings = asyncio.run(_run(selected, repeat, number, min_time, progress))
+    return {
+        "environment": environment(),
+        "benchmarks": [
+            {**timing.as_dict(), "description": descriptions[timing.name]} for timing in timings
+        ],
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Ratio of the minimum times of ``baseline`` to ``current``, above 1 when faster."""
+    before = {entry["name"]: entry for entry in baseline["benchmarks"]}
+    rows = []
+    for entry in current["benchmarks"]:
+        old = before.get(entry["name"])
+        if old is None:
+            continue
+        rows.append({
+            "name": entry["name"],
+            "before": old["min"],
+            "after": entry["min"],
+            "speedup": old["min"] / entry["min"],
+        })
+    return rows
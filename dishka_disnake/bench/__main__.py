@@ -0,0 +1,63 @@
+"""
+Microbenchmarks of the injector and of decorating handlers and components.
+
+    python -m dishka_disnake.bench [--filter REGEX] [--repeat N] [--number N]
+                                   [--output FILE] [--compare BASELINE]
+
+Prints a summary to stderr and the JSON document to ``--output`` (stdout by default).
+"""
+
+import argparse
+import json
+import sys
+
+from dishka_disnake.bench import Timing, compare, run
+
+
+def _progress(timing: Timing) -> None:
+    print(
+        f"{timing.name:<20} {min(timing.times) * 1e6:>10.2f}us  ({timing.number} x {len(timing.times)})",
+        file=sys.stderr,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filter", help="only run benchmarks whose name matches this regex")
+    parser.add_argument("--repeat", type=int, default=5, help="rounds per benchmark")
+    parser.add_argument("--number", type=int, help="operations per round, calibrated if omitted")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per calibrated round")
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare with")
+    args = parser.parse_args()
+
+    results = run(
+        pattern=args.filter,
+        repeat=args.repeat,
+        number=args.number,
+        min_time=args.min_time,
+        progress=_progress,
+    )
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        results["compare"] = rows = compare(baseline, results)
+        print(file=sys.stderr)
+        for row in rows:
+            print(
+                f"{row['name']:<20} {row['before'] * 1e6:>10.2f}us -> {row['after'] * 1e6:>10.2f}us"
+                f"  x{row['speedup']:.2f}",
+                file=sys.stderr,
+            )
+
+    document = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(document + "\n")
+    else:
+        print(document)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+Circuit breakers for dependencies whose providers fail or hang.
+
+```py
+from dishka_disnake import setup_dishka
+from dishka_disnake.breaker import CircuitBreaker, breaker_stats
+
+setup_dishka(
+    container,
+    breakers={
+        RemoteConfig: CircuitBreaker(failure_threshold=5, slow_call=2.0, fallback=LocalConfig),
+        PaymentsClient: CircuitBreaker(failure_threshold=3, reset_timeout=10),
+    },
+)
+
+breaker_stats()  # {"RemoteConfig": {"state": "open", "failures": 5, ...}, ...}
+```
+
+Every resolution of a guarded type requested by a handler or a check is counted:
+one that raises, or takes longer than ``slow_call`` seconds, is a failure.
+Types only created as dependencies of other providers are resolved inside dishka
+and never reach the breaker, so guard the type handlers ask for (``PaymentsClient``
+rather than the ``Database`` it is built from). After ``failure_threshold`` failures in
+a row the circuit opens and resolutions fail at once with
+:class:`CircuitOpenError` instead of waiting for the provider, or resolve the
+``fallback`` type from the same scope if one is declared.
+After ``reset_timeout`` seconds a single resolution is let through as a probe
+(half-open); its success closes the circuit, its failure opens it again.
+"""
+
+import logging
+import time
+
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from dishka.exceptions import NoFactoryError
+
+from dishka_disnake.base.checkers import type_name
+from dishka_disnake.state_management import State
+
+
+__all__ = (
+    "BreakerState",
+    "CircuitBreaker",
+    "CircuitBreakerStats",
+    "CircuitOpenError",
+    "breaker_stats",
+)
+
+_log = logging.getLogger(__name__)
+
+
+class BreakerState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of resolving ``dependency`` while its circuit is open.
+    ``retry_after`` is the number of seconds until the next probe.
+    """
+
+    def __init__(self, dependency: Any, retry_after: float) -> None:
+        self.dependency = dependency
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit of {type_name(dependency)} is open, retry in {retry_after:.1f}s"
+        )
+
+
+class CircuitBreakerStats:
+    __slots__ = (
+        "state",
+        "consecutive_failures",
+        "failures",
+        "slow_calls",
+        "successes",
+        "rejected",
+        "fallbacks",
+        "opened",
+        "opened_at",
+        "last_error",
+    )
+
+    def __init__(self) -> None:
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.failures = 0
+        self.slow_calls = 0
+        self.successes = 0
+        self.rejected = 0
+        self.fallbacks = 0
+        self.opened = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "failures": self.failures,
+            "slow_calls": self.slow_calls,
+            "successes": self.successes,
+            "rejected": self.rejected,
+            "fallbacks": self.fallbacks,
+            "opened": self.opened,
+            "open_for": (
+                time.monotonic() - self.opened_at if self.opened_at is not None else 0.0
+            ),
+            "last_error": self.last_error,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<CircuitBreakerStats state={self.state.value} failures={self.failures} "
+            f"rejected={self.rejected} fallbacks={self.fallbacks} opened={self.opened}>"
+        )
+
+
+class CircuitBreaker:
+    """
+    Breaker of one dependency type.
+
+    ``failure_threshold`` consecutive failures open the circuit for ``reset_timeout``
+    seconds. With ``slow_call``, resolutions taking longer than that many seconds
+    count as failures too (their value is still used). ``fallback`` is a dependency
+    type resolved instead while the circuit is open.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        slow_call: Optional[float] = None,
+        fallback: Any = None,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be positive")
+        if reset_timeout <= 0:
+            raise ValueError("reset_timeout must be positive")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.slow_call = slow_call
+        self.fallback = fallback
+        self.stats = CircuitBreakerStats()
+
+        self._probing = False
+
+    @property
+    def state(self) -> BreakerState:
+        return self.stats.state
+
+    def _allow(self) -> bool:
+        stats = self.stats
+        if stats.state is BreakerState.CLOSED:
+            return True
+        if self._probing:
+            return False
+        if stats.state is BreakerState.OPEN:
+            if time.monotonic() - stats.opened_at < self.reset_timeout:  # type: ignore[operator]
+                return False
+            stats.state = BreakerState.HALF_OPEN
+        # half-open: this call is the probe
+        self._probing = True
+        return True
+
+    def _retry_after(self) -> float:
+        if self.stats.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.stats.opened_at))
+
+    def _success(self, dep_type: Any) -> None:
+        stats = self.stats
+        stats.successes += 1
+        stats.consecutive_failures = 0
+        if stats.state is not BreakerState.CLOSED:
+            _log.warning(
+                "Circuit of %s closed after %.1fs",
+                type_name(dep_type),
+                time.monotonic() - stats.opened_at,  # type: ignore[operator]
+            )
+            stats.state = BreakerState.CLOSED
+            stats.opened_at = None
+
+    def _failure(self, dep_type: Any, error: str) -> None:
+        stats = self.stats
+        stats.failures += 1
+        stats.consecutive_failures += 1
+        stats.last_error = error
+
+        if stats.state is BreakerState.HALF_OPEN or (
+            stats.state is BreakerState.CLOSED
+            and stats.consecutive_failures >= self.failure_threshold
+        ):
+            if stats.state is BreakerState.CLOSED:
+                _log.warning(
+                    "Circuit of %s opened after %d failures, last: %s",
+                    type_name(dep_type),
+                    stats.consecutive_failures,
+                    error,
+                )
+                stats.opened += 1
+            stats.state = BreakerState.OPEN
+            stats.opened_at = time.monotonic()
+
+    async def call(self, dep_type: Any, get: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Resolve ``dep_type`` with ``get`` (e.g. ``scope.get``) through the breaker."""
+        if not self._allow():
+            if self.fallback is not None:
+                self.stats.fallbacks += 1
+                return await get(self.fallback)
+            self.stats.rejected += 1
+            raise CircuitOpenError(dep_type, self._retry_after())
+
+        probe = self._probing
+        started = time.monotonic()
+        try:
+            value = await get(dep_type)
+        except NoFactoryError:
+            # a configuration error, not an outage
+            raise
+        except Exception as exc:
+            self._failure(dep_type, f"{type(exc).__name__}: {exc}")
+            raise
+        finally:
+            if probe:
+                self._probing = False
+
+        elapsed = time.monotonic() - started
+        if self.slow_call is not None and elapsed > self.slow_call:
+            self.stats.slow_calls += 1
+            self._failure(dep_type, f"slow call: {elapsed:.2f}s")
+        else:
+            self._success(dep_type)
+        return value
+
+
+def breaker_stats() -> Dict[str, dict]:
+    """State of every breaker passed to ``setup_dishka``, by dependency type name."""
+    breakers: Optional[Dict[Any, CircuitBreaker]] = State.breakers
+    if not breakers:
+        return {}
+    return {type_name(dep_type): breaker.stats.as_dict() for dep_type, breaker in breakers.items()}
@@ -0,0 +1,333 @@
+"""
+Run shard ranges of one bot in several processes, each with its own container.
+
+Example:
+
+```py
+from dishka import make_async_container
+from disnake.ext.commands import AutoShardedInteractionBot
+from dishka_disnake.cluster import ClusterLauncher, ShardAssignment
+
+
+def make_container():
+    return make_async_container(DbProvider(), HttpProvider())
+
+
+def make_bot(assignment: ShardAssignment):
+    bot = AutoShardedInteractionBot(
+        shard_ids=list(assignment.shard_ids),
+        shard_count=assignment.shard_count,
+    )
+    bot.load_extensions("cogs")
+    return bot
+
+
+if __name__ == "__main__":
+    ClusterLauncher(
+        bot_factory=make_bot,
+        container_factory=make_container,
+        token="YOUR_BOT_TOKEN",
+        shard_count=16,
+        processes=4,
+    ).run()
+```
+
+Factories are sent to spawned processes, so they must be module-level functions.
+Pass `bot_factory=FakeGateway` to try the launcher without connecting to Discord.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import signal
+import time
+
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Protocol, Tuple
+
+from dishka import AsyncContainer
+
+
+__all__ = ("ClusterError", "ClusterLauncher", "ShardAssignment", "FakeGateway", "split_shards")
+
+_log = logging.getLogger(__name__)
+
+
+class ClusterError(RuntimeError):
+    """Raised by :meth:`ClusterLauncher.run` when a worker keeps crashing."""
+
+
+class ShardAssignment(NamedTuple):
+    worker_id: int
+    shard_ids: Tuple[int, ...]
+    shard_count: int
+
+
+class Runner(Protocol):
+    """What a worker needs from the bot: ``disnake.Client`` satisfies it."""
+
+    async def start(self, token: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class FakeGateway:
+    """
+    Gateway stand-in for local runs of the launcher: it never connects,
+    it only waits until it is closed.
+    """
+
+    def __init__(self, assignment: ShardAssignment) -> None:
+        self.assignment = assignment
+        self._closed = asyncio.Event()
+
+    async def start(self, token: str) -> None:
+        _log.info(
+            "Fake gateway %d serving shards %s",
+            self.assignment.worker_id,
+            self.assignment.shard_ids,
+        )
+        await self._closed.wait()
+
+    async def close(self) -> None:
+        self._closed.set()
+
+
+def split_shards(shard_count: int, processes: int) -> List[ShardAssignment]:
+    """Split ``range(shard_count)`` into contiguous, evenly sized ranges."""
+    if shard_count <= 0 or processes <= 0:
+        raise ValueError("shard_count and processes must be positive")
+
+    processes = min(processes, shard_count)
+    base, extra = divmod(shard_count, processes)
+
+    assignments = []
+    start = 0
+    for worker_id in range(processes):
+        size = base + (1 if worker_id < extra else 0)
+        assignments.append(
+            ShardAssignment(worker_id, tuple(range(start, start + size)), shard_count)
+        )
+        start += size
+    return assignments
+
+
+async def _run_worker(
+    assignment: ShardAssignment,
+    bot_factory: Callable[[ShardAssignment], Runner],
+    container_factory: Callable[[], AsyncContainer],
+    token: str,
+    stop: Any,
+) -> None:
+    from dishka_disnake.setup import setup_dishka
+
+    container = container_factory()
+    setup_dishka(container)
+    bot = bot_factory(assignment)
+
+    loop = asyncio.get_running_loop()
+    runner = asyncio.create_task(bot.start(token))
+    stopping = loop.run_in_executor(None, stop.wait)
+
+    try:
+        await asyncio.wait((runner, stopping), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        await bot.close()
+        if not runner.done():
+            await asyncio.wait((runner,))
+        await container.close()
+        # unblock the executor thread if the bot stopped on its own
+        stop.set()
+        await stopping
+
+    # re-raise bot crashes so the supervisor restarts the worker
+    if runner.done() and not runner.cancelled():
+        runner.result()
+
+
+def _worker_main(
+    assignment: ShardAssignment,
+    bot_factory: Callable[[ShardAssignment], Runner],
+    container_factory: Callable[[], AsyncContainer],
+    token: str,
+    stop: Any,
+) -> None:
+    # the supervisor decides when workers stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(_run_worker(assignment, bot_factory, container_factory, token, stop))
+
+
+class _Worker:
+    def __init__(self, assignment: ShardAssignment) -> None:
+        self.assignment = assignment
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        self.stop: Any = None
+        self.restarts = 0
+        self.started_at = 0.0
+
+
+class ClusterLauncher:
+    """
+    Spawns one process per shard range and keeps them running.
+
+    Every worker builds a fresh container with ``container_factory``,
+    passes it to :func:`setup_dishka` and runs ``bot_factory(assignment).start(token)``.
+    Crashed workers are restarted with exponential backoff, up to ``max_restarts``
+    times in a row (a worker that ran for ``restart_window`` seconds is considered healthy again);
+    past that the cluster is stopped and :meth:`run` raises :class:`ClusterError`.
+    Workers whose bot returned normally (exit code 0) are not restarted, and
+    :meth:`run` returns once none is left.
+
+    On SIGINT/SIGTERM (or :meth:`stop`) workers are asked to close their bot
+    and container and are killed if they don't finish within ``drain_timeout``.
+    """
+
+    def __init__(
+        self,
+        *,
+        bot_factory: Callable[[ShardAssignment], Runner],
+        container_factory: Callable[[], AsyncContainer],
+        token: str,
+        shard_count: int,
+        processes: Optional[int] = None,
+        max_restarts: int = 5,
+        restart_delay: float = 1.0,
+        restart_window: float = 60.0,
+        drain_timeout: float = 30.0,
+    ) -> None:
+        self.bot_factory = bot_factory
+        self.container_factory = container_factory
+        self.token = token
+        self.max_restarts = max_restarts
+        self.restart_delay = restart_delay
+        self.restart_window = restart_window
+        self.drain_timeout = drain_timeout
+
+        self._context = multiprocessing.get_context("spawn")
+        self._workers = [
+            _Worker(assignment)
+            for assignment in split_shards(shard_count, processes or multiprocessing.cpu_count())
+        ]
+        self._stopping = False
+
+    @property
+    def assignments(self) -> List[ShardAssignment]:
+        return [worker.assignment for worker in self._workers]
+
+    def _spawn(self, worker: _Worker) -> None:
+        worker.stop = self._context.Event()
+        worker.process = self._context.Process(
+            target=_worker_main,
+            args=(
+                worker.assignment,
+                self.bot_factory,
+                self.container_factory,
+                self.token,
+                worker.stop,
+            ),
+            name=f"dishka-disnake-worker-{worker.assignment.worker_id}",
+        )
+        worker.process.start()
+        worker.started_at = time.monotonic()
+        _log.info(
+            "Started worker %d (pid %s) for shards %s",
+            worker.assignment.worker_id,
+            worker.process.pid,
+            worker.assignment.shard_ids,
+        )
+
+    def stop(self, *_: Any) -> None:
+        """Ask the supervisor loop to drain and stop every worker."""
+        self._stopping = True
+
+    def run(self) -> None:
+        """
+        Start the workers and supervise them until stopped or all finished.
+        Raises :class:`ClusterError` once a worker is out of restarts.
+        """
+        previous = {
+            sig: signal.signal(sig, self.stop) for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            for worker in self._workers:
+                self._spawn(worker)
+            self._supervise()
+        finally:
+            self._drain()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+
+    def _supervise(self) -> None:
+        pending_restarts: Dict[int, float] = {}
+
+        while not self._stopping:
+            sentinels = [
+                worker.process.sentinel
+                for worker in self._workers
+                if worker.process is not None and worker.process.is_alive()
+            ]
+            if sentinels:
+                wait(sentinels, timeout=0.5)
+            else:
+                time.sleep(0.5)
+
+            now = time.monotonic()
+            for worker in self._workers:
+                process = worker.process
+                worker_id = worker.assignment.worker_id
+
+                if process is not None and not process.is_alive() and not self._stopping:
+                    if process.exitcode == 0:
+                        _log.info("Worker %d finished", worker_id)
+                        worker.process = None
+                        continue
+
+                    if now - worker.started_at >= self.restart_window:
+                        worker.restarts = 0
+                    worker.restarts += 1
+                    if worker.restarts > self.max_restarts:
+                        self._stopping = True
+                        raise ClusterError(
+                            f"Worker {worker_id} exited with code {process.exitcode} "
+                            f"{worker.restarts} times in a row, stopping the cluster"
+                        )
+
+                    delay = self.restart_delay * 2 ** (worker.restarts - 1)
+                    _log.warning(
+                        "Worker %d exited with code %s, restarting in %.1fs",
+                        worker_id,
+                        process.exitcode,
+                        delay,
+                    )
+                    worker.process = None
+                    pending_restarts[worker_id] = now + delay
+
+                if worker_id in pending_restarts and pending_restarts[worker_id] <= now:
+                    del pending_restarts[worker_id]
+                    self._spawn(worker)
+
+            if not pending_restarts and all(worker.process is None for worker in self._workers):
+                return
+
+    def _drain(self) -> None:
+        alive = [
+            worker
+            for worker in self._workers
+            if worker.process is not None and worker.process.is_alive()
+        ]
+        for worker in alive:
+            worker.stop.set()
+
+        deadline = time.monotonic() + self.drain_timeout
+        for worker in alive:
+            process = worker.process
+            assert process is not None
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                _log.warning(
+                    "Worker %d didn't drain in %.1fs, terminating",
+                    worker.assignment.worker_id,
+                    self.drain_timeout,
+                )
+                process.terminate()
+                process.join()
@@ -1,4 +1,28 @@
-from dishka_disnake.commands.slash import slash_command
-from dishka_disnake.commands.ctx_menus import user_command, message_command
+from typing import TYPE_CHECKING
 
-__all__ = ["slash_command", "user_command", "message_command"]
+from dishka_disnake.base.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from dishka_disnake.commands.slash import slash_command
+    from dishka_disnake.commands.ctx_menus import user_command, message_command
+    from dishka_disnake.commands.cache import ResponseCache, CacheScope
+    from dishka_disnake.commands.coalesce import Coalescer
+    from dishka_disnake.commands.cog import Cog
+
+__all__ = [
+    "slash_command",
+    "user_command",
+    "message_command",
+    "ResponseCache",
+    "CacheScope",
+    "Coalescer",
+    "Cog",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "dishka_disnake.commands.slash": ("slash_command",),
+    "dishka_disnake.commands.ctx_menus": ("user_command", "message_command"),
+    "dishka_disnake.commands.cache": ("ResponseCache", "CacheScope"),
+    "dishka_disnake.commands.coalesce": ("Coalescer",),
+    "dishka_disnake.commands.cog": ("Cog",),
+})
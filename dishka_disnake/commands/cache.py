@@ -0,0 +1,223 @@
+import time
+
+from collections import OrderedDict
+from enum import Enum
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Hashable, List, Optional, Tuple, TypeVar, Union
+
+from disnake import Interaction, OptionType
+
+from dishka_disnake.base.interaction import find_interaction, replace_interaction
+from dishka_disnake.commands.recording import RecordedResponse, RecordingInteraction
+from dishka_disnake.state_management import State
+
+if TYPE_CHECKING:
+    from dishka_disnake.metrics import Metrics
+
+
+__all__ = ("CacheScope", "CacheStats", "ResponseCache")
+
+R = TypeVar("R")
+
+_NESTED = (OptionType.sub_command, OptionType.sub_command_group)
+
+# (command path, options, guild id, user id)
+CacheKey = Tuple[Tuple[str, ...], Tuple[Tuple[str, Hashable], ...], Optional[int], Optional[int]]
+
+
+class CacheScope(str, Enum):
+    """Who shares a cached response."""
+
+    GLOBAL = "global"
+    GUILD = "guild"
+    USER = "user"
+
+
+class CacheStats:
+    __slots__ = ("hits", "misses", "evictions", "invalidations")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_ratio": self.hit_ratio,
+        }
+
+    def __repr__(self) -> str:
+        return f"<CacheStats hits={self.hits} misses={self.misses} evictions={self.evictions}>"
+
+
+def _options_key(options: list, path: List[str]) -> Tuple[Tuple[str, Hashable], ...]:
+    for option in options:
+        if option.type in _NESTED:
+            path.append(option.name)
+            return _options_key(option.options, path)
+
+    # raw payload values: ids stay snowflakes instead of resolved objects
+    return tuple(sorted((option.name, dict.get(option, "value")) for option in options))
+
+
+def command_key(interaction: Interaction, scope: CacheScope) -> CacheKey:
+    """Identify an invocation by command path, option values and ``scope``."""
+    data: Any = interaction.data
+    path = [data.name]
+    options = _options_key(data.options, path)
+
+    guild_id = interaction.guild_id if scope is CacheScope.GUILD else None
+    user_id = interaction.author.id if scope is CacheScope.USER else None
+    return tuple(path), options, guild_id, user_id
+
+
+class ResponseCache:
+    """LRU cache with TTL for responses of idempotent slash commands.
+
+    The handler runs once per key; its response (content and embeds) is stored
+    and replayed to later interactions without opening a scope or resolving
+    any dependency.
+
+    Parameters
+    ----------
+    ttl: :class:`float`
+        How long a response stays valid, in seconds.
+    scope: Union[:class:`CacheScope`, :class:`str`]
+        ``global`` shares the response everywhere, ``guild`` per guild,
+        ``user`` per invoking user. Defaults to ``global``.
+    maxsize: :class:`int`
+        Maximum number of stored responses. Least recently used entries are evicted first.
+
+    Example
+    -------
+    .. code-block:: python
+
+        leaderboard_cache = ResponseCache(ttl=30, scope="guild")
+
+        @slash_command(cache=leaderboard_cache)
+        async def leaderboard(self, inter: AppCmdInter, repo: FromDishka[ScoreRepo]): ...
+
+        # somewhere else, after scores changed
+        leaderboard_cache.invalidate(guild_id=inter.guild_id)
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        *,
+        scope: Union[CacheScope, str] = CacheScope.GLOBAL,
+        maxsize: int = 1024,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.ttl = ttl
+        self.scope = CacheScope(scope)
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[CacheKey, Tuple[float, RecordedResponse]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key_for(self, interaction: Interaction) -> CacheKey:
+        return command_key(interaction, self.scope)
+
+    def get(self, key: CacheKey) -> Optional[RecordedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return response
+
+    def set(self, key: CacheKey, response: RecordedResponse) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(
+        self,
+        command: Optional[str] = None,
+        *,
+        guild_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+    ) -> int:
+        """Drop matching entries and return how many were removed.
+
+        ``command`` is a qualified name (``"event status"``) or its prefix (``"event"``).
+        Without arguments the whole cache is cleared.
+        """
+        prefix = tuple(command.split()) if command else ()
+
+        stale = [
+            key
+            for key in self._entries
+            if key[0][: len(prefix)] == prefix
+            and (guild_id is None or key[2] == guild_id)
+            and (user_id is None or key[3] == user_id)
+        ]
+        for key in stale:
+            del self._entries[key]
+
+        self.stats.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def wrap(
+        self,
+        func: Callable[..., Coroutine[Any, Any, R]],
+    ) -> Callable[..., Coroutine[Any, Any, Optional[R]]]:
+        """Wrap an injected callback so cache hits skip it entirely."""
+        handler = func.__qualname__
+
+        @wraps(func)
+        async def cached_wrapper(*args, **kwargs):
+            interaction = find_interaction(args, kwargs)
+            if interaction is None:
+                return await func(*args, **kwargs)
+
+            key = self.key_for(interaction)
+            response = self.get(key)
+            if response is not None:
+                await response.replay(interaction)
+                metrics: Optional["Metrics"] = State.metrics
+                if metrics is not None:
+                    metrics.replayed(handler, args, kwargs, "cached")
+                return None
+
+            recorder = RecordingInteraction(interaction)
+            args, kwargs = replace_interaction(args, kwargs, interaction, recorder)
+            result = await func(*args, **kwargs)
+
+            if recorder.replayable and recorder.recorded is not None:
+                self.set(key, recorder.recorded)
+            return result
+
+        return cached_wrapper
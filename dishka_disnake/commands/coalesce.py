@@ -0,0 +1,124 @@
+import asyncio
+
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Optional, TypeVar, Union
+
+from dishka_disnake.base.interaction import find_interaction, replace_interaction
+from dishka_disnake.commands.cache import CacheKey, CacheScope, command_key
+from dishka_disnake.commands.recording import RecordedResponse, RecordingInteraction
+from dishka_disnake.state_management import State
+
+if TYPE_CHECKING:
+    from dishka_disnake.metrics import Metrics
+
+
+__all__ = ("Coalescer", "CoalesceStats")
+
+R = TypeVar("R")
+
+
+class CoalesceStats:
+    __slots__ = ("executions", "coalesced")
+
+    def __init__(self) -> None:
+        self.executions = 0
+        self.coalesced = 0
+
+    def as_dict(self) -> dict:
+        return {"executions": self.executions, "coalesced": self.coalesced}
+
+    def __repr__(self) -> str:
+        return f"<CoalesceStats executions={self.executions} coalesced={self.coalesced}>"
+
+
+class Coalescer:
+    """Single-flight execution of identical concurrent invocations.
+
+    While an invocation is running, identical ones (same command path,
+    options and ``scope``) don't run the handler: they wait for it and
+    reply with the same message. Nothing is kept once the handler returns,
+    so responses are never stale.
+
+    If the handler raises, every waiting invocation raises the same exception.
+    If its response can't be replayed (files, views, several messages),
+    waiting invocations run the handler themselves.
+
+    Parameters
+    ----------
+    scope: Union[:class:`CacheScope`, :class:`str`]
+        Who shares an in-flight execution. Defaults to ``global``.
+    """
+
+    def __init__(self, *, scope: Union[CacheScope, str] = CacheScope.GLOBAL) -> None:
+        self.scope = CacheScope(scope)
+        self.stats = CoalesceStats()
+        self._inflight: Dict[CacheKey, "asyncio.Future[Optional[RecordedResponse]]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def wrap(
+        self,
+        func: Callable[..., Coroutine[Any, Any, R]],
+    ) -> Callable[..., Coroutine[Any, Any, Optional[R]]]:
+        """Wrap an injected callback so overlapping identical calls share one execution."""
+        handler = func.__qualname__
+
+        @wraps(func)
+        async def coalescing_wrapper(*args, **kwargs):
+            interaction = find_interaction(args, kwargs)
+            if interaction is None:
+                return await func(*args, **kwargs)
+
+            key = command_key(interaction, self.scope)
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self.stats.coalesced += 1
+                # shield: a cancelled follower must not cancel the shared future
+                response = await asyncio.shield(inflight)
+                if response is not None:
+                    await response.replay(interaction)
+                    metrics: Optional["Metrics"] = State.metrics
+                    if metrics is not None:
+                        metrics.replayed(handler, args, kwargs, "coalesced")
+                    return None
+                return await func(*args, **kwargs)
+
+            future: "asyncio.Future[Optional[RecordedResponse]]" = (
+                asyncio.get_running_loop().create_future()
+            )
+            self._inflight[key] = future
+            self.stats.executions += 1
+
+            recorder = RecordingInteraction(interaction)
+            args, kwargs = replace_interaction(args, kwargs, interaction, recorder)
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as exc:
+                future.set_exception(exc)
+                # mark as retrieved, nobody may be waiting
+                future.exception()
+                raise
+            except BaseException:
+                future.set_result(None)
+                raise
+            else:
+                future.set_result(recorder.recorded if recorder.replayable else None)
+                return result
+            finally:
+                del self._inflight[key]
+
+        return coalescing_wrapper
+
+
+def as_coalescer(value: Union[bool, Coalescer, None]) -> Optional[Coalescer]:
+    """
+    Normalize the ``coalesce=`` option of command decorators. ``True`` creates
+    a :class:`Coalescer` per decorated command: keys include the command path,
+    so a shared one would coalesce the same calls, only its stats differ.
+    """
+    if value is True:
+        return Coalescer()
+    if value is False or value is None:
+        return None
+    return value
@@ -0,0 +1,132 @@
+import asyncio
+import inspect
+import logging
+import sys
+
+from typing import Any, Dict, Tuple
+
+from dishka import AsyncContainer
+from disnake.ext import commands
+
+from dishka_disnake.injector import extract_fromdishka
+from dishka_disnake.state_management import State
+
+
+__all__ = ("Cog",)
+
+_log = logging.getLogger(__name__)
+
+
+def _evaluate(annotation: Any, owner: type) -> Any:
+    if not isinstance(annotation, str):
+        return annotation
+
+    module = sys.modules.get(owner.__module__)
+    try:
+        return eval(annotation, vars(module) if module else {}, dict(vars(owner)))
+    except Exception:
+        # names only available under TYPE_CHECKING can't be dependencies anyway
+        return None
+
+
+class Cog(commands.Cog):
+    """A cog whose dependencies are resolved once, when the cog is loaded.
+
+    Dependencies are declared as ``FromDishka[...]`` class annotations and
+    resolved from the APP scope of the container, so handlers can use them as
+    plain attributes without any per-call cost. Only request-scoped dependencies
+    are left for the handler parameters.
+
+    disnake runs :meth:`cog_load` in a task it doesn't wait for, so application
+    commands of the cog wait for the resolution in their before-invoke hooks,
+    and fail with its error if it failed. Listeners and components can
+    ``await self.wait_until_ready()`` for the same.
+
+    The attributes are dropped in :meth:`cog_unload`. Subclasses overriding
+    :meth:`cog_load`, :meth:`cog_unload` or the ``cog_before_*_invoke`` hooks
+    must call ``super()``.
+
+    Example
+    -------
+    .. code-block:: python
+
+        class UsersCog(Cog):
+            repo: FromDishka[UserRepo]
+            http: FromDishka[ClientSession]
+
+            @slash_command()
+            async def profile(self, inter: AppCmdInter, session: FromDishka[DbSession]):
+                user = await self.repo.get(inter.author.id)
+    """
+
+    __dishka_dependencies__: Tuple[Tuple[str, Any], ...]
+
+    @classmethod
+    def _dishka_dependencies(cls) -> Tuple[Tuple[str, Any], ...]:
+        # annotations are evaluated lazily: the class may reference names
+        # that didn't exist yet when it was created
+        deps = cls.__dict__.get("__dishka_dependencies__")
+        if deps is None:
+            found: Dict[str, Any] = {}
+            for klass in reversed(cls.__mro__):
+                if not issubclass(klass, Cog) or klass is Cog:
+                    continue
+
+                for name, annotation in inspect.get_annotations(klass).items():
+                    annotation = _evaluate(annotation, klass)
+                    dep_type = extract_fromdishka(annotation)
+                    if dep_type is not None:
+                        found[name] = dep_type
+
+            deps = tuple(found.items())
+            cls.__dishka_dependencies__ = deps
+        return deps
+
+    def _dishka_ready(self) -> "asyncio.Future[None]":
+        ready = self.__dict__.get("_dishka_ready_future")
+        if ready is None:
+            ready = asyncio.get_running_loop().create_future()
+            self.__dict__["_dishka_ready_future"] = ready
+        return ready
+
+    async def wait_until_ready(self) -> None:
+        """Wait until the dependencies are resolved, raising the error if that failed."""
+        ready = self._dishka_ready()
+        if ready.done():
+            ready.result()
+        else:
+            await asyncio.shield(ready)
+
+    async def cog_load(self) -> None:
+        ready = self._dishka_ready()
+        try:
+            container: AsyncContainer | None = State.container
+            if container is None:
+                raise RuntimeError("Container is not initialized, setup dishka first")
+
+            for name, dep_type in self._dishka_dependencies():
+                setattr(self, name, await container.get(dep_type))
+        except Exception as exc:
+            # nobody awaits this task, the commands of the cog raise it instead
+            _log.exception("Failed to resolve the dependencies of %s", type(self).__qualname__)
+            if not ready.done():
+                ready.set_exception(exc)
+                ready.exception()
+            return
+
+        if not ready.done():
+            ready.set_result(None)
+
+    def cog_unload(self) -> None:
+        self.__dict__.pop("_dishka_ready_future", None)
+        for name, _ in self._dishka_dependencies():
+            self.__dict__.pop(name, None)
+
+    async def cog_before_slash_command_invoke(self, inter: Any) -> None:
+        await self.wait_until_ready()
+
+    async def cog_before_user_command_invoke(self, inter: Any) -> None:
+        await self.wait_until_ready()
+
+    async def cog_before_message_command_invoke(self, inter: Any) -> None:
+        await self.wait_until_ready()
@@ -10,6 +10,7 @@ from disnake.ext.commands.ctx_menus_core import (
     InvokableUserCommand,
 )
 
+from dishka_disnake.admission import Priority
 from dishka_disnake.injector.wrap import wrap_injector
 
 if TYPE_CHECKING:
@@ -37,6 +38,7 @@ def user_command(
     guild_ids: Optional[Sequence[int]] = None,
     auto_sync: Optional[bool] = None,
     extras: Optional[Dict[str, Any]] = None,
+    priority: Priority = Priority.NORMAL,
     **kwargs: Any,
 ) -> Callable[
     [InteractionCommandCallback[CogT, UserCommandInteraction, P]], InvokableUserCommand
@@ -101,6 +103,10 @@ def user_command(
 
         .. versionadded:: 2.5
 
+    priority: :class:`.Priority`
+        How the command is admitted while the bot is overloaded,
+        see :class:`.AdmissionController`.
+
     Returns
     -------
     Callable[..., :class:`InvokableUserCommand`]
@@ -110,7 +116,7 @@ def user_command(
     def decorator(
         func: InteractionCommandCallback[CogT, UserCommandInteraction, P],
     ) -> InvokableUserCommand:
-        func = wrap_injector(func)
+        func = wrap_injector(func, priority=priority)
         return commands.user_command(
             name=name,
             dm_permission=dm_permission,
@@ -138,6 +144,7 @@ def message_command(
     guild_ids: Optional[Sequence[int]] = None,
     auto_sync: Optional[bool] = None,
     extras: Optional[Dict[str, Any]] = None,
+    priority: Priority = Priority.NORMAL,
     **kwargs: Any,
 ) -> Callable[
     [InteractionCommandCallback[CogT, MessageCommandInteraction, P]],
@@ -203,6 +210,10 @@ def message_command(
 
         .. versionadded:: 2.5
 
+    priority: :class:`.Priority`
+        How the command is admitted while the bot is overloaded,
+        see :class:`.AdmissionController`.
+
     Returns
     -------
     Callable[..., :class:`InvokableMessageCommand`]
@@ -212,7 +223,7 @@ def message_command(
     def decorator(
         func: InteractionCommandCallback[CogT, MessageCommandInteraction, P],
     ) -> InvokableMessageCommand:
-        func = wrap_injector(func)
+        func = wrap_injector(func, priority=priority)
         return commands.message_command(
             name=name,
             dm_permission=dm_permission,
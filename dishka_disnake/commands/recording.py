@@ -0,0 +1,188 @@
+from functools import wraps
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+
+from disnake import AllowedMentions, Embed, Interaction, MessageFlags
+from disnake.utils import MISSING
+
+
+__all__ = ("RecordedResponse", "RecordingInteraction")
+
+
+# keyword arguments of `send`/`send_message` that can't be replayed safely
+_UNREPLAYABLE = ("file", "files", "view", "components", "poll", "delete_after")
+
+
+class RecordedResponse:
+    """A message sent by a handler, detached from its interaction."""
+
+    __slots__ = ("content", "embeds", "ephemeral", "tts", "allowed_mentions", "suppress_embeds", "flags")
+
+    def __init__(
+        self,
+        content: Optional[str] = None,
+        embeds: Optional[List[Embed]] = None,
+        ephemeral: bool = False,
+        tts: bool = False,
+        allowed_mentions: Optional[AllowedMentions] = None,
+        suppress_embeds: Optional[bool] = None,
+        flags: Optional[MessageFlags] = None,
+    ) -> None:
+        self.content = content
+        self.embeds = embeds or []
+        self.ephemeral = ephemeral
+        self.tts = tts
+        self.allowed_mentions = allowed_mentions
+        self.suppress_embeds = suppress_embeds
+        self.flags = flags
+
+    async def replay(self, interaction: Interaction) -> None:
+        """Send the recorded message as the response to ``interaction``."""
+        kwargs: Dict[str, Any] = {}
+        # left out when not recorded, so the bot's defaults apply as they did the first time
+        if self.allowed_mentions is not None:
+            kwargs["allowed_mentions"] = self.allowed_mentions
+        if self.suppress_embeds is not None:
+            kwargs["suppress_embeds"] = self.suppress_embeds
+        if self.flags is not None:
+            kwargs["flags"] = MessageFlags._from_value(self.flags.value)
+        await interaction.send(
+            content=self.content,
+            embeds=[embed.copy() for embed in self.embeds],
+            ephemeral=self.ephemeral,
+            tts=self.tts,
+            **kwargs,
+        )
+
+
+# methods that send, edit or delete messages other than the recorded one,
+# by the attribute of the interaction they are called on
+_INTERACTION_METHODS = frozenset((
+    "edit_original_response",
+    "edit_original_message",
+    "delete_original_response",
+    "delete_original_message",
+))
+_RESPONSE_METHODS = frozenset(("defer", "edit_message", "send_modal", "autocomplete"))
+_PROXIED_METHODS = {
+    "followup": frozenset(("send", "edit_message", "delete_message")),
+    "channel": frozenset(("send",)),
+}
+
+
+def _discarding(recorder: "RecordingInteraction", method: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(method)
+    def discarding_method(*args: Any, **kwargs: Any) -> Any:
+        recorder.discard()
+        return method(*args, **kwargs)
+
+    return discarding_method
+
+
+class _DiscardingProxy:
+    """Proxy of ``followup`` or ``channel`` discarding the recording when a message is sent through it."""
+
+    def __init__(self, recorder: "RecordingInteraction", target: Any, methods: FrozenSet[str]) -> None:
+        self._recorder = recorder
+        self._target = target
+        self._methods = methods
+
+    def __getattr__(self, item: str) -> Any:
+        value = getattr(self._target, item)
+        if item in self._methods:
+            return _discarding(self._recorder, value)
+        return value
+
+
+class _RecordingResponse:
+    def __init__(self, recorder: "RecordingInteraction") -> None:
+        self._recorder = recorder
+        self._response = recorder.interaction.response
+
+    def __getattr__(self, item: str) -> Any:
+        value = getattr(self._response, item)
+        if item in _RESPONSE_METHODS:
+            return _discarding(self._recorder, value)
+        return value
+
+    async def send_message(self, content: Optional[str] = None, **kwargs: Any) -> None:
+        self._recorder.record(content, kwargs)
+        await self._response.send_message(content, **kwargs)
+
+
+class RecordingInteraction:
+    """
+    Proxy around an interaction that remembers the first message sent through
+    ``send`` or ``response.send_message``.
+
+    Everything else is delegated to the wrapped interaction. Deferring, editing
+    or deleting the response, or sending more messages (``followup``, ``channel``)
+    makes the response unreplayable: what was recorded isn't what users saw.
+    """
+
+    def __init__(self, interaction: Interaction) -> None:
+        self.interaction = interaction
+        self.recorded: Optional[RecordedResponse] = None
+        self.replayable = True
+        self._sent = False
+
+    def __getattr__(self, item: str) -> Any:
+        value = getattr(self.interaction, item)
+        if item in _INTERACTION_METHODS:
+            return _discarding(self, value)
+        methods = _PROXIED_METHODS.get(item)
+        if methods is not None:
+            return _DiscardingProxy(self, value, methods)
+        return value
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:  # keeps `isinstance(inter, Interaction)` working
+        return self.interaction.__class__  # the wrapped one may be a recorder too
+
+    @property
+    def response(self) -> _RecordingResponse:
+        return _RecordingResponse(self)
+
+    async def send(self, content: Optional[str] = None, **kwargs: Any) -> None:
+        self.record(content, kwargs)
+        await self.interaction.send(content, **kwargs)
+
+    def discard(self) -> None:
+        """Don't replay anything: the response isn't a single unchanged message."""
+        self.replayable = False
+        self.recorded = None
+
+    def record(self, content: Optional[str], kwargs: dict) -> None:
+        if self._sent:
+            # only single-message responses are replayed
+            self.discard()
+            return
+        self._sent = True
+        if not self.replayable:
+            return
+
+        if any(kwargs.get(name, MISSING) is not MISSING for name in _UNREPLAYABLE):
+            self.replayable = False
+            return
+
+        embeds = kwargs.get("embeds", MISSING)
+        embed = kwargs.get("embed", MISSING)
+        if embeds is MISSING:
+            embeds = [] if embed is MISSING else [embed]
+
+        ephemeral = kwargs.get("ephemeral", MISSING)
+        suppress_embeds = _given(kwargs, "suppress_embeds")
+        flags = _given(kwargs, "flags")
+        self.recorded = RecordedResponse(
+            content=content,
+            embeds=[e.copy() for e in embeds],
+            ephemeral=bool(ephemeral) if ephemeral is not MISSING else False,
+            tts=bool(kwargs.get("tts", False)),
+            allowed_mentions=_given(kwargs, "allowed_mentions"),
+            suppress_embeds=bool(suppress_embeds) if suppress_embeds is not None else None,
+            flags=MessageFlags._from_value(flags.value) if flags is not None else None,
+        )
+
+
+def _given(kwargs: dict, name: str) -> Any:
+    value = kwargs.get(name, MISSING)
+    return None if value is MISSING else value
@@ -20,7 +20,10 @@ if TYPE_CHECKING:
 
     from disnake.ext.commands.base_core import CommandCallback
 
+from dishka_disnake.admission import Priority
 from dishka_disnake.injector.wrap import wrap_injector
+from dishka_disnake.commands.cache import ResponseCache
+from dishka_disnake.commands.coalesce import Coalescer, as_coalescer
 
 
 class SubCommandGroup(OriginalSubCommandGroup):
@@ -31,6 +34,9 @@ class SubCommandGroup(OriginalSubCommandGroup):
         options: Optional[list] = None,
         connectors: Optional[dict] = None,
         extras: Optional[Dict[str, Any]] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: Union[bool, Coalescer] = False,
+        priority: Priority = Priority.NORMAL,
         **kwargs: Any,
     ) -> Callable[[CommandCallback], SubCommand]:
         """A decorator that creates a subcommand in the subcommand group.
@@ -43,7 +49,9 @@ class SubCommandGroup(OriginalSubCommandGroup):
         """
 
         def decorator(func: Callable) -> SubCommand:
-            func = wrap_injector(func)
+            func = wrap_injector(
+                func, cache=cache, coalesce=as_coalescer(coalesce), priority=priority
+            )
             new_func = SubCommand(
                 func,
                 self,
@@ -69,6 +77,9 @@ class InvokableSlashCommand(OriginalInvokableSlashCommand):
         options: Optional[list] = None,
         connectors: Optional[dict] = None,
         extras: Optional[Dict[str, Any]] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: Union[bool, Coalescer] = False,
+        priority: Priority = Priority.NORMAL,
         **kwargs: Any,
     ) -> Callable[[CommandCallback], SubCommand]:
         """A decorator that creates a subcommand under the base command.
@@ -102,6 +113,17 @@ class InvokableSlashCommand(OriginalInvokableSlashCommand):
 
             .. versionadded:: 2.5
 
+        cache: Optional[:class:`.ResponseCache`]
+            Cache the response of this subcommand. Cache hits are answered
+            without resolving any dependency.
+        coalesce: Union[:class:`bool`, :class:`.Coalescer`]
+            Share one execution between identical concurrent invocations.
+            ``True`` uses a new :class:`.Coalescer` with global scope,
+            of this subcommand only.
+        priority: :class:`.Priority`
+            How the subcommand is admitted while the bot is overloaded,
+            see :class:`.AdmissionController`.
+
         Returns
         -------
         Callable[..., :class:`SubCommand`]
@@ -109,7 +131,9 @@ class InvokableSlashCommand(OriginalInvokableSlashCommand):
         """
 
         def decorator(func: Callable) -> SubCommand:
-            func = wrap_injector(func)
+            func = wrap_injector(
+                func, cache=cache, coalesce=as_coalescer(coalesce), priority=priority
+            )
             if len(self.children) == 0 and len(self.body.options) > 0:
                 self.body.options = []
             new_func = SubCommand(
@@ -189,6 +213,9 @@ def slash_command(
     connectors: Optional[Dict[str, str]] = None,
     auto_sync: Optional[bool] = None,
     extras: Optional[Dict[str, Any]] = None,
+    cache: Optional[ResponseCache] = None,
+    coalesce: Union[bool, Coalescer] = False,
+    priority: Priority = Priority.NORMAL,
     **kwargs: Any,
 ) -> Callable[[CommandCallback], InvokableSlashCommand]:
     """A decorator that builds a slash command.
@@ -266,6 +293,20 @@ def slash_command(
 
         .. versionadded:: 2.5
 
+    cache: Optional[:class:`.ResponseCache`]
+        Cache the response of this command. Cache hits are answered
+        without resolving any dependency. For commands with subcommands,
+        pass it to ``sub_command`` instead.
+    coalesce: Union[:class:`bool`, :class:`.Coalescer`]
+        Share one execution between identical concurrent invocations:
+        only one runs the handler, the others reply with its response.
+        ``True`` uses a new :class:`.Coalescer` with global scope, of this
+        command only; pass the same instance to share its stats between commands.
+    priority: :class:`.Priority`
+        How the command is admitted while the bot is overloaded:
+        ``CRITICAL`` commands always run, ``LOW`` ones are answered with a busy
+        message first. See :class:`.AdmissionController`.
+
     Returns
     -------
     Callable[..., :class:`InvokableSlashCommand`]
@@ -273,7 +314,9 @@ def slash_command(
     """
 
     def decorator(func: CommandCallback) -> InvokableSlashCommand:
-        func = wrap_injector(func)
+        func = wrap_injector(
+            func, cache=cache, coalesce=as_coalescer(coalesce), priority=priority
+        )
         if not utils.iscoroutinefunction(func):
             raise TypeError(f"<{func.__qualname__}> must be a coroutine function")
         if hasattr(func, "__command_flag__"):
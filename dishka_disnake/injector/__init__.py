@@ -1,29 +1,62 @@
 import inspect
+import time
+import weakref
 
 from typing import (
+    TYPE_CHECKING,
     Callable,
     TypeVar,
     ParamSpec,
     Coroutine,
     Any,
     Annotated,
+    Awaitable,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
     get_origin,
     get_args,
 )
 
-from functools import wraps
+from functools import partial, wraps
 
 from dishka import AsyncContainer, FromDishka
 
 from dishka_disnake.state_management import State
-from dishka_disnake.base.checkers import is_dependency
+from dishka_disnake.state_management.router import ContainerRouter
+from dishka_disnake.base.checkers import is_dependency, type_name
+from dishka_disnake.base.interaction import find_interaction
+from dishka_disnake.breaker import CircuitBreaker
+from dishka_disnake.tracing import handler_attributes, traced
+from dishka_disnake.injector.timeouts import DependencyTimeoutError, get_within
+from dishka_disnake.injector.cached import (
+    Cached,
+    CachedDependency,
+    DependencyCache,
+    extract_cached,
+)
+
+if TYPE_CHECKING:
+    from dishka_disnake.metrics import HandlerMetrics, Metrics
+    from dishka_disnake.profiling.sampling import HandlerSampler
+    from dishka_disnake.shutdown import ShutdownCoordinator
+    from dishka_disnake.tracing import Span, Tracer
+    from dishka_disnake.watchdog import Watchdog
 
 
-__all__ = ["inject", "inject_loose"]
+__all__ = ["inject", "inject_loose", "Cached", "DependencyCache", "DependencyTimeoutError"]
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
+_NOT_SET = object()
+
+# every injected callback, used to validate and warm up the container
+_handlers: "weakref.WeakSet[Callable[..., Any]]" = weakref.WeakSet()
+
 
 def extract_fromdishka(annotation):
     origin = get_origin(annotation)
@@ -40,45 +73,313 @@ def extract_fromdishka(annotation):
     return None
 
 
+class Dependency(NamedTuple):
+    name: str
+    type: Any
+    cached: Optional[CachedDependency] = None
+
+
+def build_plan(
+    func: Callable,
+    signature: Optional[inspect.Signature] = None,
+) -> Tuple[Dependency, ...]:
+    """
+    Collect the parameters of ``func`` that are resolved from the container.
+    """
+    plan = []
+
+    if signature is None:
+        signature = inspect.signature(func)
+
+    params = signature.parameters.items()
+    for name, param in params:
+        annotation = param.annotation
+        if annotation is inspect.Parameter.empty:
+            continue
+
+        dep_type = extract_fromdishka(annotation)
+        if dep_type is None:
+            if not is_dependency(annotation):
+                continue
+            dep_type = annotation
+
+        plan.append(Dependency(name, dep_type, extract_cached(annotation)))
+
+    return tuple(plan)
+
+
+def _in_module(handler: Callable[..., Any], module: str) -> bool:
+    name = handler.__module__ or ""
+    return name == module or name.startswith(module + ".")
+
+
+def iter_handlers(
+    module: Optional[str] = None,
+) -> Iterator[Tuple[Callable[..., Any], Tuple[Dependency, ...]]]:
+    """
+    Iterate over alive injected callbacks and their resolution plans,
+    optionally only those defined in ``module`` and its submodules.
+    """
+    for handler in list(_handlers):
+        if module is None or _in_module(handler, module):
+            yield handler, handler.__dishka_plan__  # type: ignore[attr-defined]
+
+
+def forget_handlers(module: str) -> int:
+    """
+    Stop tracking callbacks of ``module`` and its submodules,
+    e.g. when its extension is unloaded.
+    """
+    handlers = [handler for handler in list(_handlers) if _in_module(handler, module)]
+    for handler in handlers:
+        _handlers.discard(handler)
+    return len(handlers)
+
+
+def track_handlers(handlers: Iterable[Callable[..., Any]]) -> None:
+    """
+    Track callbacks again after :func:`forget_handlers`,
+    e.g. when a failed reload puts their extension back.
+    """
+    _handlers.update(handlers)
+
+
+async def _resolve(
+    plan: Tuple[Dependency, ...],
+    container: AsyncContainer,
+    scope: AsyncContainer,
+    kwargs: Dict[str, Any],
+    timeout: Optional[float] = None,
+    handler: Optional[str] = None,
+    span: Optional["Span"] = None,
+) -> Dict[str, Any]:
+    breakers: Optional[Dict[Any, CircuitBreaker]] = State.breakers
+    timeouts: Optional[Dict[Any, Optional[float]]] = State.dependency_timeouts
+    for name, dep_type, cached in plan:
+        if name in kwargs:
+            continue
+
+        if cached is not None:
+            dependency_cache: DependencyCache = State.dependency_cache
+            get: Callable[[Any], Awaitable[Any]] = partial(
+                dependency_cache.get, container, ttl=cached.ttl
+            )
+        else:
+            get = scope.get
+
+        limit = timeouts.get(dep_type, timeout) if timeouts else timeout
+        if limit is not None:
+            get = partial(get_within, get, timeout=limit, handler=handler)
+
+        breaker = breakers.get(dep_type) if breakers else None
+        try:
+            value = breaker.call(dep_type, get) if breaker is not None else get(dep_type)
+            if span is not None:
+                value = traced(
+                    State.tracer, span, "dishka.resolve", {"dishka.dependency": type_name(dep_type)}, value
+                )
+            kwargs[name] = await value
+        except Exception:
+            metrics: Optional["Metrics"] = State.metrics
+            if metrics is not None:
+                metrics.resolution_failed(dep_type)
+            raise
+
+    return kwargs
+
+
+def _split_checks(func: Callable[..., Any]) -> Tuple[Tuple[Any, ...], Tuple[Any, ...]]:
+    # declared with @check, cheapest first: the ones without dependencies
+    # run before a scope is opened
+    checks = sorted(getattr(func, "__dishka_checks__", ()), key=lambda c: c.cost)
+    return (
+        tuple(c for c in checks if not c.plan),
+        tuple(c for c in checks if c.plan),
+    )
+
+
+def _handler_timeout(func: Callable[..., Any]) -> Tuple[bool, Optional[float]]:
+    # set with @resolve_timeout, `None` there disables the default of setup_dishka
+    timeout = getattr(func, "__dishka_timeout__", _NOT_SET)
+    if timeout is _NOT_SET:
+        return False, None
+    return True, timeout
+
+
+def _select_container(interaction: Any) -> AsyncContainer:
+    container: AsyncContainer | None = State.container
+
+    router: ContainerRouter | None = State.container_router
+    if router is not None and interaction is not None:
+        container = router.get(interaction)
+
+    if container is None:
+        raise RuntimeError("Container is not initialized, setup dishka first")
+    return container
+
+
+def guard_checks(
+    func: Callable[..., Coroutine[Any, Any, R]],
+    checks_of: Callable[..., Any],
+) -> Callable[..., Coroutine[Any, Any, R]]:
+    """
+    Run the checks declared on ``checks_of`` before calling ``func``,
+    for wrappers (response cache, coalescing) that may skip the injected call.
+    Checks with dependencies get their own scope, closed before ``func``
+    runs, so request dependencies are not shared with the handler.
+    """
+    free_checks, scoped_checks = _split_checks(checks_of)
+    if not free_checks and not scoped_checks:
+        return func
+
+    has_timeout, handler_timeout = _handler_timeout(checks_of)
+    handler = checks_of.__qualname__
+
+    @wraps(func)
+    async def checking_wrapper(*args, **kwargs):
+        interaction = find_interaction(args, kwargs)
+        for free_check in free_checks:
+            await free_check.run(interaction, {})
+
+        if scoped_checks:
+            container = _select_container(interaction)
+            timeout = handler_timeout if has_timeout else State.resolve_timeout
+            async with container() as c:
+                for scoped_check in scoped_checks:
+                    await scoped_check.run(
+                        interaction,
+                        await _resolve(scoped_check.plan, container, c, {}, timeout, handler),
+                    )
+
+        return await func(*args, **kwargs)
+
+    return checking_wrapper
+
+
 def inject(
     func: Callable[P, Coroutine[Any, Any, R]],
+    *,
+    signature: Optional[inspect.Signature] = None,
+    run_checks: bool = True,
 ) -> Callable[P, Coroutine[Any, Any, R]]:
     """
     decorator: accepts any async function (arguments not strict),
     but preserves the return type R.
+    `signature` is the already computed signature of `func`, if any.
+    With `run_checks`, checks declared with `@check` run first, sharing the scope with `func`.
+    Resolving a dependency longer than its timeout (`@resolve_timeout`, or `setup_dishka`)
+    closes the scope and raises `DependencyTimeoutError`.
+    Invocations sampled by the `HandlerSampler` passed to `setup_dishka` run under a profiler;
+    with its `Metrics`, every invocation is counted and timed, and with its `Tracer`
+    the scope, every resolution and the call of `func` get spans. Its `Watchdog` tracks the scope
+    while it is open, and its `ShutdownCoordinator` tracks the call and rejects it once draining.
     """
     if not inspect.iscoroutinefunction(func):
         raise TypeError(
             f"@inject can be applied only to async functions: {func.__name__}"
         )
 
+    plan = build_plan(func, signature)
+
+    free_checks, scoped_checks = _split_checks(func) if run_checks else ((), ())
+    needs_interaction = bool(free_checks or scoped_checks)
+    has_timeout, handler_timeout = _handler_timeout(func)
+    handler = func.__qualname__
+
     @wraps(func)
     async def async_wrapper(*args, **kwargs):
-        container: AsyncContainer | None = State.container
-        sig = inspect.signature(func)
+        sampler: Optional["HandlerSampler"] = State.sampler
+        if sampler is not None:
+            mode = sampler.sampled(handler)
+            if mode is not None:
+                # the same call again, under the profiler; nested calls aren't sampled
+                return await sampler.run(handler, mode, async_wrapper(*args, **kwargs))
+
+        shutdown: Optional["ShutdownCoordinator"] = State.shutdown
+        invocation = None
+        if shutdown is not None:
+            if not shutdown.admits():
+                await shutdown.reject(find_interaction(args, kwargs))
+                return None
+            invocation = shutdown.enter()
+
+        series: Optional["HandlerMetrics"] = None
+        metrics: Optional["Metrics"] = State.metrics
+        if metrics is not None:
+            series = metrics.handler(handler, args, kwargs)
+            series.invocations.value += 1
+            started = time.perf_counter()
+
+        tracer: Optional["Tracer"] = State.tracer
+        root: Optional["Span"] = None
+        if tracer is not None:
+            root = tracer.start_span(
+                "dishka.interaction", handler_attributes(handler, find_interaction(args, kwargs))
+            )
 
-        if container is None:
-            raise RuntimeError("Container is not initialized, setup dishka first")
+        try:
+            interaction = None
+            if needs_interaction or State.container_router is not None:
+                interaction = find_interaction(args, kwargs)
+            container = _select_container(interaction)
 
-        async with container() as c:
-            params = sig.parameters.items()
-            for name, param in params:
-                if name in kwargs or param.annotation is inspect._empty:
-                    continue
+            for free_check in free_checks:
+                await free_check.run(interaction, {})
 
-                annotation = param.annotation
+            timeout = handler_timeout if has_timeout else State.resolve_timeout
+            scope_span: Optional["Span"] = None
+            if tracer is not None:
+                scope_span = tracer.start_span("dishka.scope", {"dishka.handler": handler}, root)
+            watchdog: Optional["Watchdog"] = State.watchdog
+            open_scope = watchdog.enter(handler) if watchdog is not None else None
 
-                dep_type = extract_fromdishka(annotation)
-                if dep_type is not None:
-                    kwargs[name] = await c.get(dep_type)
-                    continue
+            try:
+                async with container() as c:
+                    if series is not None:
+                        series.scopes.value += 1
 
-                if is_dependency(annotation):
-                    kwargs[name] = await c.get(annotation)
-                    continue
+                    for scoped_check in scoped_checks:
+                        await scoped_check.run(
+                            interaction,
+                            await _resolve(
+                                scoped_check.plan, container, c, {}, timeout, handler, scope_span
+                            ),
+                        )
 
-            return await func(*args, **kwargs)
+                    await _resolve(plan, container, c, kwargs, timeout, handler, scope_span)
+                    if scope_span is None:
+                        return await func(*args, **kwargs)
+                    return await traced(
+                        tracer, scope_span, "dishka.handler", {"dishka.handler": handler},
+                        func(*args, **kwargs),
+                    )
+            except BaseException as exc:
+                if scope_span is not None:
+                    scope_span.end(exc)
+                    scope_span = None
+                raise
+            finally:
+                if scope_span is not None:
+                    scope_span.end()
+                if open_scope is not None:
+                    watchdog.exit(open_scope)
+        except BaseException as exc:
+            if series is not None and isinstance(exc, Exception):
+                series.errors.value += 1
+            if root is not None:
+                root.end(exc)
+                root = None
+            raise
+        finally:
+            if series is not None:
+                series.duration.observe(time.perf_counter() - started)
+            if root is not None:
+                root.end()
+            if invocation is not None:
+                shutdown.exit(invocation)
 
+    async_wrapper.__dishka_plan__ = plan  # type: ignore[attr-defined]
+    _handlers.add(async_wrapper)
     return async_wrapper
 
 
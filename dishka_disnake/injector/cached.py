@@ -0,0 +1,174 @@
+import asyncio
+import time
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Annotated, Any, Dict, Optional, Tuple, get_args, get_origin
+
+from dishka import AsyncContainer
+
+
+__all__ = ("Cached", "CachedDependency", "DependencyCache", "extract_cached")
+
+
+class CachedDependency:
+    """Marker stored in ``Annotated`` metadata by :class:`Cached`."""
+
+    __slots__ = ("ttl",)
+
+    def __init__(self, ttl: float) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.ttl = ttl
+
+    def __repr__(self) -> str:
+        return f"CachedDependency(ttl={self.ttl!r})"
+
+
+if TYPE_CHECKING:
+    Cached = Annotated
+else:
+
+    class Cached:
+        """
+        ``Cached[T, ttl]`` resolves ``T`` through a shared cache that lives
+        outside the request scope and refreshes the value every ``ttl`` seconds.
+
+        The value is created in its own short-lived scope, so only cache objects
+        that stay usable after their scope is closed (no connections, sessions etc).
+
+        Example:
+            async def callback(self, inter: MessageInteraction, flags: Cached[FeatureFlags, 30]): ...
+        """
+
+        def __class_getitem__(cls, params: Tuple[Any, float]) -> Any:
+            if not isinstance(params, tuple) or len(params) != 2:
+                raise TypeError("Cached[...] expects a type and a ttl: Cached[T, 30]")
+            tp, ttl = params
+            return Annotated[tp, CachedDependency(ttl)]
+
+
+def extract_cached(annotation: Any) -> Optional[CachedDependency]:
+    if get_origin(annotation) is not Annotated:
+        return None
+
+    for meta in get_args(annotation)[1:]:
+        if isinstance(meta, CachedDependency):
+            return meta
+    return None
+
+
+def _defined_in(dep_type: Any, module: str) -> bool:
+    name = getattr(get_origin(dep_type) or dep_type, "__module__", None) or ""
+    return name == module or name.startswith(module + ".")
+
+
+class DependencyCacheStats:
+    __slots__ = ("hits", "misses", "waits")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+
+    def as_dict(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "waits": self.waits}
+
+    def __repr__(self) -> str:
+        return f"<DependencyCacheStats hits={self.hits} misses={self.misses} waits={self.waits}>"
+
+
+class DependencyCache:
+    """
+    Time-bounded LRU of dependencies declared with :class:`Cached`.
+
+    Expired values are refreshed by a single caller, concurrent callers
+    wait for that refresh instead of hitting the provider too.
+    Values are kept per container, so containers routed per partition
+    (see :class:`.ContainerRouter`) don't share them.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.stats = DependencyCacheStats()
+        # (container, dependency type) -> (expiry, value)
+        self._entries: "OrderedDict[Tuple[AsyncContainer, Any], Tuple[float, Any]]" = OrderedDict()
+        self._refreshing: Dict[Tuple[AsyncContainer, Any], "asyncio.Future[Any]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, container: AsyncContainer, dep_type: Any, ttl: float) -> Any:
+        key = (container, dep_type)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+        refreshing = self._refreshing.get(key)
+        if refreshing is not None:
+            self.stats.waits += 1
+            # `wait` doesn't cancel the shared refresh if this caller is cancelled
+            await asyncio.wait((refreshing,))
+            if not refreshing.cancelled():
+                return refreshing.result()
+            return await self.get(container, dep_type, ttl)
+
+        self.stats.misses += 1
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._refreshing[key] = future
+        try:
+            async with container() as c:
+                value = await c.get(dep_type)
+        except Exception as exc:
+            future.set_exception(exc)
+            # mark as retrieved, nobody may be waiting
+            future.exception()
+            raise
+        except BaseException:
+            # waiters retry the refresh themselves
+            future.cancel()
+            raise
+        finally:
+            del self._refreshing[key]
+
+        self._set(key, value, ttl)
+        future.set_result(value)
+        return value
+
+    def _set(self, key: Tuple[AsyncContainer, Any], value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, dep_type: Any = None, container: Optional[AsyncContainer] = None) -> None:
+        """
+        Forget ``dep_type`` or, without it, every cached dependency;
+        only the values of ``container`` if given.
+        """
+        if dep_type is None and container is None:
+            self._entries.clear()
+            return
+
+        stale = [
+            key
+            for key in self._entries
+            if (dep_type is None or key[1] == dep_type) and (container is None or key[0] is container)
+        ]
+        for key in stale:
+            del self._entries[key]
+
+    def invalidate_module(self, module: str) -> int:
+        """
+        Forget dependencies whose type is defined in ``module`` or its submodules,
+        so an unloaded module's classes and values aren't kept alive.
+        """
+        stale = [key for key in self._entries if _defined_in(key[1], module)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
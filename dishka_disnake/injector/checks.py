@@ -0,0 +1,83 @@
+import inspect
+
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, TypeVar
+
+from disnake import Interaction
+from disnake.ext.commands import CheckFailure
+
+from dishka_disnake.injector import Dependency, build_plan
+
+
+__all__ = ("check", "InjectedCheck", "InjectedCheckFailure")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class InjectedCheckFailure(CheckFailure):
+    """Raised when a check declared with :func:`check` returns a falsy value."""
+
+    def __init__(self, check: "InjectedCheck") -> None:
+        self.check = check
+        super().__init__(f"The check {check.name} failed")
+
+
+class InjectedCheck(NamedTuple):
+    predicate: Callable[..., Any]
+    plan: Tuple[Dependency, ...]
+    cost: float
+    name: str
+
+    async def run(self, interaction: Optional[Interaction], dependencies: Dict[str, Any]) -> None:
+        result = self.predicate(interaction, **dependencies)
+        if inspect.isawaitable(result):
+            result = await result
+        if not result:
+            raise InjectedCheckFailure(self)
+
+
+def check(predicate: Callable[..., Any], *, cost: float = 0) -> Callable[[F], F]:
+    """
+    Run ``predicate(interaction, **dependencies)`` before the handler.
+
+    Dependencies of the predicate are declared like handler ones. Checks are
+    evaluated before any handler dependency: the ones without dependencies
+    first, before a scope is opened, then the rest by ascending ``cost``
+    in the scope later shared with the handler.
+    A falsy result raises :class:`InjectedCheckFailure`.
+
+    With ``cache=`` or ``coalesce=`` the checks run before the cache lookup,
+    in a scope of their own closed before the handler's is opened: request
+    dependencies used by both are created twice and finalized in between.
+
+    Place it below the command or component decorator:
+
+    .. code-block:: python
+
+        async def is_premium(interaction: AppCmdInter, repo: FromDishka[UserRepo]) -> bool:
+            return await repo.is_premium(interaction.author.id)
+
+        @slash_command(name="export")
+        @check(lambda interaction: interaction.guild_id is not None)
+        @check(is_premium, cost=10)
+        async def export(self, interaction: AppCmdInter, service: FromDishka[ExportService]): ...
+    """
+    injected = InjectedCheck(
+        predicate=predicate,
+        plan=build_plan(predicate),
+        cost=cost,
+        name=getattr(predicate, "__qualname__", repr(predicate)),
+    )
+
+    def decorator(func: F) -> F:
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(
+                "@check must be placed below the command or component decorator"
+            )
+
+        func.__dishka_checks__ = (  # type: ignore[attr-defined]
+            *getattr(func, "__dishka_checks__", ()),
+            injected,
+        )
+        return func
+
+    return decorator
@@ -0,0 +1,76 @@
+import asyncio
+import inspect
+
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from dishka_disnake.base.checkers import type_name
+
+
+__all__ = ("DependencyTimeoutError", "resolve_timeout")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class DependencyTimeoutError(TimeoutError):
+    """
+    Raised when resolving ``dependency`` takes longer than ``timeout`` seconds.
+    ``handler`` is the qualified name of the injected callback, if known.
+    The request scope is closed before it propagates.
+    """
+
+    def __init__(self, dependency: Any, timeout: float, handler: Optional[str] = None) -> None:
+        self.dependency = dependency
+        self.timeout = timeout
+        self.handler = handler
+        super().__init__(dependency, timeout, handler)
+
+    def __str__(self) -> str:
+        where = f" for {self.handler}" if self.handler else ""
+        return f"Resolving {type_name(self.dependency)}{where} timed out after {self.timeout}s"
+
+
+async def get_within(
+    get: Callable[[Any], Awaitable[Any]],
+    dep_type: Any,
+    timeout: float,
+    handler: Optional[str] = None,
+) -> Any:
+    """``await get(dep_type)``, cancelled after ``timeout`` seconds."""
+    deadline = asyncio.timeout(timeout)
+    try:
+        async with deadline:
+            return await get(dep_type)
+    except TimeoutError:
+        # providers may raise TimeoutError on their own (e.g. socket timeouts)
+        if not deadline.expired():
+            raise
+        raise DependencyTimeoutError(dep_type, timeout, handler) from None
+
+
+def resolve_timeout(seconds: Optional[float]) -> Callable[[F], F]:
+    """
+    Limit how long every dependency of the handler may take to resolve,
+    instead of the default passed to ``setup_dishka``. ``None`` disables it.
+    Timeouts set per dependency type in ``setup_dishka`` still take precedence.
+
+    Place it below the command or component decorator:
+
+    .. code-block:: python
+
+        @slash_command(name="stats")
+        @resolve_timeout(1.5)
+        async def stats(self, interaction: AppCmdInter, service: FromDishka[StatsService]): ...
+    """
+    if seconds is not None and seconds <= 0:
+        raise ValueError("seconds must be positive")
+
+    def decorator(func: F) -> F:
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(
+                "@resolve_timeout must be placed below the command or component decorator"
+            )
+
+        func.__dishka_timeout__ = seconds  # type: ignore[attr-defined]
+        return func
+
+    return decorator
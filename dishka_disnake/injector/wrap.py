@@ -1,15 +1,51 @@
-from typing import Callable
+from __future__ import annotations
 
-from dishka_disnake import inject
+import inspect
+
+from typing import TYPE_CHECKING, Callable, Optional
+
+from dishka_disnake.admission import Priority, admission_wrapper
+from dishka_disnake.injector import guard_checks, inject
+from dishka_disnake.scheduling import scheduling_wrapper
 from dishka_disnake.base.sign import rebuild_signature
 
+if TYPE_CHECKING:
+    from dishka_disnake.commands.cache import ResponseCache
+    from dishka_disnake.commands.coalesce import Coalescer
+
 
 def wrap_injector(
     func: Callable,
+    *,
+    cache: Optional[ResponseCache] = None,
+    coalesce: Optional[Coalescer] = None,
+    priority: Optional[Priority] = None,
 ) -> Callable:
-    wrapped = inject(func)
+    # computed once for both the plan and the rebuilt signature
+    signature = inspect.signature(func)
+    # cache hits and coalesced followers skip the injected call,
+    # so checks have to run in front of them
+    outer_checks = cache is not None or coalesce is not None
+    wrapped = inject(func, signature=signature, run_checks=not outer_checks)
+
+    # admitted calls wait for their guild's turn
+    wrapped = scheduling_wrapper(wrapped)
+
+    # rejected calls shouldn't even open a scope
+    wrapped = admission_wrapper(wrapped, priority if priority is not None else Priority.NORMAL)
+
+    # cache hits and coalesced followers don't run the handler,
+    # so they take neither an admission nor a scheduler slot
+    if coalesce is not None:
+        wrapped = coalesce.wrap(wrapped)
+
+    if cache is not None:
+        wrapped = cache.wrap(wrapped)
+
+    if outer_checks:
+        wrapped = guard_checks(wrapped, func)
 
-    wrapped.__signature__ = rebuild_signature(func)  # type: ignore
+    wrapped.__signature__ = rebuild_signature(func, signature)  # type: ignore
 
     if hasattr(wrapped, "__wrapped__"):
         del wrapped.__wrapped__  # type: ignore
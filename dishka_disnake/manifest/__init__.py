@@ -0,0 +1,262 @@
+"""
+Register application commands from a manifest and import their extensions on first use.
+
+Record the manifest once (for example in CI or a release step) with every extension loaded:
+
+```py
+bot.load_extensions("cogs")
+write_manifest(bot, "commands.json")
+```
+
+On startup, register lightweight stubs instead of importing the extensions:
+
+```py
+bot = InteractionBot(...)
+load_manifest(bot, "commands.json")
+await bot.start(token)
+```
+
+The first interaction (or autocompletion) of any stub command loads its extension
+with `bot.load_extension`, which imports the real handlers and builds their
+injection plans, then the real command handles the interaction; if loading fails
+the stubs stay registered.
+Only use it for extensions that don't need to run anything (listeners, tasks)
+before one of their commands is invoked.
+"""
+
+import asyncio
+import json
+import os
+
+from typing import Any, Dict, List, Optional, Union
+
+from disnake import (
+    ApplicationCommandInteraction,
+    ApplicationInstallTypes,
+    InteractionContextTypes,
+    Localized,
+    MessageCommand,
+    Option,
+    SlashCommand,
+    UserCommand,
+)
+from disnake.ext.commands import (
+    InvokableMessageCommand,
+    InvokableSlashCommand,
+    InvokableUserCommand,
+)
+from disnake.ext.commands.interaction_bot_base import InteractionBotBase
+
+
+__all__ = ("write_manifest", "load_manifest")
+
+MANIFEST_VERSION = 1
+
+_KINDS = ("slash", "user", "message")
+
+
+def _extension_of(bot: InteractionBotBase, command: Any) -> Optional[str]:
+    module = command.cog.__module__ if command.cog is not None else command.callback.__module__
+    for name in bot.extensions:
+        if module == name or module.startswith(name + "."):
+            return name
+    return None
+
+
+def write_manifest(bot: InteractionBotBase, path: Union[str, "os.PathLike[str]"]) -> int:
+    """
+    Record the application commands of loaded extensions to ``path``.
+    Returns the number of recorded commands.
+    """
+    commands: List[Dict[str, Any]] = []
+    registered = (bot.slash_commands, bot.user_commands, bot.message_commands)
+
+    for kind, invokables in zip(_KINDS, registered):
+        for command in invokables:
+            extension = _extension_of(bot, command)
+            if extension is None:
+                # commands added outside of extensions can't be imported lazily
+                continue
+
+            commands.append(
+                {
+                    "kind": kind,
+                    "extension": extension,
+                    "guild_ids": list(command.guild_ids) if command.guild_ids else None,
+                    "auto_sync": command.auto_sync,
+                    "body": command.body.to_dict(),
+                }
+            )
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"version": MANIFEST_VERSION, "commands": commands}, file, indent=2)
+
+    return len(commands)
+
+
+def _body(data: Dict[str, Any]) -> Union[SlashCommand, UserCommand, MessageCommand]:
+    permissions = data.get("default_member_permissions")
+    install_types = data.get("integration_types")
+    contexts = data.get("contexts")
+
+    common: Dict[str, Any] = {
+        "name": Localized(data["name"], data=data.get("name_localizations")),
+        "default_member_permissions": int(permissions) if permissions is not None else None,
+        "nsfw": data.get("nsfw"),
+        "install_types": (
+            ApplicationInstallTypes._from_values(install_types)
+            if install_types is not None
+            else None
+        ),
+        "contexts": (
+            InteractionContextTypes._from_values(contexts) if contexts is not None else None
+        ),
+    }
+
+    command_type = data.get("type", 1)
+    if command_type == 2:
+        return UserCommand(**common)
+    if command_type == 3:
+        return MessageCommand(**common)
+
+    return SlashCommand(
+        description=Localized(data["description"], data=data.get("description_localizations")),
+        options=[Option.from_dict(option) for option in data.get("options", [])],
+        **common,
+    )
+
+
+class _ExtensionLoader:
+    def __init__(self, bot: InteractionBotBase, extension: str) -> None:
+        self.bot = bot
+        self.extension = extension
+        self.stubs: List[Any] = []
+        self._lock = asyncio.Lock()
+
+    async def load(self) -> None:
+        async with self._lock:
+            if self.extension in self.bot.extensions:
+                return
+
+            # real commands can't be added while stubs hold their names
+            for stub in self.stubs:
+                if isinstance(stub, InvokableSlashCommand):
+                    self.bot.remove_slash_command(stub.name)
+                elif isinstance(stub, InvokableUserCommand):
+                    self.bot.remove_user_command(stub.name)
+                else:
+                    self.bot.remove_message_command(stub.name)
+
+            try:
+                self.bot.load_extension(self.extension)
+            except BaseException:
+                # keep the commands registered, the next interaction tries again
+                self._restore()
+                raise
+
+    def _restore(self) -> None:
+        for stub in self.stubs:
+            if stub._real() is not None:
+                continue
+            if isinstance(stub, InvokableSlashCommand):
+                self.bot.add_slash_command(stub)
+            elif isinstance(stub, InvokableUserCommand):
+                self.bot.add_user_command(stub)
+            else:
+                self.bot.add_message_command(stub)
+
+
+async def _stub_callback(inter: ApplicationCommandInteraction) -> None:
+    # never called: stubs override `invoke`
+    raise RuntimeError("Lazy command stub was called directly")
+
+
+class _LazyCommandMixin:
+    _loader: _ExtensionLoader
+    # bot method looking up the real command by name
+    _getter: str
+
+    name: str
+
+    def _real(self) -> Any:
+        command = getattr(self._loader.bot, self._getter)(self.name)
+        return command if command is not self else None
+
+    async def _load(self) -> Any:
+        await self._loader.load()
+        command = self._real()
+        if command is None:
+            raise RuntimeError(
+                f"Extension {self._loader.extension!r} doesn't define the command {self.name!r}"
+            )
+        return command
+
+    # the bot already ran its global checks and dispatched the events for this
+    # interaction, only the command itself runs on the real one
+    async def invoke(self, inter: ApplicationCommandInteraction, *args: Any, **kwargs: Any) -> None:
+        command = await self._load()
+        await command.invoke(inter)
+
+    async def dispatch_error(self, inter: ApplicationCommandInteraction, error: Any) -> None:
+        command = self._real()
+        if command is None:
+            await super().dispatch_error(inter, error)  # type: ignore[misc]
+        else:
+            await command.dispatch_error(inter, error)
+
+
+class LazySlashCommand(_LazyCommandMixin, InvokableSlashCommand):
+    _getter = "get_slash_command"
+
+    async def _call_relevant_autocompleter(self, inter: ApplicationCommandInteraction) -> None:
+        command = await self._load()
+        await command._call_relevant_autocompleter(inter)
+
+
+class LazyUserCommand(_LazyCommandMixin, InvokableUserCommand):
+    _getter = "get_user_command"
+
+
+class LazyMessageCommand(_LazyCommandMixin, InvokableMessageCommand):
+    _getter = "get_message_command"
+
+
+def load_manifest(bot: InteractionBotBase, path: Union[str, "os.PathLike[str]"]) -> List[str]:
+    """
+    Register stub commands from a manifest written by :func:`write_manifest`.
+    Returns the names of the extensions that will be loaded lazily.
+    """
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+
+    if data.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported command manifest version: {data.get('version')!r}")
+
+    loaders: Dict[str, _ExtensionLoader] = {}
+    for entry in data["commands"]:
+        extension = entry["extension"]
+        if extension in bot.extensions:
+            continue
+
+        loader = loaders.get(extension)
+        if loader is None:
+            loader = loaders[extension] = _ExtensionLoader(bot, extension)
+
+        body = _body(entry["body"])
+        kwargs = {"name": body.name, "guild_ids": entry["guild_ids"], "auto_sync": entry["auto_sync"]}
+
+        if entry["kind"] == "slash":
+            stub: Any = LazySlashCommand(_stub_callback, options=[], **kwargs)
+            bot.add_slash_command(stub)
+        elif entry["kind"] == "user":
+            stub = LazyUserCommand(_stub_callback, **kwargs)
+            bot.add_user_command(stub)
+        else:
+            stub = LazyMessageCommand(_stub_callback, **kwargs)
+            bot.add_message_command(stub)
+
+        stub.body = body
+        stub._loader = loader
+        loader.stubs.append(stub)
+
+    return list(loaders)
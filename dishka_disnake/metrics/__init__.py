@@ -0,0 +1,291 @@
+"""
+Prometheus metrics of injected handlers, without external dependencies.
+
+```py
+from dishka_disnake import setup_dishka
+from dishka_disnake.metrics import Metrics
+
+metrics = Metrics()
+setup_dishka(container, metrics=metrics)
+
+server = await metrics.serve(port=9100)  # GET /metrics, on 127.0.0.1
+text = metrics.render()                  # or expose it through your own web server
+```
+
+Every injected entry point (slash, user and message commands, components and
+modals) is counted by handler qualified name and kind:
+
+- ``dishka_disnake_invocations_total``: calls that reached the injector;
+- ``dishka_disnake_scopes_total``: request scopes entered;
+- ``dishka_disnake_errors_total``: calls that raised;
+- ``dishka_disnake_handler_duration_seconds``: histogram of call durations,
+  checks, resolution and scope exit included;
+- ``dishka_disnake_resolution_failures_total``: failed resolutions by dependency type;
+- ``dishka_disnake_replayed_total``: calls answered with a response replayed from a
+  ``ResponseCache`` (``outcome="cached"``) or from a coalesced call (``outcome="coalesced"``),
+  which never reach the injector.
+
+Series keep plain integers in bucket lists allocated when the series is created,
+the event loop thread being the only writer; no locks are taken.
+"""
+
+import asyncio
+import math
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from dishka_disnake.base.checkers import type_name
+from dishka_disnake.base.interaction import find_interaction, interaction_kind
+
+
+__all__ = (
+    "Counter",
+    "DEFAULT_BUCKETS",
+    "HandlerMetrics",
+    "Histogram",
+    "Metrics",
+    "interaction_kind",
+)
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _CounterSeries:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class _HistogramSeries:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds = bounds
+        # one slot per bound plus +Inf, not cumulative
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class _Family(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.series: Dict[Tuple[str, ...], Any] = {}
+
+    @abstractmethod
+    def _new(self) -> Any: ...
+
+    def labels(self, *values: str) -> Any:
+        series = self.series.get(values)
+        if series is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            series = self.series[values] = self._new()
+        return series
+
+    @abstractmethod
+    def _samples(self) -> Iterator[str]: ...
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {_escape(self.documentation)}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self._samples()
+
+
+class Counter(_Family):
+    kind = "counter"
+
+    def _new(self) -> _CounterSeries:
+        return _CounterSeries()
+
+    def _samples(self) -> Iterator[str]:
+        for values, series in list(self.series.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, values)} {series.value}"
+
+
+class Histogram(_Family):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        bounds = tuple(sorted(float(bound) for bound in buckets if bound != math.inf))
+        if not bounds:
+            raise ValueError("buckets must not be empty")
+        self.bounds = bounds
+
+    def _new(self) -> _HistogramSeries:
+        return _HistogramSeries(self.bounds)
+
+    def _samples(self) -> Iterator[str]:
+        for values, series in list(self.series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.bounds, math.inf), list(series.counts)):
+                cumulative += count
+                labels = _format_labels(self.labelnames, values, f'le="{_format_value(bound)}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(series.sum)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class HandlerMetrics:
+    """Series of one handler, looked up once and reused by every call."""
+
+    __slots__ = ("kind", "invocations", "scopes", "errors", "duration")
+
+    def __init__(self, metrics: "Metrics", handler: str, kind: str) -> None:
+        self.kind = kind
+        self.invocations: _CounterSeries = metrics.invocations.labels(handler, kind)
+        self.scopes: _CounterSeries = metrics.scopes.labels(handler, kind)
+        self.errors: _CounterSeries = metrics.errors.labels(handler, kind)
+        self.duration: _HistogramSeries = metrics.duration.labels(handler, kind)
+
+
+class Metrics:
+    """
+    Metrics of injected handlers. ``buckets`` are the upper bounds (seconds)
+    of the duration histogram. Extra families passed to :meth:`register` are
+    rendered too.
+    """
+
+    def __init__(
+        self,
+        *,
+        namespace: str = "dishka_disnake",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        labels = ("handler", "kind")
+        self.invocations = Counter(
+            f"{namespace}_invocations_total", "Injected handler calls.", labels
+        )
+        self.scopes = Counter(
+            f"{namespace}_scopes_total", "Request scopes entered by injected handlers.", labels
+        )
+        self.errors = Counter(
+            f"{namespace}_errors_total", "Injected handler calls that raised.", labels
+        )
+        self.duration = Histogram(
+            f"{namespace}_handler_duration_seconds",
+            "Duration of injected handler calls, dependency resolution included.",
+            labels,
+            buckets,
+        )
+        self.resolution_failures = Counter(
+            f"{namespace}_resolution_failures_total",
+            "Dependencies that failed to resolve.",
+            ("dependency",),
+        )
+        self.replays = Counter(
+            f"{namespace}_replayed_total",
+            "Calls answered with a cached or coalesced response, without running the handler.",
+            ("handler", "kind", "outcome"),
+        )
+        self.families: List[_Family] = [
+            self.invocations,
+            self.scopes,
+            self.errors,
+            self.duration,
+            self.resolution_failures,
+            self.replays,
+        ]
+        self._handlers: Dict[str, HandlerMetrics] = {}
+
+    def register(self, family: _Family) -> _Family:
+        self.families.append(family)
+        return family
+
+    def handler(self, qualname: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> HandlerMetrics:
+        """Series of ``qualname``, its kind taken from the interaction of the first call."""
+        series = self._handlers.get(qualname)
+        if series is None:
+            kind = interaction_kind(find_interaction(args, kwargs))
+            series = self._handlers[qualname] = HandlerMetrics(self, qualname, kind)
+        return series
+
+    def replayed(self, qualname: str, args: Tuple[Any, ...], kwargs: Dict[str, Any], outcome: str) -> None:
+        """Count a call of ``qualname`` answered by a ``cached`` or ``coalesced`` response."""
+        series = self.handler(qualname, args, kwargs)
+        self.replays.labels(qualname, series.kind, outcome).inc()
+
+    def resolution_failed(self, dep_type: Any) -> None:
+        self.resolution_failures.labels(type_name(dep_type)).inc()
+
+    def render(self) -> str:
+        """Text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+        for family in self.families:
+            lines.extend(family.render())
+        lines.append("")
+        return "\n".join(lines)
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 9100) -> asyncio.AbstractServer:
+        """
+        Serve :meth:`render` at ``GET /metrics`` on ``host:port``, local connections only
+        by default: pass ``host="0.0.0.0"`` to let a scraper on another machine in.
+        Close the returned server to stop it.
+        """
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readline(), 5)
+            # skip the headers
+            while (await asyncio.wait_for(reader.readline(), 5)).strip():
+                pass
+
+            parts = request.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, body, content_type = "200 OK", self.render().encode(), _CONTENT_TYPE
+            else:
+                status, body, content_type = "404 Not Found", b"Not Found\n", "text/plain"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
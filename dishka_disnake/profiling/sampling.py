@@ -0,0 +1,277 @@
+"""
+Profiling a sample of handler invocations in production.
+
+```py
+from dishka_disnake import setup_dishka
+from dishka_disnake.profiling.sampling import HandlerSampler
+
+sampler = HandlerSampler("/var/lib/mybot/profiles", keep=200)
+setup_dishka(container, sampler=sampler)
+
+sampler.enable("StatsCog.stats", rate=0.01)          # cProfile, 1% of calls
+sampler.enable("ShopCog.buy", rate=0.1, mode="stack")  # collapsed stacks
+sampler.disable("StatsCog.stats")
+```
+
+A sampled invocation (dependency resolution and the handler) runs under the
+profiler only while its own task executes: other tasks running in between
+are not recorded. Each one writes a file to ``directory``:
+
+- ``cprofile`` mode: ``<qualname>-<time>-<pid>.pstats``, readable with :mod:`pstats`
+  or snakeviz;
+- ``stack`` mode: ``<qualname>-<time>-<pid>.collapsed``, one ``frame;frame;... count``
+  line per stack, for flamegraph.pl or speedscope. Stacks are sampled every
+  ``interval`` seconds by a background thread, so overhead doesn't depend on
+  how many calls the handler makes. The thread only gets the GIL every
+  ``sys.getswitchinterval()`` while the handler runs Python code, which bounds the resolution.
+
+Only the newest ``keep`` files are kept. Handlers that are not enabled are only
+looked up in a dict; without a sampler nothing is checked at all. A ``cprofile``
+invocation that could not enable its profiler, because another tool holds the
+profiling slot (an outer cProfile or a debugger on Python 3.12+), writes nothing
+and is counted in ``skipped``.
+"""
+
+import asyncio
+import cProfile
+import logging
+import os
+import random
+import sys
+import threading
+import time
+
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Coroutine, Dict, Generator, Optional, Tuple, Union
+
+
+__all__ = ("HandlerSampler",)
+
+_log = logging.getLogger(__name__)
+
+_MODES = ("cprofile", "stack")
+_SUFFIXES = (".pstats", ".collapsed")
+
+# set while a sampled invocation runs, nested handlers are not sampled again
+_sampling: ContextVar[bool] = ContextVar("dishka_disnake_sampling", default=False)
+
+
+class _Stepper:
+    """Runs a coroutine, calling ``enter``/``leave`` around every step of it."""
+
+    __slots__ = ("coro", "enter", "leave")
+
+    def __init__(self, coro: Coroutine[Any, Any, Any], enter: Any, leave: Any) -> None:
+        self.coro = coro
+        self.enter = enter
+        self.leave = leave
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        token = _sampling.set(True)
+        try:
+            value: Any = None
+            error: Optional[BaseException] = None
+            while True:
+                self.enter()
+                try:
+                    if error is None:
+                        yielded = self.coro.send(value)
+                    else:
+                        yielded = self.coro.throw(error)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    self.leave()
+
+                try:
+                    value, error = (yield yielded), None
+                except BaseException as exc:  # delivered into the coroutine, e.g. cancellation
+                    value, error = None, exc
+        finally:
+            _sampling.reset(token)
+
+
+class _StackCollector:
+    """Collapsed stacks of the steps currently marked as running."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        # thread id -> stacks of the sampled step running on it
+        self._running: Dict[int, Counter] = {}
+        self._active = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def attach(self) -> None:
+        with self._lock:
+            self._active += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="dishka-disnake: stack sampler", daemon=True
+                )
+                self._thread.start()
+
+    def detach(self) -> None:
+        with self._lock:
+            self._active -= 1
+
+    def mark(self, stacks: Optional[Counter]) -> None:
+        thread_id = threading.get_ident()
+        if stacks is None:
+            self._running.pop(thread_id, None)
+        else:
+            self._running[thread_id] = stacks
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._active:
+                    self._thread = None
+                    return
+            frames = sys._current_frames()
+            for thread_id, stacks in list(self._running.items()):
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    stacks[_collapse(frame)] += 1
+
+
+def _collapse(frame: Any) -> str:
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        if code is _Stepper.__await__.__code__:
+            break
+        names.append(f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class HandlerSampler:
+    """
+    Profiles enabled handlers, by qualified name, and writes the results to ``directory``,
+    keeping the newest ``keep`` files. ``interval`` is the stack sampling period in seconds.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        *,
+        keep: int = 100,
+        interval: float = 0.001,
+    ) -> None:
+        if keep <= 0:
+            raise ValueError("keep must be positive")
+
+        self.directory = os.fspath(directory)
+        self.keep = keep
+        self.rates: Dict[str, Tuple[float, str]] = {}
+        self.written = 0
+        self.skipped = 0
+        self._stacks = _StackCollector(interval)
+
+    def enable(self, qualname: str, rate: float = 1.0, *, mode: str = "cprofile") -> None:
+        """Profile ``rate`` (0..1) of the invocations of the handler ``qualname``."""
+        if not 0 < rate <= 1:
+            raise ValueError("rate must be in (0, 1]")
+        if mode not in _MODES:
+            raise ValueError(f"mode must be one of {_MODES}")
+        self.rates[qualname] = (rate, mode)
+
+    def disable(self, qualname: Optional[str] = None) -> None:
+        """Stop profiling ``qualname`` or, without arguments, every handler."""
+        if qualname is None:
+            self.rates.clear()
+        else:
+            self.rates.pop(qualname, None)
+
+    def sampled(self, qualname: str) -> Optional[str]:
+        """Profiling mode for this invocation of ``qualname``, ``None`` if not sampled."""
+        entry = self.rates.get(qualname)
+        if entry is None or _sampling.get():
+            return None
+        rate, mode = entry
+        if rate < 1 and random.random() >= rate:
+            return None
+        return mode
+
+    async def run(self, qualname: str, mode: str, coro: Coroutine[Any, Any, Any]) -> Any:
+        if mode == "stack":
+            return await self._run_stack(qualname, coro)
+        return await self._run_cprofile(qualname, coro)
+
+    async def _run_cprofile(self, qualname: str, coro: Coroutine[Any, Any, Any]) -> Any:
+        profile = cProfile.Profile()
+        enabled = False
+
+        def enter() -> None:
+            nonlocal enabled
+            try:
+                profile.enable()
+            except ValueError:
+                # another profiler is active (sys.monitoring tool slot taken)
+                return
+            enabled = True
+
+        try:
+            return await _Stepper(coro, enter, profile.disable)
+        finally:
+            if enabled:
+                profile.create_stats()
+                self._write(qualname, ".pstats", profile.dump_stats)
+            else:
+                self.skipped += 1
+                _log.debug("Profiler busy, %s was not profiled", qualname)
+
+    async def _run_stack(self, qualname: str, coro: Coroutine[Any, Any, Any]) -> Any:
+        stacks: Counter = Counter()
+        collector = self._stacks
+        collector.attach()
+        try:
+            return await _Stepper(coro, lambda: collector.mark(stacks), lambda: collector.mark(None))
+        finally:
+            collector.detach()
+
+            def dump(path: str) -> None:
+                with open(path, "w", encoding="utf-8") as file:
+                    for stack, count in stacks.most_common():
+                        file.write(f"{stack} {count}\n")
+
+            self._write(qualname, ".collapsed", dump)
+
+    def _write(self, qualname: str, suffix: str, dump: Any) -> None:
+        path = os.path.join(
+            self.directory,
+            f"{qualname}-{time.strftime('%Y%m%d-%H%M%S')}-{time.time_ns() % 1_000_000_000:09d}"
+            f"-{os.getpid()}{suffix}",
+        )
+
+        def write() -> None:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                dump(path)
+                self.written += 1
+                self._rotate()
+            except OSError as exc:
+                _log.warning("Failed to write profile %s: %s", path, exc)
+
+        try:
+            asyncio.get_running_loop().run_in_executor(None, write)
+        except RuntimeError:
+            write()
+
+    def _rotate(self) -> None:
+        entries = [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.is_file() and entry.name.endswith(_SUFFIXES)
+        ]
+        if len(entries) <= self.keep:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[: len(entries) - self.keep]:
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
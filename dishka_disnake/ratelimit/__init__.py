@@ -0,0 +1,376 @@
+"""
+Cooldowns shared by every process of a bot on one host.
+
+disnake's cooldown buckets live in the memory of one process, so with shards
+spread over several processes each of them counts separately. Here the counters
+live in a fixed-size hash table in a memory-mapped file (``/dev/shm`` by default)
+and every process updates it under a per-stripe file lock.
+
+```py
+from dishka_disnake.ratelimit import SharedRateLimiter, shared_cooldown
+from disnake.ext.commands import BucketType
+
+limiter = SharedRateLimiter("mybot-cooldowns")
+
+
+class GameCog(Cog):
+
+    @slash_command(name="roll")
+    @shared_cooldown(limiter, rate=3, per=10, bucket=BucketType.user)
+    async def roll(self, interaction: AppCmdInter, game: FromDishka[GameService]):
+        ...
+```
+
+The check raises disnake's ``CommandOnCooldown``, so existing error handlers
+keep working. Handlers can use the limiter directly through the container
+with :class:`RateLimitProvider`.
+
+Counters use a sliding window: the count of the previous window is weighted
+by how much of it still overlaps the last ``per`` seconds. The table never
+grows; when a probe sequence is full, the entry with the oldest window is reused.
+Only POSIX systems are supported (``fcntl`` record locks).
+"""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar, Union
+
+from dishka import Provider, Scope, provide
+from disnake import Interaction
+from disnake.ext.commands import BucketType, CommandOnCooldown, Cooldown
+
+from dishka_disnake.injector.checks import check
+
+
+__all__ = (
+    "SharedRateLimiter",
+    "SharedCooldown",
+    "RateLimitProvider",
+    "shared_cooldown",
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_MAGIC = b"DDRL0001"
+# magic, slots, stripes
+_HEADER = struct.Struct("<8sII")
+# key hash, window index, count of the current window, count of the previous one
+_ENTRY = struct.Struct("<QqII")
+
+DEFAULT_DIRECTORY = "/dev/shm" if os.path.isdir("/dev/shm") else "/tmp"
+
+
+class _SharedFile:
+    """
+    Descriptor of a table file shared by the limiters of this process.
+
+    ``fcntl`` record locks belong to the process: closing any descriptor of the
+    file drops all of them, and they never block the process's own threads. So
+    limiters on one file share one descriptor, and hold ``lock`` around the
+    record locks to exclude each other.
+    """
+
+    __slots__ = ("path", "fd", "users", "lock")
+
+    def __init__(self, path: str, fd: int) -> None:
+        self.path = path
+        self.fd = fd
+        self.users = 0
+        self.lock = threading.Lock()
+
+
+_files: Dict[str, _SharedFile] = {}
+_files_lock = threading.Lock()
+
+
+def _open_shared(path: str) -> _SharedFile:
+    real_path = os.path.realpath(path)
+    with _files_lock:
+        shared = _files.get(real_path)
+        if shared is None:
+            fd = os.open(real_path, os.O_RDWR | os.O_CREAT, 0o600)
+            shared = _files[real_path] = _SharedFile(real_path, fd)
+        shared.users += 1
+        return shared
+
+
+def _close_shared(shared: _SharedFile) -> None:
+    with _files_lock:
+        shared.users -= 1
+        if shared.users == 0:
+            del _files[shared.path]
+            os.close(shared.fd)
+
+
+def _hash_key(key: str) -> int:
+    # python's hash() is randomized per process
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    # 0 marks an empty slot
+    return int.from_bytes(digest, "little") or 1
+
+
+class SharedRateLimiter:
+    """
+    Sliding-window counters in a shared memory-mapped hash table.
+
+    ``path`` is a file path or a bare name created in ``/dev/shm``. Every process
+    opening the same path with the same ``slots`` shares the counters.
+    ``slots`` are split into ``stripes`` locked independently, and a key probes
+    at most ``max_probe`` slots of its stripe. Limiters of one process opening the
+    same file share its descriptor and lock it in turn.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        slots: int = 65536,
+        stripes: int = 256,
+        max_probe: int = 8,
+    ) -> None:
+        if slots <= 0 or stripes <= 0 or slots % stripes:
+            raise ValueError("slots must be a positive multiple of stripes")
+
+        path = os.fspath(path)
+        if os.sep not in path:
+            path = os.path.join(DEFAULT_DIRECTORY, path)
+
+        self.path = path
+        self.slots = slots
+        self.stripes = stripes
+        self.stripe_size = slots // stripes
+        self.max_probe = min(max_probe, self.stripe_size)
+
+        # one lock byte per stripe after the header, then the entries
+        self._entries_offset = _HEADER.size + stripes
+        size = self._entries_offset + slots * _ENTRY.size
+
+        self._file = _open_shared(path)
+        self._fd = self._file.fd
+        try:
+            self._lock(0, 1)
+            try:
+                if os.fstat(self._fd).st_size == 0:
+                    os.ftruncate(self._fd, size)
+                    os.pwrite(self._fd, _HEADER.pack(_MAGIC, slots, stripes), 0)
+                header = _HEADER.unpack(os.pread(self._fd, _HEADER.size, 0))
+            finally:
+                self._unlock(0, 1)
+
+            if header != (_MAGIC, slots, stripes):
+                raise ValueError(
+                    f"{path} holds a different rate limit table "
+                    f"(slots={header[1]}, stripes={header[2]})"
+                )
+            self._map = mmap.mmap(self._fd, size)
+        except BaseException:
+            _close_shared(self._file)
+            raise
+
+    def _lock(self, offset: int, length: int) -> None:
+        self._file.lock.acquire()
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, length, offset)
+        except BaseException:
+            self._file.lock.release()
+            raise
+
+    def _unlock(self, offset: int, length: int) -> None:
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, length, offset)
+        finally:
+            self._file.lock.release()
+
+    def _probe(self, key_hash: int) -> Iterator[int]:
+        stripe = key_hash % self.stripes
+        base = self._entries_offset + stripe * self.stripe_size * _ENTRY.size
+        start = (key_hash // self.stripes) % self.stripe_size
+        for i in range(self.max_probe):
+            yield base + ((start + i) % self.stripe_size) * _ENTRY.size
+
+    def _find(self, key_hash: int) -> Tuple[int, Tuple[int, int, int, int]]:
+        """Offset of the entry of ``key_hash``, or of the slot to reuse for it."""
+        victim = -1
+        victim_entry = (0, 0, 0, 0)
+        for offset in self._probe(key_hash):
+            entry = _ENTRY.unpack_from(self._map, offset)
+            if entry[0] == key_hash:
+                return offset, entry
+            if entry[0] == 0:
+                return offset, (key_hash, 0, 0, 0)
+            if victim < 0 or entry[1] < victim_entry[1]:
+                victim, victim_entry = offset, entry
+        return victim, (key_hash, 0, 0, 0)
+
+    def hit(self, key: str, rate: int, per: float, cost: int = 1) -> float:
+        """
+        Count ``cost`` hits of ``key`` unless it would exceed ``rate`` per ``per`` seconds.
+        Returns 0 when allowed, otherwise the seconds to wait (nothing is counted then).
+        """
+        key_hash = _hash_key(key)
+        now = time.monotonic()
+        window, elapsed = divmod(now, per)
+        window = int(window)
+        overlap = 1.0 - elapsed / per
+
+        stripe_lock = _HEADER.size + key_hash % self.stripes
+        self._lock(stripe_lock, 1)
+        try:
+            offset, (_, stored_window, current, previous) = self._find(key_hash)
+            if stored_window == window - 1:
+                current, previous = 0, current
+            elif stored_window != window:
+                current, previous = 0, 0
+
+            if previous * overlap + current + cost > rate:
+                return self._retry_after(rate, per, cost, current, previous, overlap, elapsed)
+
+            _ENTRY.pack_into(self._map, offset, key_hash, window, current + cost, previous)
+            return 0.0
+        finally:
+            self._unlock(stripe_lock, 1)
+
+    @staticmethod
+    def _retry_after(
+        rate: int,
+        per: float,
+        cost: int,
+        current: int,
+        previous: int,
+        overlap: float,
+        elapsed: float,
+    ) -> float:
+        if cost > rate:
+            return float("inf")
+
+        free = rate - current - cost
+        if free >= 0 and previous:
+            # within this window, once the previous one overlaps little enough
+            return max(0.0, (overlap - free / previous) * per)
+
+        # in the next window, where this window's count becomes the previous one
+        needed = 1.0 - (rate - cost) / current if current else 0.0
+        return (per - elapsed) + max(0.0, needed) * per
+
+    def usage(self, key: str, per: float) -> float:
+        """Weighted number of hits of ``key`` over the last ``per`` seconds."""
+        key_hash = _hash_key(key)
+        window, elapsed = divmod(time.monotonic(), per)
+
+        stripe_lock = _HEADER.size + key_hash % self.stripes
+        self._lock(stripe_lock, 1)
+        try:
+            _, (stored_hash, stored_window, current, previous) = self._find(key_hash)
+        finally:
+            self._unlock(stripe_lock, 1)
+
+        if stored_hash != key_hash or stored_window < window - 1:
+            return 0.0
+        if stored_window == window - 1:
+            current, previous = 0, current
+        return previous * (1.0 - elapsed / per) + current
+
+    def reset(self, key: str) -> None:
+        """Forget the hits of ``key``."""
+        key_hash = _hash_key(key)
+        stripe_lock = _HEADER.size + key_hash % self.stripes
+        self._lock(stripe_lock, 1)
+        try:
+            offset, entry = self._find(key_hash)
+            if _ENTRY.unpack_from(self._map, offset)[0] == key_hash:
+                _ENTRY.pack_into(self._map, offset, key_hash, 0, 0, 0)
+        finally:
+            self._unlock(stripe_lock, 1)
+
+    def close(self) -> None:
+        self._map.close()
+        _close_shared(self._file)
+
+    def unlink(self) -> None:
+        """Remove the backing file; processes that have it open keep their mapping."""
+        os.unlink(self.path)
+
+
+class SharedCooldown:
+    """
+    Check predicate for :func:`check` limiting invocations per ``bucket``
+    to ``rate`` per ``per`` seconds across processes.
+    Raises ``CommandOnCooldown`` when exceeded.
+    """
+
+    def __init__(
+        self,
+        limiter: SharedRateLimiter,
+        rate: int,
+        per: float,
+        bucket: BucketType = BucketType.default,
+        *,
+        name: str,
+    ) -> None:
+        self.limiter = limiter
+        self.rate = rate
+        self.per = per
+        self.bucket = bucket
+        self.name = name
+        self.__qualname__ = f"shared_cooldown({name})"
+
+    def key(self, interaction: Interaction) -> str:
+        return f"{self.name}:{self.bucket.name}:{self.bucket(interaction)}"
+
+    def __call__(self, interaction: Interaction) -> bool:
+        retry_after = self.limiter.hit(self.key(interaction), self.rate, self.per)
+        if retry_after:
+            raise CommandOnCooldown(Cooldown(self.rate, self.per), retry_after, self.bucket)
+        return True
+
+
+def shared_cooldown(
+    limiter: SharedRateLimiter,
+    rate: int,
+    per: float,
+    bucket: BucketType = BucketType.default,
+    *,
+    name: Optional[str] = None,
+) -> Callable[[F], F]:
+    """
+    Decorator limiting a command or component to ``rate`` invocations per ``per``
+    seconds and ``bucket``, counted across every process using ``limiter``.
+
+    The counters are keyed by ``name``, the callback's qualified name by default,
+    so it must be the same in every process. Place it below the command decorator.
+    """
+
+    def decorator(func: F) -> F:
+        cooldown = SharedCooldown(
+            limiter,
+            rate,
+            per,
+            bucket,
+            name=name or f"{func.__module__}.{func.__qualname__}",
+        )
+        return check(cooldown)(func)
+
+    return decorator
+
+
+class RateLimitProvider(Provider):
+    """
+    Provides a :class:`SharedRateLimiter` in APP scope and closes it with the container.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], **options: Any) -> None:
+        super().__init__()
+        self.path = path
+        self.options = options
+
+    @provide(scope=Scope.APP)
+    def limiter(self) -> Iterator[SharedRateLimiter]:
+        limiter = SharedRateLimiter(self.path, **self.options)
+        yield limiter
+        limiter.close()
@@ -0,0 +1,70 @@
+"""
+Contention benchmark of :class:`SharedRateLimiter`.
+
+    python -m dishka_disnake.ratelimit --processes 8 --keys 16 --hits 50000
+
+Every process hits keys of the same table as fast as it can; fewer keys
+means more processes competing for the same stripes.
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+
+from dishka_disnake.ratelimit import SharedRateLimiter
+
+
+def _worker(path: str, slots: int, stripes: int, keys: int, hits: int, start: object) -> float:
+    limiter = SharedRateLimiter(path, slots=slots, stripes=stripes)
+    start.wait()  # type: ignore[attr-defined]
+
+    started = time.perf_counter()
+    for i in range(hits):
+        limiter.hit(f"bench:{i % keys}", 1_000_000_000, 60)
+    elapsed = time.perf_counter() - started
+
+    limiter.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--keys", type=int, default=16)
+    parser.add_argument("--hits", type=int, default=50_000, help="hits per process")
+    parser.add_argument("--slots", type=int, default=65536)
+    parser.add_argument("--stripes", type=int, default=256)
+    args = parser.parse_args()
+
+    path = f"dishka-disnake-bench-{os.getpid()}"
+    limiter = SharedRateLimiter(path, slots=args.slots, stripes=args.stripes)
+    try:
+        with multiprocessing.Manager() as manager:
+            start = manager.Event()
+            with multiprocessing.Pool(args.processes) as pool:
+                pending = pool.starmap_async(
+                    _worker,
+                    [
+                        (limiter.path, args.slots, args.stripes, args.keys, args.hits, start)
+                        for _ in range(args.processes)
+                    ],
+                )
+                time.sleep(0.5)
+                start.set()
+                timings = pending.get()
+    finally:
+        limiter.close()
+        limiter.unlink()
+
+    total = args.hits * args.processes
+    wall = max(timings)
+    print(
+        f"{args.processes} processes, {args.keys} keys: "
+        f"{total / wall:,.0f} hits/s total, "
+        f"{sum(timings) / total * 1e6:.2f}us per hit"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Reload extensions without touching the container.
+
+```py
+from dishka_disnake.reload import enable_hot_reload
+
+bot = InteractionBot(...)
+enable_hot_reload(bot)
+
+bot.reload_extension("cogs.users")
+```
+
+Reloading re-imports only the extension's modules, so only their handlers
+build new injection plans; the container and its APP-scoped dependencies
+are kept. When an extension is unloaded (or replaced by a reload), state
+tied to its modules is released:
+
+- its handlers are no longer tracked for validation and warm-up;
+- ``Cached[T, ttl]`` values whose type is defined in the extension are dropped,
+  otherwise they would keep the old module's classes alive.
+
+If the reload fails, disnake keeps the old module and its handlers are
+tracked again. After a reload, the new handlers are validated against the container and
+missing providers are logged.
+"""
+
+import logging
+
+from typing import Any, List, Optional, Tuple
+
+from dishka_disnake.injector import DependencyCache, forget_handlers, iter_handlers, track_handlers
+from dishka_disnake.setup.warmup import DependencyValidationError, find_missing
+from dishka_disnake.state_management import State
+
+
+__all__ = ("enable_hot_reload", "release_module", "validate_module")
+
+_log = logging.getLogger(__name__)
+
+
+def release_module(name: str) -> int:
+    """
+    Release per-module state of ``name`` and its submodules.
+    Returns the number of released handlers and cached dependencies.
+    """
+    released = forget_handlers(name)
+
+    dependency_cache: Optional[DependencyCache] = State.dependency_cache
+    if dependency_cache is not None:
+        released += dependency_cache.invalidate_module(name)
+
+    return released
+
+
+def validate_module(name: str) -> List[Tuple[str, str, Any]]:
+    """
+    Check only the handlers and cogs of ``name`` against the current container.
+    Returns the dependencies without a provider.
+    """
+    container = State.container
+    if container is None:
+        raise RuntimeError("Container is not initialized, setup dishka first")
+
+    _, missing = find_missing(container, name)
+    return missing
+
+
+def enable_hot_reload(bot: Any, *, validate: bool = True) -> None:
+    """
+    Release module state when ``bot`` unloads an extension and, with ``validate``,
+    check the handlers of reloaded extensions. Call it right after creating the bot.
+    """
+    call_finalizers = bot._call_module_finalizers
+    reload_extension = bot.reload_extension
+
+    def _call_module_finalizers(lib: Any, key: str) -> None:
+        call_finalizers(lib, key)
+        released = release_module(lib.__name__)
+        _log.debug("Released %d cached entries of %s", released, lib.__name__)
+
+    def _reload_extension(name: str, *, package: Optional[str] = None) -> None:
+        module = bot._resolve_name(name, package)
+        previous = [handler for handler, _ in iter_handlers(module)]
+        try:
+            reload_extension(name, package=package)
+        except Exception:
+            # disnake puts the old module back: drop what the failed import
+            # managed to decorate and track the old handlers again
+            forget_handlers(module)
+            track_handlers(previous)
+            raise
+
+        if not validate or State.container is None:
+            return
+
+        missing = validate_module(module)
+        if missing:
+            _log.error("%s", DependencyValidationError(missing))
+
+    bot._call_module_finalizers = _call_module_finalizers
+    bot.reload_extension = _reload_extension
@@ -0,0 +1,264 @@
+"""
+Fair scheduling of injected handlers between guilds.
+
+```py
+from dishka_disnake import setup_dishka
+from dishka_disnake.scheduling import FairScheduler
+
+setup_dishka(container, scheduler=FairScheduler(per_guild=4, global_limit=64))
+```
+
+At most ``per_guild`` handlers of one guild and ``global_limit`` handlers in total
+run at once. Others wait in a queue per guild, and freed slots are handed to the
+waiting guilds in turn, so one busy guild can't starve the others.
+Every slash command, context menu, component and modal callback goes through it.
+"""
+
+import asyncio
+import time
+
+from collections import OrderedDict, deque
+from functools import wraps
+from typing import Any, Callable, Coroutine, Deque, Dict, Hashable, Optional, Tuple, TypeVar
+
+from dishka_disnake.base.interaction import find_interaction
+from dishka_disnake.state_management import State
+
+
+__all__ = ("FairScheduler", "GuildQueueStats", "SchedulerStats", "guild_key", "scheduling_wrapper")
+
+R = TypeVar("R")
+
+
+def guild_key(interaction: Any) -> Hashable:
+    """Guild of ``interaction``; interactions outside guilds are scheduled per user."""
+    guild_id = interaction.guild_id
+    if guild_id is not None:
+        return guild_id
+    return ("user", interaction.author.id)
+
+
+class GuildQueueStats:
+    __slots__ = ("depth", "running", "queued", "wait_time", "max_wait")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.running = 0
+        self.queued = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.wait_time / self.queued if self.queued else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "depth": self.depth,
+            "running": self.running,
+            "queued": self.queued,
+            "mean_wait": self.mean_wait,
+            "max_wait": self.max_wait,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<GuildQueueStats depth={self.depth} running={self.running} "
+            f"queued={self.queued} max_wait={self.max_wait * 1000:.1f}ms>"
+        )
+
+
+class SchedulerStats:
+    __slots__ = ("running", "started", "queued", "guilds", "maxsize")
+
+    def __init__(self, maxsize: int) -> None:
+        self.running = 0
+        self.started = 0
+        self.queued = 0
+        self.maxsize = maxsize
+        self.guilds: "OrderedDict[Hashable, GuildQueueStats]" = OrderedDict()
+
+    def guild(self, key: Hashable) -> GuildQueueStats:
+        stats = self.guilds.get(key)
+        if stats is None:
+            stats = self.guilds[key] = GuildQueueStats()
+            # forget idle guilds first
+            while len(self.guilds) > self.maxsize:
+                idle = next(
+                    (k for k, s in self.guilds.items() if not s.depth and not s.running),
+                    None,
+                )
+                if idle is None:
+                    break
+                del self.guilds[idle]
+        else:
+            self.guilds.move_to_end(key)
+        return stats
+
+    def busiest(self, count: int = 10) -> list:
+        return sorted(
+            ((key, stats.as_dict()) for key, stats in self.guilds.items()),
+            key=lambda item: (item[1]["depth"], item[1]["max_wait"]),
+            reverse=True,
+        )[:count]
+
+    def as_dict(self) -> dict:
+        return {
+            "running": self.running,
+            "started": self.started,
+            "queued": self.queued,
+            "waiting": sum(stats.depth for stats in self.guilds.values()),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<SchedulerStats running={self.running} started={self.started} "
+            f"queued={self.queued} guilds={len(self.guilds)}>"
+        )
+
+
+class FairScheduler:
+    """
+    Limits concurrent handlers per guild (``per_guild``) and in total (``global_limit``),
+    serving queued guilds round-robin. ``key`` maps an interaction to its queue.
+    Per-guild statistics are kept for at most ``stats_size`` guilds.
+    """
+
+    def __init__(
+        self,
+        *,
+        per_guild: int = 4,
+        global_limit: int = 64,
+        key: Callable[[Any], Hashable] = guild_key,
+        stats_size: int = 10000,
+    ) -> None:
+        if per_guild <= 0 or global_limit <= 0:
+            raise ValueError("per_guild and global_limit must be positive")
+
+        self.per_guild = per_guild
+        self.global_limit = global_limit
+        self.key = key
+        self.stats = SchedulerStats(stats_size)
+
+        self._running: Dict[Hashable, int] = {}
+        self._queues: Dict[Hashable, Deque[Tuple["asyncio.Future[None]", float]]] = {}
+        # guilds with queued work, in serving order
+        self._ring: Deque[Hashable] = deque()
+
+    def _can_start(self, key: Hashable) -> bool:
+        return (
+            self.stats.running < self.global_limit
+            and self._running.get(key, 0) < self.per_guild
+        )
+
+    def _start(self, key: Hashable) -> None:
+        self._running[key] = self._running.get(key, 0) + 1
+        self.stats.running += 1
+        self.stats.started += 1
+        self.stats.guild(key).running += 1
+
+    async def acquire(self, key: Hashable) -> None:
+        if key not in self._queues and self._can_start(key):
+            self._start(key)
+            return
+
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+            self._ring.append(key)
+        entry = (waiter, time.monotonic())
+        queue.append(entry)
+
+        guild_stats = self.stats.guild(key)
+        guild_stats.depth += 1
+        self.stats.queued += 1
+
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # granted while being cancelled
+                self.release(key)
+            else:
+                self._forget(key, entry)
+            raise
+
+    def _forget(self, key: Hashable, entry: Tuple["asyncio.Future[None]", float]) -> None:
+        queue = self._queues.get(key)
+        try:
+            queue.remove(entry)  # type: ignore[union-attr]
+        except (AttributeError, ValueError):
+            # already popped and skipped by _dispatch
+            return
+        self.stats.guild(key).depth -= 1
+        if not queue:
+            self._ring.remove(key)
+            del self._queues[key]
+
+    def release(self, key: Hashable) -> None:
+        running = self._running[key] - 1
+        if running:
+            self._running[key] = running
+        else:
+            del self._running[key]
+        self.stats.running -= 1
+        self.stats.guild(key).running -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        # one waiter per guild per turn, until no guild can start anything
+        idle_turns = 0
+        while self._ring and idle_turns < len(self._ring) and self.stats.running < self.global_limit:
+            key = self._ring[0]
+            queue = self._queues[key]
+
+            self._ring.rotate(-1)
+            if self._running.get(key, 0) >= self.per_guild:
+                idle_turns += 1
+                continue
+
+            idle_turns = 0
+            waiter, enqueued = queue.popleft()
+            if not queue:
+                self._ring.remove(key)
+                del self._queues[key]
+
+            guild_stats = self.stats.guild(key)
+            guild_stats.depth -= 1
+            if waiter.done():
+                # cancelled while queued, its slot goes to the next waiter
+                continue
+
+            waited = time.monotonic() - enqueued
+            guild_stats.queued += 1
+            guild_stats.wait_time += waited
+            guild_stats.max_wait = max(guild_stats.max_wait, waited)
+
+            self._start(key)
+            waiter.set_result(None)
+
+
+def scheduling_wrapper(
+    func: Callable[..., Coroutine[Any, Any, R]],
+) -> Callable[..., Coroutine[Any, Any, R]]:
+    """Run ``func`` through the scheduler passed to ``setup_dishka``, if any."""
+
+    @wraps(func)
+    async def scheduled_wrapper(*args, **kwargs):
+        scheduler: Optional[FairScheduler] = State.scheduler
+        if scheduler is None:
+            return await func(*args, **kwargs)
+
+        interaction = find_interaction(args, kwargs)
+        if interaction is None:
+            return await func(*args, **kwargs)
+
+        key = scheduler.key(interaction)
+        await scheduler.acquire(key)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            scheduler.release(key)
+
+    return scheduled_wrapper
@@ -1,11 +1,126 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Mapping, Optional
+
 from dishka import AsyncContainer
 
+if TYPE_CHECKING:
+    from disnake import Interaction
+
+    from dishka_disnake.admission import AdmissionController
+    from dishka_disnake.breaker import CircuitBreaker
+    from dishka_disnake.metrics import Metrics
+    from dishka_disnake.profiling import DependencyProfiler
+    from dishka_disnake.profiling.sampling import HandlerSampler
+    from dishka_disnake.shutdown import ShutdownCoordinator
+    from dishka_disnake.tracing import Tracer
+    from dishka_disnake.watchdog import Watchdog
+    from dishka_disnake.scheduling import FairScheduler
+
+from dishka_disnake.injector.cached import DependencyCache
 from dishka_disnake.state_management import State
+from dishka_disnake.state_management.router import ContainerRouter, shard_key
+from dishka_disnake.setup.warmup import warmup_dishka, WarmupReport, DependencyValidationError
+
 
+__all__ = [
+    "setup_dishka",
+    "warmup_dishka",
+    "WarmupReport",
+    "DependencyValidationError",
+    "ContainerRouter",
+    "shard_key",
+]
 
-def setup_dishka(container: AsyncContainer) -> None:
+
+def setup_dishka(
+    container: Optional[AsyncContainer] = None,
+    *,
+    container_factory: Optional[Callable[[Hashable], AsyncContainer]] = None,
+    partition_key: Callable[[Interaction], Hashable] = shard_key,
+    dependency_cache_size: int = 256,
+    admission: Optional[AdmissionController] = None,
+    scheduler: Optional[FairScheduler] = None,
+    breakers: Optional[Mapping[Any, CircuitBreaker]] = None,
+    resolve_timeout: Optional[float] = None,
+    dependency_timeouts: Optional[Mapping[Any, Optional[float]]] = None,
+    profiler: Optional[DependencyProfiler] = None,
+    sampler: Optional[HandlerSampler] = None,
+    metrics: Optional[Metrics] = None,
+    tracer: Optional[Tracer] = None,
+    watchdog: Optional[Watchdog] = None,
+    shutdown: Optional[ShutdownCoordinator] = None,
+) -> None:
     """
     Setup dishka for disnake
+
+    `admission` delays or rejects handlers by their `priority` while the event loop lags
+    or too many handlers are running, see `AdmissionController`.
+
+    `scheduler` limits concurrent handlers per guild and in total and serves
+    queued guilds in turn, see `FairScheduler`.
+
+    `breakers` maps dependency types to a `CircuitBreaker`: while a provider keeps failing,
+    its dependency fails at once (or resolves its fallback) instead of waiting for it.
+
+    `resolve_timeout` limits how long resolving one dependency may take, in seconds.
+    `dependency_timeouts` overrides it per dependency type and `@resolve_timeout` per handler.
+    On timeout the request scope is closed and `DependencyTimeoutError` is raised.
+
+    `profiler` times every factory call of the container(s), see `DependencyProfiler`.
+    `sampler` runs a sample of the invocations of enabled handlers under a profiler,
+    see `HandlerSampler`.
+    `metrics` counts and times every injected handler for Prometheus, see `Metrics`.
+    `tracer` receives spans of every interaction, its scope, resolutions and handler call,
+    see `dishka_disnake.tracing`.
+    `watchdog` is started here (or by the first handler when no loop runs yet) and reports
+    scopes left open and event loop lag, see `Watchdog`.
+    `shutdown` tracks running handlers so they can be drained before the containers
+    are closed, see `ShutdownCoordinator`.
+
+    `dependency_cache_size` bounds how many `Cached[T, ttl]` values (per type and container) are kept at once.
+    Call `warmup_dishka` once cogs are loaded to validate handlers and create APP dependencies.
+
+    With `container_factory`, every interaction is served by the container of its
+    partition: `partition_key(interaction)` (shard id by default) is passed to the
+    factory once, the container is reused afterwards. `container` then is only used
+    where no interaction is available (cog attributes, warm-up, plain `inject` calls)
+    and defaults to the container of partition `0`.
     """
+    if profiler is not None:
+        if container is not None:
+            profiler.install(container)
+        if container_factory is not None:
+            factory = container_factory
+
+            def container_factory(key: Hashable) -> AsyncContainer:
+                return profiler.install(factory(key))
+
+    router = None
+    if container_factory is not None:
+        router = ContainerRouter(container_factory, partition_key)
+        if container is None:
+            container = router.for_key(0)
+
+    if container is None:
+        raise TypeError("setup_dishka() requires a container or a container_factory")
+    if resolve_timeout is not None and resolve_timeout <= 0:
+        raise ValueError("resolve_timeout must be positive")
+
     State.container = container
     State.sync_container = container
+    State.container_router = router
+    State.dependency_cache = DependencyCache(maxsize=dependency_cache_size)
+    State.admission = admission
+    State.scheduler = scheduler
+    State.breakers = dict(breakers) if breakers else None
+    State.resolve_timeout = resolve_timeout
+    State.dependency_timeouts = dict(dependency_timeouts) if dependency_timeouts else None
+    State.profiler = profiler
+    State.sampler = sampler
+    State.metrics = metrics
+    State.tracer = tracer
+    State.watchdog = watchdog
+    State.shutdown = shutdown
+    if watchdog is not None:
+        watchdog.start()
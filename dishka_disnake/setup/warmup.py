@@ -0,0 +1,203 @@
+import logging
+import time
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from dishka import DEFAULT_COMPONENT, AsyncContainer
+from dishka.entities.factory_type import FactoryType
+from dishka.entities.key import DependencyKey
+from dishka.registry import Registry
+
+from dishka_disnake.injector import iter_handlers
+from dishka_disnake.state_management import State
+
+
+__all__ = ("warmup_dishka", "find_missing", "WarmupReport", "DependencyValidationError")
+
+_log = logging.getLogger(__name__)
+
+# factories that actually build something worth creating ahead of time
+_CREATING = (
+    FactoryType.FACTORY,
+    FactoryType.ASYNC_FACTORY,
+    FactoryType.GENERATOR,
+    FactoryType.ASYNC_GENERATOR,
+)
+
+
+class DependencyValidationError(RuntimeError):
+    """Raised when injected handlers request types the container can't provide."""
+
+    def __init__(self, missing: List[Tuple[str, str, Any]]) -> None:
+        self.missing = missing
+        lines = "\n".join(
+            f"  {owner}: {name}: {dep_type!r}" for owner, name, dep_type in missing
+        )
+        super().__init__(f"No provider found for {len(missing)} dependencies:\n{lines}")
+
+
+class WarmupReport:
+    """Result of :func:`warmup_dishka`."""
+
+    def __init__(self) -> None:
+        self.checked = 0
+        self.missing: List[Tuple[str, str, Any]] = []
+        self.timings: Dict[Any, float] = {}
+        self.errors: Dict[Any, BaseException] = {}
+        self.total = 0.0
+
+    def slowest(self, count: int = 10) -> List[Tuple[Any, float]]:
+        return sorted(self.timings.items(), key=lambda item: item[1], reverse=True)[:count]
+
+    def __str__(self) -> str:
+        lines = [
+            f"dishka warm-up: {len(self.timings)} APP dependencies in {self.total * 1000:.1f}ms, "
+            f"{self.checked} handler dependencies checked, {len(self.missing)} missing"
+        ]
+        for dep_type, elapsed in self.slowest(len(self.timings)):
+            lines.append(f"  {elapsed * 1000:9.2f}ms  {dep_type!r}")
+        for dep_type, error in self.errors.items():
+            lines.append(f"  failed     {dep_type!r}: {error!r}")
+        return "\n".join(lines)
+
+
+def _registries(container: AsyncContainer) -> Iterator[Registry]:
+    root = container
+    while root.parent_container is not None:
+        root = root.parent_container
+
+    registry: Optional[Registry] = root.registry
+    while registry is not None:
+        yield registry
+        registry = registry.child_registry
+
+
+def _is_resolvable(container: AsyncContainer, dep_type: Any) -> bool:
+    key = DependencyKey(dep_type, DEFAULT_COMPONENT)
+    return any(registry.get_factory(key) is not None for registry in _registries(container))
+
+
+def _iter_dependencies(module: Optional[str] = None) -> Iterator[Tuple[str, str, Any]]:
+    from dishka_disnake.commands.cog import Cog
+
+    for handler, plan in iter_handlers(module):
+        for dependency in plan:
+            yield handler.__qualname__, dependency.name, dependency.type
+        for injected_check in getattr(handler, "__dishka_checks__", ()):
+            for dependency in injected_check.plan:
+                yield injected_check.name, dependency.name, dependency.type
+
+    cogs = list(Cog.__subclasses__())
+    while cogs:
+        cog = cogs.pop()
+        cogs.extend(cog.__subclasses__())
+        if module is not None and not (
+            cog.__module__ == module or cog.__module__.startswith(module + ".")
+        ):
+            continue
+        for name, dep_type in cog._dishka_dependencies():
+            yield cog.__qualname__, name, dep_type
+
+
+def find_missing(
+    container: AsyncContainer,
+    module: Optional[str] = None,
+) -> Tuple[int, List[Tuple[str, str, Any]]]:
+    """
+    Check handler and cog dependencies, only those of ``module`` if given.
+    Returns the number of checked dependencies and the ones without a provider.
+    """
+    checked = 0
+    missing = []
+    seen = set()
+    for owner, name, dep_type in _iter_dependencies(module):
+        checked += 1
+        if dep_type in seen:
+            continue
+        if _is_resolvable(container, dep_type):
+            seen.add(dep_type)
+        else:
+            missing.append((owner, name, dep_type))
+    return checked, missing
+
+
+def _creation_order(keys: List[DependencyKey], factories: Dict[DependencyKey, Any]) -> List[DependencyKey]:
+    # dependencies first, so each timing only covers its own factory
+    wanted = set(keys)
+    ordered: List[DependencyKey] = []
+    visited = set()
+
+    def visit(key: DependencyKey) -> None:
+        if key in visited or key not in wanted:
+            return
+        visited.add(key)
+        factory = factories[key]
+        for dependency in (*factory.dependencies, *factory.kw_dependencies.values()):
+            visit(dependency)
+        ordered.append(key)
+
+    for key in keys:
+        visit(key)
+    return ordered
+
+
+async def _create(container: AsyncContainer, key: DependencyKey, report: WarmupReport) -> None:
+    started = time.perf_counter()
+    try:
+        await container.get(key.type_hint, key.component)
+    except Exception as exc:
+        report.errors[key.type_hint] = exc
+    finally:
+        report.timings[key.type_hint] = time.perf_counter() - started
+
+
+async def warmup_dishka(
+    container: Optional[AsyncContainer] = None,
+    *,
+    validate: bool = True,
+    create: bool = True,
+) -> WarmupReport:
+    """
+    Validate injected handlers and pre-create APP-scoped dependencies.
+
+    Call it after cogs/extensions are loaded and before the bot connects,
+    so the first interactions don't pay for creating pools and sessions
+    and missing providers are reported at startup instead of in a command.
+
+    `validate` raises `DependencyValidationError` listing every handler
+    parameter whose type has no provider.
+    `create` resolves every APP-scoped factory, dependencies first,
+    and records how long each one took.
+    """
+    container = container or State.container
+    if container is None:
+        raise RuntimeError("Container is not initialized, setup dishka first")
+
+    report = WarmupReport()
+    started = time.perf_counter()
+
+    if validate:
+        report.checked, report.missing = find_missing(container)
+        if report.missing:
+            raise DependencyValidationError(report.missing)
+
+    if create:
+        factories = container.registry.factories
+        keys = [
+            key
+            for key, factory in factories.items()
+            if factory.type in _CREATING
+            and key.depth == 0
+            and key != container.registry.container_key
+        ]
+        # one at a time: dishka creates them under the container lock anyway,
+        # concurrent calls would only add the time spent waiting for it
+        for key in _creation_order(keys, factories):
+            await _create(container, key, report)
+
+    report.total = time.perf_counter() - started
+    _log.info("%s", report)
+    for dep_type, error in report.errors.items():
+        _log.warning("Failed to warm up %r", dep_type, exc_info=error)
+
+    return report
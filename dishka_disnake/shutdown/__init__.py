@@ -0,0 +1,199 @@
+"""
+Graceful shutdown: stop taking interactions, let running handlers finish,
+then close the containers.
+
+```py
+from dishka_disnake import setup_dishka
+from dishka_disnake.shutdown import ShutdownCoordinator
+
+shutdown = ShutdownCoordinator(deadline=20)
+setup_dishka(container, shutdown=shutdown)
+shutdown.attach(bot)
+
+...
+await bot.close()  # drains handlers, disconnects, then closes the containers
+```
+
+Once draining starts, new injected calls get an ephemeral ``message`` instead of
+running (calls nested in a running handler still run). Running handlers have
+``deadline`` seconds to finish; the ones still running then are cancelled, which
+runs the finalizers of their request scopes, and waited for up to
+``cancel_timeout`` seconds. Finally the APP containers are closed, which runs
+their finalizers in reverse order of creation, so dependencies outlive their
+dependents.
+"""
+
+import asyncio
+import logging
+import time
+
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from dishka import AsyncContainer
+
+from dishka_disnake.base.interaction import reject_interaction
+from dishka_disnake.state_management import State
+
+
+__all__ = ("ShutdownCoordinator", "ShutdownReport")
+
+_log = logging.getLogger(__name__)
+
+# set while an injected handler runs in this task, nested calls are always admitted
+_running: ContextVar[bool] = ContextVar("dishka_disnake_running", default=False)
+
+_Invocation = Tuple["asyncio.Task[Any]", Token]
+
+
+class ShutdownReport:
+    __slots__ = ("drained", "cancelled", "unfinished", "containers", "elapsed")
+
+    def __init__(self) -> None:
+        self.drained = 0
+        self.cancelled = 0
+        self.unfinished = 0
+        self.containers = 0
+        self.elapsed = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "drained": self.drained,
+            "cancelled": self.cancelled,
+            "unfinished": self.unfinished,
+            "containers": self.containers,
+            "elapsed": self.elapsed,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<ShutdownReport drained={self.drained} cancelled={self.cancelled} "
+            f"unfinished={self.unfinished} elapsed={self.elapsed:.1f}s>"
+        )
+
+
+class ShutdownCoordinator:
+    """
+    Tracks running injected handlers and shuts them down within ``deadline`` seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        deadline: float = 30.0,
+        cancel_timeout: float = 5.0,
+        message: str = "The bot is restarting, please try again in a moment.",
+    ) -> None:
+        self.deadline = deadline
+        self.cancel_timeout = cancel_timeout
+        self.message = message
+        self.closing = False
+        self.rejected = 0
+        self.report: Optional[ShutdownReport] = None
+
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+        self._idle: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> int:
+        return len(self._tasks)
+
+    def admits(self) -> bool:
+        return not self.closing or _running.get()
+
+    def enter(self) -> Optional[_Invocation]:
+        """Track the calling handler; ``None`` for calls nested in a tracked one."""
+        if _running.get():
+            return None
+        task = asyncio.current_task()
+        if task is None:
+            return None
+        self._tasks.add(task)
+        return task, _running.set(True)
+
+    def exit(self, invocation: _Invocation) -> None:
+        task, token = invocation
+        _running.reset(token)
+        self._tasks.discard(task)
+        if not self._tasks and self._idle is not None:
+            self._idle.set()
+
+    async def reject(self, interaction: Any) -> None:
+        self.rejected += 1
+        await reject_interaction(interaction, self.message)
+
+    async def drain(self) -> ShutdownReport:
+        """Stop admitting handlers and wait for the running ones, cancelling them after ``deadline``."""
+        report = self.report = ShutdownReport()
+        started = time.monotonic()
+        self.closing = True
+
+        running = len(self._tasks)
+        if running:
+            _log.info("Waiting up to %.1fs for %d running handlers", self.deadline, running)
+            self._idle = asyncio.Event()
+            try:
+                await asyncio.wait_for(self._idle.wait(), self.deadline)
+            except asyncio.TimeoutError:
+                pass
+
+        remaining = [task for task in self._tasks if not task.done()]
+        report.drained = running - len(remaining)
+        if remaining:
+            _log.warning("Cancelling %d handlers still running after %.1fs", len(remaining), self.deadline)
+            for task in remaining:
+                task.cancel()
+            # cancellation exits their scopes, running the scope finalizers
+            _, pending = await asyncio.wait(remaining, timeout=self.cancel_timeout)
+            report.cancelled = len(remaining) - len(pending)
+            report.unfinished = len(pending)
+
+        report.elapsed = time.monotonic() - started
+        return report
+
+    async def close_containers(self) -> int:
+        """Close the APP containers passed to ``setup_dishka`` and stop background tasks."""
+        containers: Dict[int, AsyncContainer] = {}
+        if State.container is not None:
+            containers[id(State.container)] = State.container
+        if State.container_router is not None:
+            for container in State.container_router.containers.values():
+                containers[id(container)] = container
+
+        for helper in (State.admission, State.watchdog):
+            if helper is not None:
+                await helper.close()
+
+        errors: List[BaseException] = []
+        for container in containers.values():
+            try:
+                await container.close()
+            except Exception as exc:
+                errors.append(exc)
+                _log.exception("Failed to close %r", container)
+
+        if self.report is not None:
+            self.report.containers = len(containers) - len(errors)
+        return len(containers) - len(errors)
+
+    async def shutdown(self) -> ShutdownReport:
+        """:meth:`drain` then :meth:`close_containers`."""
+        report = await self.drain()
+        await self.close_containers()
+        return report
+
+    def attach(self, bot: Any) -> None:
+        """
+        Make ``bot.close()`` drain the handlers before disconnecting, so they can still
+        respond, and close the containers afterwards.
+        """
+        close = bot.close
+
+        async def _close() -> None:
+            if not self.closing:
+                report = await self.drain()
+                _log.info("Drained handlers: %r", report)
+            await close()
+            await self.close_containers()
+
+        bot.close = _close
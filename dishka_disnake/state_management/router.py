@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Iterable
+
+from dishka import AsyncContainer
+
+if TYPE_CHECKING:
+    from disnake import Interaction
+
+
+__all__ = ("ContainerRouter", "shard_key")
+
+
+def shard_key(interaction: Interaction) -> int:
+    """
+    Shard id that received ``interaction``; DMs belong to shard 0.
+    """
+    guild_id = interaction.guild_id
+    if guild_id is None:
+        return 0
+
+    shard_count = getattr(interaction.client, "shard_count", None) or 1
+    return (guild_id >> 22) % shard_count
+
+
+class ContainerRouter:
+    """
+    Selects a container per interaction.
+
+    ``partition_key`` maps an interaction to a hashable key (shard id by default),
+    ``factory`` builds the container for a key the first time it is seen.
+    Afterwards the lookup is a single dict access.
+
+    Example:
+        setup_dishka(
+            container_factory=lambda shard_group: make_async_container(DbProvider(pool_size=10)),
+            partition_key=lambda inter: shard_key(inter) // 4,  # 4 shards per container
+        )
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Hashable], AsyncContainer],
+        partition_key: Callable[[Interaction], Hashable] = shard_key,
+    ) -> None:
+        self.factory = factory
+        self.partition_key = partition_key
+        self.containers: Dict[Hashable, AsyncContainer] = {}
+
+    def get(self, interaction: Interaction) -> AsyncContainer:
+        return self.for_key(self.partition_key(interaction))
+
+    def for_key(self, key: Hashable) -> AsyncContainer:
+        container = self.containers.get(key)
+        if container is None:
+            container = self.containers[key] = self.factory(key)
+        return container
+
+    def preload(self, keys: Iterable[Hashable]) -> None:
+        """Create containers for ``keys`` ahead of the first interaction."""
+        for key in keys:
+            self.for_key(key)
+
+    async def close(self) -> None:
+        """Close every container created so far."""
+        containers, self.containers = self.containers, {}
+        for container in containers.values():
+            await container.close()
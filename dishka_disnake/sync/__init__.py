@@ -0,0 +1,227 @@
+"""
+Skip application command sync when the registered commands didn't change.
+
+```py
+from dishka_disnake.sync import enable_sync_cache
+
+bot = InteractionBot(...)
+enable_sync_cache(bot, ".command_sync.json")
+```
+
+disnake fetches the commands of every scope (global and each guild from `guild_ids`)
+on startup and diffs them against the code. With the cache, a hash of every scope's
+command payloads is stored together with the commands Discord returned after the
+last successful sync. On the next start, unchanged scopes are restored from the
+file without any request and only changed scopes are fetched and synced.
+
+The file reflects what *this* host synced last: delete it to force a full sync,
+e.g. if commands were edited by another deployment.
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from typing import Any, Dict, List, Optional, Union
+
+from disnake import Client
+from disnake.app_commands import application_command_factory
+from disnake.ext.commands.interaction_bot_base import _app_commands_diff
+
+
+__all__ = ("CommandSyncCache", "command_hashes", "enable_sync_cache")
+
+_log = logging.getLogger(__name__)
+
+GLOBAL_SCOPE = "global"
+
+
+def _dump(payload: Any) -> str:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def command_hashes(bot: Any) -> Dict[str, str]:
+    """Stable hash of the command payloads registered for each scope."""
+    global_cmds, guild_cmds = bot._ordered_unsynced_commands(bot._test_guilds)
+
+    scopes = {GLOBAL_SCOPE: global_cmds}
+    scopes.update({str(guild_id): cmds for guild_id, cmds in guild_cmds.items()})
+
+    return {
+        scope: hashlib.sha256(
+            _dump(sorted((cmd.to_dict() for cmd in cmds), key=_dump)).encode()
+        ).hexdigest()
+        for scope, cmds in scopes.items()
+    }
+
+
+def _unsynced_scopes(bot: Any) -> List[str]:
+    """
+    Scopes whose commands still differ from the ones Discord returned,
+    i.e. whose overwrite failed during the last sync.
+    """
+    flags = bot._command_sync_flags
+    connection = bot._connection
+    global_cmds, guild_cmds = bot._ordered_unsynced_commands(bot._test_guilds)
+
+    scopes = {GLOBAL_SCOPE: (global_cmds, connection._global_application_commands)}
+    scopes.update({
+        str(guild_id): (cmds, connection._guild_application_commands.get(guild_id, {}))
+        for guild_id, cmds in guild_cmds.items()
+    })
+
+    unsynced = []
+    for scope, (commands, registered) in scopes.items():
+        diff = _app_commands_diff(commands, registered.values())
+        if diff["upsert"] or diff["edit"] or (flags.allow_command_deletion and diff["delete"]):
+            unsynced.append(scope)
+    return unsynced
+
+
+def _snapshot(command: Any) -> Dict[str, Any]:
+    data: Dict[str, Any] = dict(command.to_dict())
+    data["id"] = str(command.id)
+    data["application_id"] = str(command.application_id)
+    data["guild_id"] = str(command.guild_id) if command.guild_id is not None else None
+    data["version"] = str(command.version)
+    return data
+
+
+class CommandSyncCache:
+    """Command hashes and synced commands persisted in a JSON file."""
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+        self.application_id: Optional[int] = None
+        self.hashes: Dict[str, str] = {}
+        self.commands: Dict[str, List[Dict[str, Any]]] = {}
+
+    def load(self, application_id: Optional[int]) -> None:
+        self.application_id = application_id
+        self.hashes, self.commands = {}, {}
+
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            _log.warning("Ignoring unreadable command sync cache %s: %s", self.path, exc)
+            return
+
+        # a cache of another application is useless
+        if data.get("application_id") != application_id:
+            return
+
+        self.hashes = data.get("hashes", {})
+        self.commands = data.get("commands", {})
+
+    def save(self) -> None:
+        data = {
+            "application_id": self.application_id,
+            "hashes": self.hashes,
+            "commands": self.commands,
+        }
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(tmp, self.path)
+
+    def unchanged(self, current: Dict[str, str]) -> List[str]:
+        return [
+            scope
+            for scope, digest in current.items()
+            if self.hashes.get(scope) == digest and scope in self.commands
+        ]
+
+    def restore(self, bot: Any, scope: str) -> None:
+        commands = [application_command_factory(data) for data in self.commands[scope]]
+        cache = {command.id: command for command in commands}
+
+        if scope == GLOBAL_SCOPE:
+            bot._connection._global_application_commands = cache
+        elif cache:
+            bot._connection._guild_application_commands[int(scope)] = cache
+
+    def remember(self, bot: Any, current: Dict[str, str]) -> None:
+        connection = bot._connection
+        for scope, digest in current.items():
+            if scope == GLOBAL_SCOPE:
+                commands = connection._global_application_commands.values()
+            else:
+                commands = connection._guild_application_commands.get(int(scope), {}).values()
+            self.hashes[scope] = digest
+            self.commands[scope] = [_snapshot(command) for command in commands]
+
+
+def enable_sync_cache(
+    bot: Client,
+    path: Union[str, "os.PathLike[str]"] = ".dishka_disnake_sync.json",
+) -> CommandSyncCache:
+    """
+    Make ``bot`` skip fetching and syncing command scopes that didn't change
+    since the last successful sync. Call it right after creating the bot.
+    """
+    cache = CommandSyncCache(path)
+    original_sync = bot._sync_application_commands  # type: ignore[attr-defined]
+
+    async def _cache_application_commands() -> None:
+        cache.load(bot.application_id)
+        current = command_hashes(bot)
+
+        unchanged = set(cache.unchanged(current))
+        for scope in unchanged:
+            cache.restore(bot, scope)
+
+        changed = [scope for scope in current if scope not in unchanged]
+        _log.info(
+            "Command sync cache: %d scopes unchanged, fetching %d",
+            len(unchanged),
+            len(changed),
+        )
+
+        for scope in changed:
+            try:
+                if scope == GLOBAL_SCOPE:
+                    commands = await bot.fetch_global_commands(with_localizations=True)
+                    bot._connection._global_application_commands = {
+                        command.id: command for command in commands
+                    }
+                else:
+                    commands = await bot.fetch_guild_commands(int(scope), with_localizations=True)
+                    if commands:
+                        bot._connection._guild_application_commands[int(scope)] = {
+                            command.id: command for command in commands
+                        }
+            except Exception as exc:
+                _log.debug("Failed to fetch commands of scope %s: %s", scope, exc)
+
+    async def _sync_application_commands() -> None:
+        flags = bot._command_sync_flags  # type: ignore[attr-defined]
+        if not flags._sync_enabled:
+            return await original_sync()
+
+        current = command_hashes(bot)
+        if cache.application_id == bot.application_id and len(cache.unchanged(current)) == len(current):
+            _log.info("Command sync cache: nothing changed, skipping sync")
+            return
+
+        await original_sync()
+
+        # disnake only warns about failed overwrites: those scopes keep their
+        # old hashes so the next start fetches and syncs them again
+        failed = set(_unsynced_scopes(bot))
+        synced = {
+            scope: digest
+            for scope, digest in current.items()
+            if scope not in failed
+            and (flags.sync_global_commands if scope == GLOBAL_SCOPE else flags.sync_guild_commands)
+        }
+        cache.application_id = bot.application_id
+        cache.remember(bot, synced)
+        cache.save()
+
+    bot._cache_application_commands = _cache_application_commands  # type: ignore[attr-defined]
+    bot._sync_application_commands = _sync_application_commands  # type: ignore[attr-defined]
+    return cache
@@ -0,0 +1,524 @@
+"""
+Synthetic interactions and a load generator for injected handlers, without a
+Discord connection.
+
+```py
+from dishka_disnake.testing import LoadTest
+
+load = LoadTest(bot)
+report = await load.slash(shop, options={"item": "sword"}, sub="buy", total=10_000, rate=500, concurrency=50)
+report = await load.button(view, view.children[0], total=5_000, users=200)
+report = await load.modal(FeedbackModal, {"feedback": "great"}, total=1_000)
+print(report)  # <LoadReport 10000/10000 ok 498.7/s p50=1.92ms p95=4.10ms p99=7.33ms scopes=10000>
+
+inter = load.factory.slash("ping", {"count": 3})  # a single interaction, for unit tests
+await ping.invoke(inter)
+inter.response.sent  # [("send_message", "pong", {...})]
+```
+
+Interactions are real ``ApplicationCommandInteraction``/``MessageInteraction``/
+``ModalInteraction`` objects built from gateway payloads. Their ``response`` and
+``followup`` record what the handler sends instead of calling the API; other HTTP
+calls (``edit_original_response``, fetching members...) are not supported.
+
+They go through the same paths as the bot's: ``InvokableSlashCommand.invoke``
+(checks, cooldowns, hooks, option conversion), the view's item dispatch
+(``interaction_check``, ``on_error``) and the modal's. With a ``rate``, calls are
+started on schedule whatever the concurrency and their latency is measured from
+the scheduled time, so queueing behind ``concurrency`` shows in the percentiles.
+
+Scopes are counted with :class:`.Metrics`: the one passed to ``setup_dishka``
+or, without it, one installed for the duration of the run.
+"""
+
+import asyncio
+import itertools
+import math
+import time
+
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+
+from disnake import (
+    ApplicationCommandInteraction,
+    Interaction,
+    InteractionResponded,
+    InteractionResponse,
+    InteractionResponseType,
+    MessageInteraction,
+    ModalInteraction,
+    ui,
+)
+from disnake.ext import commands
+from disnake.utils import MISSING, time_snowflake
+
+from dishka_disnake.metrics import Metrics
+from dishka_disnake.state_management import State
+
+
+__all__ = (
+    "InteractionFactory",
+    "LoadReport",
+    "LoadTest",
+    "RecordingFollowup",
+    "RecordingResponse",
+)
+
+_USER_ID = 100_000
+_GUILD_ID = 200_000
+_CHANNEL_ID = 300_000
+
+# discord option types
+_SUB_COMMAND = 1
+_OPTION_TYPES = ((bool, 5), (int, 4), (float, 10), (str, 3))
+
+
+def _without_missing(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in kwargs.items() if value is not MISSING}
+
+
+class RecordingResponse(InteractionResponse):
+    """Response that records its calls in :attr:`sent` instead of sending them."""
+
+    __slots__ = ("sent",)
+
+    def __init__(self, parent: Interaction) -> None:
+        super().__init__(parent)
+        self.sent: List[Tuple[str, Any, Dict[str, Any]]] = []
+
+    def _respond(self, kind: str, response_type: InteractionResponseType, content: Any, kwargs: Dict[str, Any]) -> None:
+        if self._response_type is not None:
+            raise InteractionResponded(self._parent)
+        self.sent.append((kind, content, _without_missing(kwargs)))
+        self._response_type = response_type
+
+    async def send_message(self, content: Optional[str] = None, **kwargs: Any) -> None:
+        self._respond("send_message", InteractionResponseType.channel_message, content, kwargs)
+
+    async def defer(self, **kwargs: Any) -> None:
+        with_message = kwargs.get("with_message", MISSING)
+        if isinstance(self._parent, ApplicationCommandInteraction) or with_message is True:
+            response_type = InteractionResponseType.deferred_channel_message
+        else:
+            response_type = InteractionResponseType.deferred_message_update
+        self._respond("defer", response_type, None, kwargs)
+
+    async def edit_message(self, content: Optional[str] = None, **kwargs: Any) -> None:
+        self._respond("edit_message", InteractionResponseType.message_update, content, kwargs)
+
+    async def send_modal(self, modal: Any = None, **kwargs: Any) -> None:
+        self._respond("send_modal", InteractionResponseType.modal, modal, kwargs)
+
+    async def autocomplete(self, *, choices: Any) -> None:
+        self._respond(
+            "autocomplete", InteractionResponseType.application_command_autocomplete_result, choices, {}
+        )
+
+
+class RecordingFollowup:
+    """Stands for the followup webhook, recording sent, edited and deleted messages."""
+
+    __slots__ = ("sent",)
+
+    def __init__(self) -> None:
+        self.sent: List[Tuple[str, Any, Dict[str, Any]]] = []
+
+    async def send(self, content: Optional[str] = None, **kwargs: Any) -> None:
+        self.sent.append(("send", content, _without_missing(kwargs)))
+
+    async def edit_message(self, message_id: int, **kwargs: Any) -> None:
+        self.sent.append(("edit_message", message_id, _without_missing(kwargs)))
+
+    async def delete_message(self, message_id: int, **kwargs: Any) -> None:
+        self.sent.append(("delete_message", message_id, _without_missing(kwargs)))
+
+
+def _options(values: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    options = []
+    for name, value in values.items():
+        for python_type, option_type in _OPTION_TYPES:
+            if isinstance(value, python_type):
+                break
+        else:
+            raise TypeError(f"Unsupported value for option {name!r}: {value!r}")
+        options.append({"name": name, "type": option_type, "value": value})
+    return options
+
+
+class InteractionFactory:
+    """
+    Builds interactions for ``bot``; without one, an :class:`~disnake.ext.commands.InteractionBot`
+    that never connects is created.
+    """
+
+    def __init__(self, bot: Optional[Any] = None) -> None:
+        self.bot = bot if bot is not None else commands.InteractionBot()
+        self._ids = itertools.count(time_snowflake(datetime.now(timezone.utc)))
+
+    def _payload(self, interaction_type: int, guild_id: Optional[int], user_id: int) -> Dict[str, Any]:
+        user = {
+            "id": str(user_id),
+            "username": f"user{user_id}",
+            "discriminator": "0",
+            "avatar": None,
+            "global_name": None,
+        }
+        payload: Dict[str, Any] = {
+            "id": str(next(self._ids)),
+            "type": interaction_type,
+            "application_id": str(self.bot.application_id or 1),
+            "token": "dishka-disnake-testing",
+            "version": 1,
+            "locale": "en-US",
+            "channel": {"id": str(_CHANNEL_ID), "type": 0 if guild_id else 1},
+            "channel_id": str(_CHANNEL_ID),
+            "attachment_size_limit": 10_485_760,
+        }
+        if guild_id:
+            payload["guild_id"] = str(guild_id)
+            payload["member"] = {
+                "user": user,
+                "roles": [],
+                "joined_at": "2020-01-01T00:00:00+00:00",
+                "deaf": False,
+                "mute": False,
+                "flags": 0,
+                "permissions": "0",
+            }
+        else:
+            payload["user"] = user
+        return payload
+
+    def _record(self, interaction: Any) -> Any:
+        interaction._cs_response = RecordingResponse(interaction)
+        interaction._cs_followup = RecordingFollowup()
+        return interaction
+
+    def slash(
+        self,
+        name: str,
+        options: Optional[Mapping[str, Any]] = None,
+        *,
+        sub: Optional[str] = None,
+        guild_id: Optional[int] = _GUILD_ID,
+        user_id: int = _USER_ID,
+    ) -> ApplicationCommandInteraction:
+        """
+        Slash command ``name`` with ``options`` (``str``, ``int``, ``float`` or ``bool``).
+        ``sub`` is the subcommand, ``"group sub"`` for one in a group.
+        """
+        option_list = _options(options or {})
+        for part in reversed(sub.split() if sub else []):
+            option_list = [{"name": part, "type": _SUB_COMMAND, "options": option_list}]
+
+        payload = self._payload(2, guild_id, user_id)
+        payload["data"] = {"id": str(next(self._ids)), "name": name, "type": 1, "options": option_list}
+        return self._record(ApplicationCommandInteraction(data=payload, state=self.bot._connection))
+
+    def button(
+        self,
+        custom_id: str,
+        *,
+        guild_id: Optional[int] = _GUILD_ID,
+        user_id: int = _USER_ID,
+    ) -> MessageInteraction:
+        """Click on the button ``custom_id`` of a message sent by the bot."""
+        payload = self._payload(3, guild_id, user_id)
+        payload["data"] = {"custom_id": custom_id, "component_type": 2}
+        payload["message"] = {
+            "id": str(next(self._ids)),
+            "channel_id": str(_CHANNEL_ID),
+            "author": {"id": payload["application_id"], "username": "bot", "discriminator": "0", "avatar": None},
+            "content": "",
+            "timestamp": "2020-01-01T00:00:00+00:00",
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+            "type": 0,
+            "components": [],
+        }
+        return self._record(MessageInteraction(data=payload, state=self.bot._connection))
+
+    def modal(
+        self,
+        custom_id: str,
+        values: Optional[Mapping[str, str]] = None,
+        *,
+        guild_id: Optional[int] = _GUILD_ID,
+        user_id: int = _USER_ID,
+    ) -> ModalInteraction:
+        """Submission of the modal ``custom_id`` with text input ``values`` by custom id."""
+        payload = self._payload(5, guild_id, user_id)
+        payload["data"] = {
+            "custom_id": custom_id,
+            "components": [
+                {"type": 1, "components": [{"type": 4, "custom_id": key, "value": value}]}
+                for key, value in (values or {}).items()
+            ],
+        }
+        return self._record(ModalInteraction(data=payload, state=self.bot._connection))
+
+
+def _percentile(ordered: List[float], percent: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(len(ordered) * percent / 100) - 1)]
+
+
+class LoadReport:
+    __slots__ = (
+        "total",
+        "completed",
+        "errors",
+        "error_types",
+        "responded",
+        "scopes",
+        "elapsed",
+        "latencies",
+    )
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.completed = 0
+        self.errors = 0
+        self.error_types: Counter = Counter()
+        self.responded = 0
+        self.scopes = 0
+        self.elapsed = 0.0
+        self.latencies: List[float] = []
+
+    @property
+    def throughput(self) -> float:
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Latency in seconds under which ``percent`` of the calls completed."""
+        return _percentile(sorted(self.latencies), percent)
+
+    def as_dict(self) -> dict:
+        ordered = sorted(self.latencies)
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "errors": self.errors,
+            "error_types": dict(self.error_types),
+            "responded": self.responded,
+            "scopes": self.scopes,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+            "p50": _percentile(ordered, 50),
+            "p95": _percentile(ordered, 95),
+            "p99": _percentile(ordered, 99),
+            "max": ordered[-1] if ordered else 0.0,
+        }
+
+    def __repr__(self) -> str:
+        ordered = sorted(self.latencies)
+        return (
+            f"<LoadReport {self.completed - self.errors}/{self.total} ok {self.throughput:.1f}/s "
+            f"p50={_percentile(ordered, 50) * 1000:.2f}ms p95={_percentile(ordered, 95) * 1000:.2f}ms "
+            f"p99={_percentile(ordered, 99) * 1000:.2f}ms scopes={self.scopes}>"
+        )
+
+
+# builds the i-th interaction, then dispatches it and returns the error it failed with, if any
+_Make = Callable[[int], Any]
+_Dispatch = Callable[[Any], Awaitable[Optional[BaseException]]]
+
+
+class LoadTest:
+    """
+    Runs interactions built by :attr:`factory` through commands, views and modals.
+
+    Every run takes ``total`` calls, started at ``rate`` per second (as fast as
+    possible if ``None``) with at most ``concurrency`` running at once, after
+    ``warmup`` calls that are not measured. Calls come from ``users`` distinct
+    users spread over ``guilds`` guilds.
+    """
+
+    def __init__(self, bot: Optional[Any] = None) -> None:
+        self.factory = InteractionFactory(bot)
+
+    async def slash(
+        self,
+        command: commands.InvokableSlashCommand,
+        options: Optional[Mapping[str, Any]] = None,
+        *,
+        sub: Optional[str] = None,
+        **run: Any,
+    ) -> LoadReport:
+        """Invoke ``command`` (or its subcommand ``sub``) with ``options``."""
+
+        def make(i: int, guild_id: Optional[int], user_id: int) -> ApplicationCommandInteraction:
+            return self.factory.slash(command.name, options, sub=sub, guild_id=guild_id, user_id=user_id)
+
+        async def dispatch(interaction: ApplicationCommandInteraction) -> Optional[BaseException]:
+            try:
+                await command.invoke(interaction)
+            except commands.CommandError as exc:
+                return exc.original if isinstance(exc, commands.CommandInvokeError) else exc
+            return None
+
+        return await self.run(make, dispatch, **run)
+
+    async def button(self, view: ui.View, item: ui.Button, **run: Any) -> LoadReport:
+        """Click ``item`` of ``view``; errors are those passed to ``view.on_error``."""
+        if item not in view.children:
+            raise ValueError(f"{item!r} is not in {view!r}")
+
+        def make(i: int, guild_id: Optional[int], user_id: int) -> MessageInteraction:
+            return self.factory.button(item.custom_id, guild_id=guild_id, user_id=user_id)  # type: ignore[arg-type]
+
+        async def dispatch(interaction: MessageInteraction) -> Optional[BaseException]:
+            errors: List[BaseException] = []
+            on_error = view.on_error
+
+            async def record(error: Exception, item: Any, interaction: Any) -> None:
+                errors.append(error)
+
+            # `on_error` is looked up on every dispatch, an instance attribute shadows the method
+            view.on_error = record  # type: ignore[method-assign]
+            try:
+                await view._scheduled_task(item, interaction)
+            finally:
+                view.on_error = on_error  # type: ignore[method-assign]
+            return errors[0] if errors else None
+
+        return await self.run(make, dispatch, **run)
+
+    async def modal(
+        self,
+        modal: Callable[[], ui.Modal],
+        values: Optional[Mapping[str, str]] = None,
+        **run: Any,
+    ) -> LoadReport:
+        """
+        Submit a modal created by ``modal`` (a fresh one per call, modals are single use)
+        with text input ``values``; errors are those passed to ``on_error``.
+        """
+
+        def make(i: int, guild_id: Optional[int], user_id: int) -> Tuple[ui.Modal, ModalInteraction]:
+            instance = modal()
+            return instance, self.factory.modal(
+                instance.custom_id, values, guild_id=guild_id, user_id=user_id
+            )
+
+        async def dispatch(pair: Tuple[ui.Modal, ModalInteraction]) -> Optional[BaseException]:
+            instance, interaction = pair
+            errors: List[BaseException] = []
+
+            async def record(error: Exception, interaction: Any) -> None:
+                errors.append(error)
+
+            instance.on_error = record  # type: ignore[method-assign]
+            await instance._scheduled_task(interaction)
+            # unanswered modals restart their timeout, they are never shown again here
+            instance._stop_listening()
+            return errors[0] if errors else None
+
+        return await self.run(make, dispatch, interaction=lambda pair: pair[1], **run)
+
+    async def run(
+        self,
+        make: Callable[[int, Optional[int], int], Any],
+        dispatch: _Dispatch,
+        *,
+        total: int = 1000,
+        rate: Optional[float] = None,
+        concurrency: int = 10,
+        warmup: int = 0,
+        users: int = 1,
+        guilds: int = 1,
+        interaction: Callable[[Any], Interaction] = lambda made: made,
+    ) -> LoadReport:
+        """
+        Dispatch ``total`` items built by ``make(i, guild_id, user_id)`` with ``dispatch``,
+        which returns the error a call failed with. ``interaction`` gets the interaction
+        out of an item.
+        """
+        if total <= 0 or concurrency <= 0 or users <= 0 or guilds <= 0:
+            raise ValueError("total, concurrency, users and guilds must be positive")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+
+        def build(i: int) -> Any:
+            return make(i, _GUILD_ID + i % guilds, _USER_ID + i % users)
+
+        installed = State.metrics is None
+        if installed:
+            State.metrics = Metrics()
+        metrics: Metrics = State.metrics
+        try:
+            for i in range(warmup):
+                await dispatch(build(i))
+
+            scopes_before = _scopes(metrics)
+            report = await self._measure(build, dispatch, interaction, total, rate, concurrency)
+            report.scopes = _scopes(metrics) - scopes_before
+        finally:
+            if installed:
+                State.metrics = None
+        return report
+
+    async def _measure(
+        self,
+        build: _Make,
+        dispatch: _Dispatch,
+        interaction: Callable[[Any], Interaction],
+        total: int,
+        rate: Optional[float],
+        concurrency: int,
+    ) -> LoadReport:
+        report = LoadReport()
+        report.total = total
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = set()
+
+        async def call(item: Any, scheduled: float, acquired: bool) -> None:
+            if not acquired:
+                await semaphore.acquire()
+            try:
+                error = await dispatch(item)
+            except Exception as exc:
+                error = exc
+            finally:
+                semaphore.release()
+            report.latencies.append(time.perf_counter() - scheduled)
+            report.completed += 1
+            if error is not None:
+                report.errors += 1
+                report.error_types[type(error).__name__] += 1
+            if interaction(item).response.is_done():
+                report.responded += 1
+
+        started = time.perf_counter()
+        for i in range(total):
+            item = build(i)
+            if rate is None:
+                # closed loop: wait for a free slot, latency starts once it is taken
+                await semaphore.acquire()
+                scheduled = time.perf_counter()
+            else:
+                scheduled = started + i / rate
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            task = asyncio.create_task(call(item, scheduled, rate is None))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        if tasks:
+            await asyncio.wait(tasks)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+
+def _scopes(metrics: Metrics) -> int:
+    return sum(series.value for series in list(metrics.scopes.series.values()))
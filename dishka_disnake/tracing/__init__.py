@@ -0,0 +1,223 @@
+"""
+Tracing spans around the phases of injected handlers.
+
+```py
+from dishka_disnake import setup_dishka
+from dishka_disnake.tracing import InMemoryTracer, OpenTelemetryTracer
+
+setup_dishka(container, tracer=OpenTelemetryTracer(opentelemetry.trace.get_tracer("mybot")))
+
+tracer = InMemoryTracer()  # in tests
+setup_dishka(container, tracer=tracer)
+...
+assert [span.name for span in tracer.finished()] == [
+    "dishka.resolve", "dishka.handler", "dishka.scope", "dishka.interaction",
+]
+```
+
+Every call of an injected handler produces:
+
+- ``dishka.interaction``: the whole call, with the handler's qualified name, the
+  interaction kind, command name or custom id, guild and user;
+- ``dishka.scope``: from entering the request scope to leaving it;
+- ``dishka.resolve``: one per dependency, with its type, inside the scope span;
+- ``dishka.handler``: the handler itself.
+
+Anything implementing :class:`Tracer` can receive them. Without a tracer
+(the default) the injector skips all of it.
+"""
+
+import time
+
+from typing import Any, Awaitable, Dict, List, Mapping, Optional, Protocol, TypeVar
+
+from dishka_disnake.base.interaction import interaction_attributes
+
+
+__all__ = (
+    "InMemoryTracer",
+    "OpenTelemetryTracer",
+    "RecordedSpan",
+    "Span",
+    "Tracer",
+    "handler_attributes",
+    "traced",
+)
+
+T = TypeVar("T")
+
+
+class Span(Protocol):
+    def set_attribute(self, key: str, value: Any) -> None: ...
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """Finish the span, failed with ``error`` if given."""
+
+
+class Tracer(Protocol):
+    def start_span(
+        self,
+        name: str,
+        attributes: Mapping[str, Any],
+        parent: Optional[Span] = None,
+    ) -> Span: ...
+
+
+def handler_attributes(handler: str, interaction: Any) -> Dict[str, Any]:
+    """Attributes of the ``dishka.interaction`` span."""
+    attributes: Dict[str, Any] = {"dishka.handler": handler}
+    for key, value in interaction_attributes(interaction).items():
+        attributes[f"discord.{key}"] = value
+    return attributes
+
+
+async def traced(
+    tracer: Tracer,
+    parent: Optional[Span],
+    name: str,
+    attributes: Mapping[str, Any],
+    awaitable: Awaitable[T],
+) -> T:
+    """Await ``awaitable`` inside a span named ``name``."""
+    span = tracer.start_span(name, attributes, parent)
+    try:
+        result = await awaitable
+    except BaseException as exc:
+        span.end(exc)
+        raise
+    span.end()
+    return result
+
+
+class RecordedSpan:
+    __slots__ = ("name", "attributes", "parent", "start", "finish", "error")
+
+    def __init__(
+        self,
+        name: str,
+        attributes: Mapping[str, Any],
+        parent: Optional["RecordedSpan"],
+    ) -> None:
+        self.name = name
+        self.attributes = dict(attributes)
+        self.parent = parent
+        self.start = time.perf_counter()
+        self.finish: Optional[float] = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        return None if self.finish is None else self.finish - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        self.finish = time.perf_counter()
+        self.error = error
+
+    def __repr__(self) -> str:
+        state = "open" if self.finish is None else f"{self.duration * 1000:.2f}ms"  # type: ignore[operator]
+        failed = f" error={type(self.error).__name__}" if self.error is not None else ""
+        return f"<RecordedSpan {self.name} {state}{failed}>"
+
+
+class InMemoryTracer:
+    """Keeps every started span in :attr:`spans`, for tests and debugging."""
+
+    def __init__(self) -> None:
+        self.spans: List[RecordedSpan] = []
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Mapping[str, Any],
+        parent: Optional[Span] = None,
+    ) -> RecordedSpan:
+        span = RecordedSpan(name, attributes, parent)  # type: ignore[arg-type]
+        self.spans.append(span)
+        return span
+
+    def finished(self, name: Optional[str] = None) -> List[RecordedSpan]:
+        """Ended spans in the order they ended, optionally only those named ``name``."""
+        spans = [
+            span for span in self.spans
+            if span.finish is not None and (name is None or span.name == name)
+        ]
+        spans.sort(key=lambda span: span.finish)  # type: ignore[arg-type, return-value]
+        return spans
+
+    def children(self, span: RecordedSpan) -> List[RecordedSpan]:
+        return [child for child in self.spans if child.parent is span]
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+class _OpenTelemetrySpan:
+    __slots__ = ("span", "token")
+
+    def __init__(self, span: Any, token: Any) -> None:
+        self.span = span
+        self.token = token  # of the context the span was made current in
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.span.set_attribute(key, _otel_value(value))
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        if error is not None:
+            from opentelemetry.trace import Status, StatusCode
+
+            self.span.record_exception(error)
+            self.span.set_status(Status(StatusCode.ERROR, f"{type(error).__name__}: {error}"))
+        self.span.end()
+        if self.token is not None:
+            from opentelemetry import context
+
+            # spans end in the reverse order they started, in the task they started in
+            context.detach(self.token)
+            self.token = None
+
+
+def _otel_value(value: Any) -> Any:
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
+
+
+class OpenTelemetryTracer:
+    """
+    Sends the spans to an OpenTelemetry ``tracer`` (``opentelemetry-api`` must be installed).
+    Root spans are children of the span current when the handler is called, if any.
+    Each span is the current one until it ends, so spans started by providers and
+    handlers, or by instrumented libraries they call, are its children.
+    """
+
+    def __init__(self, tracer: Any) -> None:
+        try:
+            from opentelemetry import context, trace
+        except ImportError as exc:
+            raise ImportError(
+                "OpenTelemetryTracer requires the opentelemetry-api package"
+            ) from exc
+
+        self.tracer = tracer
+        self._context = context
+        self._trace = trace
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Mapping[str, Any],
+        parent: Optional[Span] = None,
+    ) -> _OpenTelemetrySpan:
+        context = None
+        if isinstance(parent, _OpenTelemetrySpan):
+            context = self._trace.set_span_in_context(parent.span)
+        span = self.tracer.start_span(
+            name,
+            context=context,
+            attributes={key: _otel_value(value) for key, value in attributes.items()},
+        )
+        token = self._context.attach(self._trace.set_span_in_context(span))
+        return _OpenTelemetrySpan(span, token)
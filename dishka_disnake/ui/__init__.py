@@ -1,19 +1,24 @@
-from dishka_disnake.ui.button import button, Button
-from dishka_disnake.ui.modal import Modal
-from dishka_disnake.ui.select import (
-    channel_select,
-    mentionable_select,
-    role_select,
-    string_select,
-    user_select,
-    select,
-    ChannelSelect,
-    MentionableSelect,
-    RoleSelect,
-    StringSelect,
-    UserSelect,
-    Select,
-)
+from typing import TYPE_CHECKING
+
+from dishka_disnake.base.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from dishka_disnake.ui.button import button, Button
+    from dishka_disnake.ui.modal import Modal
+    from dishka_disnake.ui.select import (
+        channel_select,
+        mentionable_select,
+        role_select,
+        string_select,
+        user_select,
+        select,
+        ChannelSelect,
+        MentionableSelect,
+        RoleSelect,
+        StringSelect,
+        UserSelect,
+        Select,
+    )
 
 __all__ = (
     "button",
@@ -32,3 +37,13 @@ __all__ = (
     "select",
     "Modal",
 )
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "dishka_disnake.ui.button": ("button", "Button"),
+    "dishka_disnake.ui.modal": ("Modal",),
+    "dishka_disnake.ui.select.channel": ("ChannelSelect", "channel_select"),
+    "dishka_disnake.ui.select.mentionable": ("MentionableSelect", "mentionable_select"),
+    "dishka_disnake.ui.select.string": ("StringSelect", "string_select", "select", "Select"),
+    "dishka_disnake.ui.select.role": ("RoleSelect", "role_select"),
+    "dishka_disnake.ui.select.user": ("UserSelect", "user_select"),
+})
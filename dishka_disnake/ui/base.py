@@ -1,5 +1,6 @@
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Optional, TypeVar
 
+from dishka_disnake.admission import Priority
 from dishka_disnake.injector.wrap import wrap_injector
 
 
@@ -9,9 +10,10 @@ T = TypeVar("T")
 class WrappedDishkaComponent(Generic[T]):
     async def callback(self, interaction: T, *args: Any, **kwargs: Any) -> None: ...
 
-    def __init_subclass__(cls, **kwargs: Any):
+    def __init_subclass__(cls, priority: Optional[Priority] = None, **kwargs: Any):
+        # `class MyButton(Button, priority=Priority.LOW)`
         super().__init_subclass__(**kwargs)
 
         cb = cls.__dict__.get("callback")
         if cb is not None:
-            cls.callback = wrap_injector(cb)
+            cls.callback = wrap_injector(cb, priority=priority)
@@ -35,6 +35,7 @@ if TYPE_CHECKING:
 else:
     ParamSpec = TypeVar
 
+from dishka_disnake.admission import Priority
 from dishka_disnake.injector.wrap import wrap_injector
 
 B = TypeVar("B", bound="Button")
@@ -94,6 +95,7 @@ def button(
     emoji: Optional[Union[str, Emoji, PartialEmoji]] = None,
     id: int = 0,
     row: Optional[int] = None,
+    priority: Priority = Priority.NORMAL,
 ) -> Callable[..., DecoratedItem[Button[V_co]]]: ...
 
 
@@ -104,7 +106,10 @@ def button(
 
 
 def button(
-    cls: Callable[..., B_co] = Button[Any], **kwargs: Any
+    cls: Callable[..., B_co] = Button[Any],
+    *,
+    priority: Priority = Priority.NORMAL,
+    **kwargs: Any,
 ) -> Callable[..., DecoratedItem[B_co]]:
     """A decorator that attaches a button to a component with DI support.
 
@@ -151,9 +156,12 @@ def button(
         like to control the relative positioning of the row then passing an index is advised.
         For example, row=1 will show up before row=2. Defaults to ``None``, which is automatic
         ordering. The row number must be between 0 and 4 (i.e. zero indexed).
+    priority: :class:`.Priority`
+        How the callback is admitted while the bot is overloaded,
+        see :class:`.AdmissionController`.
     """
     def decorator(func: ItemCallbackType[V_co, B_co]) -> DecoratedItem[B_co]:
-        func = wrap_injector(func)
+        func = wrap_injector(func, priority=priority)
         return ui.button(cls, **kwargs)(func)
 
     return decorator
@@ -1,8 +1,13 @@
-from dishka_disnake.ui.select.channel import ChannelSelect, channel_select
-from dishka_disnake.ui.select.mentionable import MentionableSelect, mentionable_select
-from dishka_disnake.ui.select.string import StringSelect, string_select, select, Select
-from dishka_disnake.ui.select.role import RoleSelect, role_select
-from dishka_disnake.ui.select.user import UserSelect, user_select
+from typing import TYPE_CHECKING
+
+from dishka_disnake.base.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from dishka_disnake.ui.select.channel import ChannelSelect, channel_select
+    from dishka_disnake.ui.select.mentionable import MentionableSelect, mentionable_select
+    from dishka_disnake.ui.select.string import StringSelect, string_select, select, Select
+    from dishka_disnake.ui.select.role import RoleSelect, role_select
+    from dishka_disnake.ui.select.user import UserSelect, user_select
 
 
 __all__ = (
@@ -19,3 +24,11 @@ __all__ = (
     "UserSelect",
     "user_select",
 )
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "dishka_disnake.ui.select.channel": ("ChannelSelect", "channel_select"),
+    "dishka_disnake.ui.select.mentionable": ("MentionableSelect", "mentionable_select"),
+    "dishka_disnake.ui.select.string": ("StringSelect", "string_select", "select", "Select"),
+    "dishka_disnake.ui.select.role": ("RoleSelect", "role_select"),
+    "dishka_disnake.ui.select.user": ("UserSelect", "user_select"),
+})
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
     from disnake.ui.item import DecoratedItem, ItemCallbackType
 
 from dishka_disnake.ui.base import WrappedDishkaComponent
+from dishka_disnake.admission import Priority
 from dishka_disnake.injector.wrap import wrap_injector
 
 __all__ = (
@@ -101,6 +102,7 @@ def channel_select(
     default_values: Optional[Sequence[SelectDefaultValueInputType[AnyChannel]]] = None,
     id: int = 0,
     row: Optional[int] = None,
+    priority: Priority = Priority.NORMAL,
 ) -> Callable[..., DecoratedItem[ChannelSelect[V_co]]]: ...
 
 
@@ -111,7 +113,10 @@ def channel_select(
 
 
 def channel_select(
-    cls: Callable[..., S_co] = ChannelSelect[Any], **kwargs: Any
+    cls: Callable[..., S_co] = ChannelSelect[Any],
+    *,
+    priority: Priority = Priority.NORMAL,
+    **kwargs: Any,
 ) -> Callable[..., DecoratedItem[S_co]]:
     """A decorator that attaches a channel select menu to a component.
 
@@ -163,10 +168,13 @@ def channel_select(
         like to control the relative positioning of the row then passing an index is advised.
         For example, row=1 will show up before row=2. Defaults to ``None``, which is automatic
         ordering. The row number must be between 0 and 4 (i.e. zero indexed).
+    priority: :class:`.Priority`
+        How the callback is admitted while the bot is overloaded,
+        see :class:`.AdmissionController`.
     """
 
     def decorator(func: ItemCallbackType[V_co, S_co]) -> DecoratedItem[S_co]:
-        func = wrap_injector(func)
+        func = wrap_injector(func, priority=priority)
         return ui.channel_select(cls, **kwargs)(func)
 
     return decorator
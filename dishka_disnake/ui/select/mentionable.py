@@ -25,6 +25,7 @@ from disnake.ui.select.base import (
 if TYPE_CHECKING:
     from disnake.ui.item import DecoratedItem, ItemCallbackType
 
+from dishka_disnake.admission import Priority
 from dishka_disnake.injector.wrap import wrap_injector
 from dishka_disnake.ui.base import WrappedDishkaComponent
 
@@ -103,6 +104,7 @@ def mentionable_select(
     ] = None,
     id: int = 0,
     row: Optional[int] = None,
+    priority: Priority = Priority.NORMAL,
 ) -> Callable[..., DecoratedItem[MentionableSelect[V_co]],
 ]: ...
 
@@ -114,7 +116,10 @@ def mentionable_select(
 
 
 def mentionable_select(
-    cls: Callable[..., S_co] = MentionableSelect[Any], **kwargs: Any
+    cls: Callable[..., S_co] = MentionableSelect[Any],
+    *,
+    priority: Priority = Priority.NORMAL,
+    **kwargs: Any,
 ) -> Callable[..., DecoratedItem[S_co]]:
     """A decorator that attaches a mentionable (user/member/role) select menu to a component.
 
@@ -165,10 +170,13 @@ def mentionable_select(
         like to control the relative positioning of the row then passing an index is advised.
         For example, row=1 will show up before row=2. Defaults to ``None``, which is automatic
         ordering. The row number must be between 0 and 4 (i.e. zero indexed).
+    priority: :class:`.Priority`
+        How the callback is admitted while the bot is overloaded,
+        see :class:`.AdmissionController`.
     """
 
     def decorator(func: ItemCallbackType[V_co, S_co]) -> DecoratedItem[S_co]:
-        func = wrap_injector(func)
+        func = wrap_injector(func, priority=priority)
         return ui.mentionable_select(cls, **kwargs)(func)
 
     return decorator
@@ -18,6 +18,7 @@ from disnake.ui.select.base import P, SelectDefaultValueInputType, V_co
 if TYPE_CHECKING:
     from disnake.ui.item import DecoratedItem, ItemCallbackType
 
+from dishka_disnake.admission import Priority
 from dishka_disnake.injector.wrap import wrap_injector
 from dishka_disnake.ui.base import WrappedDishkaComponent
 
@@ -95,6 +96,7 @@ def role_select(
     default_values: Optional[Sequence[SelectDefaultValueInputType[Role]]] = None,
     id: int = 0,
     row: Optional[int] = None,
+    priority: Priority = Priority.NORMAL,
 ) -> Callable[..., DecoratedItem[RoleSelect[V_co]]]: ...
 
 
@@ -105,7 +107,10 @@ def role_select(
 
 
 def role_select(
-    cls: Callable[..., S_co] = RoleSelect[Any], **kwargs: Any
+    cls: Callable[..., S_co] = RoleSelect[Any],
+    *,
+    priority: Priority = Priority.NORMAL,
+    **kwargs: Any,
 ) -> Callable[..., DecoratedItem[S_co]]:
     """A decorator that attaches a role select menu to a component.
 
@@ -154,10 +159,13 @@ def role_select(
         like to control the relative positioning of the row then passing an index is advised.
         For example, row=1 will show up before row=2. Defaults to ``None``, which is automatic
         ordering. The row number must be between 0 and 4 (i.e. zero indexed).
+    priority: :class:`.Priority`
+        How the callback is admitted while the bot is overloaded,
+        see :class:`.AdmissionController`.
     """
 
     def decorator(func: ItemCallbackType[V_co, S_co]) -> DecoratedItem[S_co]:
-        func = wrap_injector(func)
+        func = wrap_injector(func, priority=priority)
         return ui.role_select(cls, **kwargs)(func)
 
     return decorator
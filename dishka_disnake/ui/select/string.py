@@ -17,6 +17,7 @@ from disnake import MessageInteraction, ui
 from disnake.components import SelectOption
 from disnake.ui.select.base import P, V_co
 
+from dishka_disnake.admission import Priority
 from dishka_disnake.injector.wrap import wrap_injector
 from dishka_disnake.ui.base import WrappedDishkaComponent
 
@@ -110,6 +111,7 @@ def string_select(
     disabled: bool = False,
     id: int = 0,
     row: Optional[int] = None,
+    priority: Priority = Priority.NORMAL,
 ) -> Callable[..., DecoratedItem[StringSelect[V_co]]]: ...
 
 
@@ -120,7 +122,10 @@ def string_select(
 
 
 def string_select(
-    cls: Callable[..., S_co] = StringSelect[Any], **kwargs: Any
+    cls: Callable[..., S_co] = StringSelect[Any],
+    *,
+    priority: Priority = Priority.NORMAL,
+    **kwargs: Any,
 ) -> Callable[..., DecoratedItem[S_co]]:
     """A decorator that attaches a string select menu to a component.
 
@@ -176,10 +181,13 @@ def string_select(
         like to control the relative positioning of the row then passing an index is advised.
         For example, row=1 will show up before row=2. Defaults to ``None``, which is automatic
         ordering. The row number must be between 0 and 4 (i.e. zero indexed).
+    priority: :class:`.Priority`
+        How the callback is admitted while the bot is overloaded,
+        see :class:`.AdmissionController`.
     """
 
     def decorator(func: ItemCallbackType[V_co, S_co]) -> DecoratedItem[S_co]:
-        func = wrap_injector(func)
+        func = wrap_injector(func, priority=priority)
         return ui.string_select(cls, **kwargs)(func)
 
     return decorator
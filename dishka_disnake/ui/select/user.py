@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dishka_disnake.ui.base import WrappedDishkaComponent
+from dishka_disnake.admission import Priority
 from dishka_disnake.injector.wrap import wrap_injector
 
 from typing import (
@@ -99,6 +100,7 @@ def user_select(
     ] = None,
     id: int = 0,
     row: Optional[int] = None,
+    priority: Priority = Priority.NORMAL,
 ) -> Callable[..., DecoratedItem[UserSelect[V_co]]]: ...
 
 
@@ -109,7 +111,10 @@ def user_select(
 
 
 def user_select(
-    cls: Callable[..., S_co] = UserSelect[Any], **kwargs: Any
+    cls: Callable[..., S_co] = UserSelect[Any],
+    *,
+    priority: Priority = Priority.NORMAL,
+    **kwargs: Any,
 ) -> Callable[..., DecoratedItem[S_co]]:
     """A decorator that attaches a user select menu to a component.
 
@@ -158,10 +163,13 @@ def user_select(
         like to control the relative positioning of the row then passing an index is advised.
         For example, row=1 will show up before row=2. Defaults to ``None``, which is automatic
         ordering. The row number must be between 0 and 4 (i.e. zero indexed).
+    priority: :class:`.Priority`
+        How the callback is admitted while the bot is overloaded,
+        see :class:`.AdmissionController`.
     """
 
     def decorator(func: ItemCallbackType[V_co, S_co]) -> DecoratedItem[S_co]:
-        func = wrap_injector(func)
+        func = wrap_injector(func, priority=priority)
         return ui.user_select(cls, **kwargs)(func)
 
     return decorator
@@ -0,0 +1,220 @@
+"""
+Watchdog of request scopes left open and of event loop lag.
+
+```py
+from dishka_disnake import setup_dishka
+from dishka_disnake.watchdog import Watchdog
+
+watchdog = Watchdog(threshold=30, lag_warning=0.5)
+setup_dishka(container, watchdog=watchdog)
+
+watchdog.stats.as_dict()  # open scopes, oldest, stuck, loop lag
+watchdog.stuck()          # scopes open longer than `threshold`, with their await stack
+```
+
+Every scope opened by an injected handler is registered with its handler name
+and start time, and removed once the scope is closed. The loop lag comes from the monitor
+shared with the admission controller; every ``interval`` seconds the watchdog
+also looks for scopes open longer than ``threshold``: each of them is logged
+once, with the chain of awaits its task is suspended in. Registering a scope is one set insertion.
+"""
+
+import asyncio
+import logging
+import os
+import time
+
+from typing import Any, List, Optional, Set
+
+from dishka_disnake.base.lag import LagMonitor, lag_monitor
+
+__all__ = ("OpenScope", "Watchdog", "WatchdogStats", "await_stack")
+
+_log = logging.getLogger(__name__)
+
+
+def await_stack(task: Optional["asyncio.Task[Any]"]) -> List[str]:
+    """Frames ``task`` is suspended in, outermost first, following ``await`` chains."""
+    if task is None:
+        return []
+
+    lines = []
+    awaitable: Any = task.get_coro()
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+        if frame is None:
+            if isinstance(awaitable, asyncio.Future):
+                lines.append(f"<{type(awaitable).__name__} pending>")
+            break
+        code = frame.f_code
+        lines.append(f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+    return lines
+
+
+class OpenScope:
+    __slots__ = ("handler", "started", "task", "reported")
+
+    def __init__(self, handler: str, task: Optional["asyncio.Task[Any]"]) -> None:
+        self.handler = handler
+        self.started = time.monotonic()
+        self.task = task
+        self.reported = False
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.started
+
+    def as_dict(self) -> dict:
+        return {
+            "handler": self.handler,
+            "age": self.age,
+            "stack": await_stack(self.task),
+        }
+
+    def __repr__(self) -> str:
+        return f"<OpenScope {self.handler} age={self.age:.1f}s>"
+
+
+class WatchdogStats:
+    __slots__ = ("open", "oldest", "stuck", "reported", "lag", "max_lag", "lag_warnings")
+
+    def __init__(self) -> None:
+        self.open = 0
+        self.oldest = 0.0
+        self.stuck = 0
+        self.reported = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.lag_warnings = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "open": self.open,
+            "oldest": self.oldest,
+            "stuck": self.stuck,
+            "reported": self.reported,
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+            "lag_warnings": self.lag_warnings,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<WatchdogStats open={self.open} stuck={self.stuck} "
+            f"oldest={self.oldest:.1f}s lag={self.lag * 1000:.1f}ms>"
+        )
+
+
+class Watchdog:
+    """
+    Reports scopes open longer than ``threshold`` seconds and loop lag above
+    ``lag_warning`` seconds, checking every ``interval`` seconds.
+    Checks run on the samples of the shared lag monitor, subscribed to by
+    ``setup_dishka`` or, without a running loop then, by the first injected call.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 30.0,
+        interval: float = 1.0,
+        lag_warning: float = 0.5,
+    ) -> None:
+        if threshold <= 0 or interval <= 0:
+            raise ValueError("threshold and interval must be positive")
+
+        self.threshold = threshold
+        self.interval = interval
+        self.lag_warning = lag_warning
+        self.stats = WatchdogStats()
+        self.scopes: Set[OpenScope] = set()
+        self.closed = False
+
+        self._monitor: Optional[LagMonitor] = None
+        self._checked = 0.0
+
+    def start(self) -> None:
+        """Start checking; does nothing without a running event loop."""
+        if self._monitor is not None and self._monitor.running:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self.closed = False
+        self._checked = time.monotonic()
+        self._monitor = lag_monitor()
+        self._monitor.subscribe(self._on_lag, self.interval)
+
+    async def close(self) -> None:
+        """Stop checking; scopes opened afterwards are still tracked, but not checked."""
+        self.closed = True
+        if self._monitor is not None:
+            await self._monitor.unsubscribe(self._on_lag)
+            self._monitor = None
+
+    def enter(self, handler: str) -> OpenScope:
+        if self._monitor is None and not self.closed:
+            self.start()
+        scope = OpenScope(handler, asyncio.current_task())
+        self.scopes.add(scope)
+        self.stats.open = len(self.scopes)
+        return scope
+
+    def exit(self, scope: OpenScope) -> None:
+        self.scopes.discard(scope)
+        self.stats.open = len(self.scopes)
+        if scope.reported:
+            _log.warning("Scope of %s closed after %.1fs", scope.handler, scope.age)
+
+    def stuck(self) -> List[dict]:
+        """Scopes open longer than ``threshold``, oldest first."""
+        now = time.monotonic()
+        scopes = sorted(
+            (scope for scope in list(self.scopes) if now - scope.started > self.threshold),
+            key=lambda scope: scope.started,
+        )
+        return [scope.as_dict() for scope in scopes]
+
+    def _on_lag(self, lag: float) -> None:
+        self._check_lag(lag)
+        # the monitor samples faster when the admission controller asked for it,
+        # half a sample of slack keeps a sleep woken a bit early from skipping a check
+        now = time.monotonic()
+        if now - self._checked >= self.interval - self._monitor.interval / 2:  # type: ignore[union-attr]
+            self._checked = now
+            self._check_scopes()
+
+    def _check_lag(self, lag: float) -> None:
+        stats = self.stats
+        stats.lag = lag
+        stats.max_lag = max(stats.max_lag, lag)
+        if lag > self.lag_warning:
+            stats.lag_warnings += 1
+            _log.warning(
+                "Event loop lagged %.0fms, %d injected scopes open", lag * 1000, len(self.scopes)
+            )
+
+    def _check_scopes(self) -> None:
+        stats = self.stats
+        now = time.monotonic()
+        oldest = 0.0
+        stuck = 0
+        for scope in list(self.scopes):
+            age = now - scope.started
+            oldest = max(oldest, age)
+            if age <= self.threshold:
+                continue
+            stuck += 1
+            if not scope.reported:
+                scope.reported = True
+                stats.reported += 1
+                _log.warning(
+                    "Scope of %s open for %.1fs, awaiting:\n  %s",
+                    scope.handler,
+                    age,
+                    "\n  ".join(await_stack(scope.task)) or "<no task>",
+                )
+        stats.oldest = oldest
+        stats.stuck = stuck
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from dishka.entities.key import DependencyKey
+from dishka.exceptions import NoFactoryError
+
+from dishka_disnake import breaker as breaker_module
+from dishka_disnake.breaker import BreakerState, CircuitBreaker, CircuitOpenError
+
+
+class Remote:
+    __module__ = "bot.services"
+
+
+class Local:
+    __module__ = "bot.services"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(breaker_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _get(error=None, took=0.0, clock=None):
+    async def get(dep_type):
+        if clock is not None:
+            clock[0] += took
+        if error is not None:
+            raise error
+        return dep_type()
+
+    return get
+
+
+def _call(breaker, get, dep_type=Remote):
+    return asyncio.run(breaker.call(dep_type, get))
+
+
+def test_opens_after_threshold_and_probes_after_reset_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            _call(breaker, _get(RuntimeError("down")))
+    assert breaker.state is BreakerState.OPEN
+
+    with pytest.raises(CircuitOpenError) as info:
+        _call(breaker, _get())
+    assert info.value.retry_after == 10
+    assert breaker.stats.rejected == 1
+
+    # failed probe: open again, for another reset_timeout
+    clock[0] += 10
+    with pytest.raises(RuntimeError):
+        _call(breaker, _get(RuntimeError("still down")))
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.stats.opened == 1
+    with pytest.raises(CircuitOpenError):
+        _call(breaker, _get())
+
+    # successful probe closes it
+    clock[0] += 10
+    assert isinstance(_call(breaker, _get()), Remote)
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.stats.consecutive_failures == 0
+
+
+def test_slow_calls_fail_but_keep_their_value(clock):
+    breaker = CircuitBreaker(failure_threshold=1, slow_call=2.0)
+
+    assert isinstance(_call(breaker, _get(took=3.0, clock=clock)), Remote)
+    assert breaker.stats.slow_calls == 1
+    assert breaker.state is BreakerState.OPEN
+
+
+def test_open_circuit_resolves_fallback(clock):
+    breaker = CircuitBreaker(failure_threshold=1, fallback=Local)
+    with pytest.raises(RuntimeError):
+        _call(breaker, _get(RuntimeError("down")))
+
+    assert isinstance(_call(breaker, _get()), Local)
+    assert breaker.stats.fallbacks == 1
+    assert breaker.stats.rejected == 0
+
+
+def test_missing_provider_is_not_a_failure(clock):
+    breaker = CircuitBreaker(failure_threshold=1)
+    with pytest.raises(NoFactoryError):
+        _call(breaker, _get(NoFactoryError(DependencyKey(Remote, None))))
+
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.stats.failures == 0
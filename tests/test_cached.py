@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from dishka import Provider, Scope, make_async_container, provide
+from disnake import ApplicationCommandInteraction
+
+from dishka_disnake import Cached, inject, setup_dishka
+from dishka_disnake.state_management import State
+from dishka_disnake.testing import InteractionFactory
+
+
+class Shard:
+    __module__ = "bot.services"
+
+    def __init__(self, key):
+        self.key = key
+
+
+def _provider(key):
+    class ShardProvider(Provider):
+        @provide(scope=Scope.REQUEST)
+        def shard(self) -> Shard:
+            return Shard(key)
+
+    return ShardProvider()
+
+
+@pytest.fixture(autouse=True)
+def state():
+    saved = dict(State._store)
+    yield
+    State._store.clear()
+    State._store.update(saved)
+
+
+def test_cached_values_are_kept_per_routed_container():
+    seen = []
+
+    @inject
+    async def handler(inter: ApplicationCommandInteraction, shard: Cached[Shard, 60]):
+        seen.append(shard.key)
+
+    async def main():
+        setup_dishka(
+            container_factory=lambda key: make_async_container(_provider(key)),
+            partition_key=lambda inter: inter.guild_id,
+        )
+        factory = InteractionFactory()
+        for guild_id in (1, 2, 1, 2):
+            await handler(inter=factory.slash("x", guild_id=guild_id))
+
+        assert seen == [1, 2, 1, 2]
+        assert State.dependency_cache.stats.misses == 2
+        assert State.dependency_cache.stats.hits == 2
+        await State.container_router.close()
+
+    asyncio.run(main())
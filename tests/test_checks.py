@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from dishka import Provider, Scope, make_async_container, provide
+from disnake import ApplicationCommandInteraction
+from disnake.ext.commands import CheckFailure
+
+from dishka_disnake import check, inject, setup_dishka
+from dishka_disnake.commands.cache import ResponseCache
+from dishka_disnake.injector.checks import InjectedCheckFailure
+from dishka_disnake.injector.wrap import wrap_injector
+from dishka_disnake.state_management import State
+from dishka_disnake.testing import InteractionFactory
+
+
+class Repo:
+    __module__ = "bot.services"
+
+
+@pytest.fixture(autouse=True)
+def state():
+    saved = dict(State._store)
+    yield
+    State._store.clear()
+    State._store.update(saved)
+
+
+def _run(handler, events, **wrap):
+    class RepoProvider(Provider):
+        @provide(scope=Scope.REQUEST)
+        def repo(self) -> Repo:
+            events.append("repo")
+            return Repo()
+
+    async def main():
+        container = make_async_container(RepoProvider())
+        setup_dishka(container)
+        wrapped = wrap_injector(handler, **wrap) if wrap else inject(handler)
+        try:
+            await wrapped(inter=InteractionFactory().slash("export"))
+        finally:
+            await container.close()
+
+    asyncio.run(main())
+
+
+def _checks(events, allow):
+    def free(inter):
+        events.append("free")
+        return allow.get("free", True)
+
+    def cheap(inter, repo: Repo):
+        events.append("cheap")
+        return allow.get("cheap", True)
+
+    def costly(inter, repo: Repo):
+        events.append("costly")
+        return allow.get("costly", True)
+
+    def decorate(func):
+        # declared out of order: evaluation follows cost, free checks first
+        func = check(costly, cost=10)(func)
+        func = check(free)(func)
+        return check(cheap, cost=1)(func)
+
+    return decorate
+
+
+def test_checks_run_by_cost_in_the_handler_scope():
+    events = []
+
+    @_checks(events, {})
+    async def export(inter: ApplicationCommandInteraction, repo: Repo) -> None:
+        events.append("handler")
+
+    _run(export, events)
+
+    assert events == ["free", "repo", "cheap", "costly", "handler"]
+
+
+def test_failed_free_check_opens_no_scope():
+    events = []
+
+    @_checks(events, {"free": False})
+    async def export(inter: ApplicationCommandInteraction, repo: Repo) -> None:
+        events.append("handler")
+
+    with pytest.raises(CheckFailure) as info:
+        _run(export, events)
+
+    assert isinstance(info.value, InjectedCheckFailure)
+    assert info.value.check.name.endswith("free")
+    assert events == ["free"]
+
+
+def test_failed_scoped_check_skips_the_handler():
+    events = []
+
+    @_checks(events, {"cheap": False})
+    async def export(inter: ApplicationCommandInteraction, repo: Repo) -> None:
+        events.append("handler")
+
+    with pytest.raises(InjectedCheckFailure):
+        _run(export, events)
+
+    assert events == ["free", "repo", "cheap"]
+
+
+def test_checks_in_front_of_a_cache_have_their_own_scope():
+    events = []
+
+    @_checks(events, {})
+    async def export(inter: ApplicationCommandInteraction, repo: Repo) -> None:
+        events.append("handler")
+
+    _run(export, events, cache=ResponseCache(ttl=60))
+
+    assert events == ["free", "repo", "cheap", "costly", "repo", "handler"]
@@ -0,0 +1,121 @@
+import os
+import threading
+
+import pytest
+
+from dishka import Provider, make_async_container
+
+from dishka_disnake.cluster import (
+    ClusterError,
+    ClusterLauncher,
+    FakeGateway,
+    ShardAssignment,
+    split_shards,
+)
+
+
+# factories run in spawned workers: they log their calls to files in this directory
+_LOG_DIR = "DISHKA_DISNAKE_TEST_CLUSTER_DIR"
+
+
+def _log(event, assignment):
+    with open(os.path.join(os.environ[_LOG_DIR], f"{event}-{assignment.worker_id}"), "a") as file:
+        file.write(".")
+
+
+def _count(tmp_path, event, worker_id=0):
+    path = tmp_path / f"{event}-{worker_id}"
+    return len(path.read_text()) if path.exists() else 0
+
+
+def make_container():
+    return make_async_container(Provider())
+
+
+class CrashingBot:
+    def __init__(self, assignment):
+        self.assignment = assignment
+
+    async def start(self, token):
+        _log("start", self.assignment)
+        raise RuntimeError("gateway down")
+
+    async def close(self):
+        pass
+
+
+class FinishingBot(CrashingBot):
+    async def start(self, token):
+        _log("start", self.assignment)
+
+
+class LoggingGateway(FakeGateway):
+    async def start(self, token):
+        _log("start", self.assignment)
+        await super().start(token)
+
+    async def close(self):
+        _log("close", self.assignment)
+        await super().close()
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(_LOG_DIR, str(tmp_path))
+    return tmp_path
+
+
+def _launcher(bot_factory, **kwargs):
+    return ClusterLauncher(
+        bot_factory=bot_factory,
+        container_factory=make_container,
+        token="token",
+        **kwargs,
+    )
+
+
+def test_split_shards():
+    assert split_shards(10, 3) == [
+        ShardAssignment(0, (0, 1, 2, 3), 10),
+        ShardAssignment(1, (4, 5, 6), 10),
+        ShardAssignment(2, (7, 8, 9), 10),
+    ]
+    assert [a.shard_ids for a in split_shards(2, 4)] == [(0,), (1,)]
+    with pytest.raises(ValueError):
+        split_shards(0, 1)
+
+
+def test_crashing_worker_is_restarted_then_stops_the_cluster(log_dir):
+    launcher = _launcher(CrashingBot, shard_count=1, processes=1, max_restarts=2, restart_delay=0.01)
+
+    with pytest.raises(ClusterError, match="Worker 0"):
+        launcher.run()
+
+    assert _count(log_dir, "start") == 3
+
+
+def test_finished_worker_is_not_restarted(log_dir):
+    _launcher(FinishingBot, shard_count=1, processes=1, restart_delay=0.01).run()
+
+    assert _count(log_dir, "start") == 1
+
+
+def test_stop_drains_every_worker(log_dir):
+    launcher = _launcher(LoggingGateway, shard_count=4, processes=2, drain_timeout=30)
+    started = threading.Event()
+
+    def stop_when_started():
+        while not started.wait(0.05):
+            if all(_count(log_dir, "start", worker_id) for worker_id in range(2)):
+                started.set()
+        launcher.stop()
+
+    thread = threading.Thread(target=stop_when_started)
+    thread.start()
+    launcher.run()
+    thread.join()
+
+    for worker_id in range(2):
+        assert _count(log_dir, "start", worker_id) == 1
+        assert _count(log_dir, "close", worker_id) == 1
+    assert all(worker.process.exitcode == 0 for worker in launcher._workers)
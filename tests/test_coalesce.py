@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+from dishka import make_async_container
+from disnake import ApplicationCommandInteraction
+
+from dishka_disnake import setup_dishka
+from dishka_disnake.commands.coalesce import Coalescer, as_coalescer
+from dishka_disnake.injector.wrap import wrap_injector
+from dishka_disnake.state_management import State
+from dishka_disnake.testing import InteractionFactory
+
+
+@pytest.fixture(autouse=True)
+def state():
+    saved = dict(State._store)
+    yield
+    State._store.clear()
+    State._store.update(saved)
+
+
+def _overlapping(handler, coalescer, count=3, before_release=None):
+    """Start ``count`` identical calls, let them reach the coalescer, then release the handler."""
+    events = []
+
+    async def main():
+        release = asyncio.Event()
+        container = make_async_container()
+        setup_dishka(container)
+        wrapped = wrap_injector(handler(events, release), coalesce=coalescer)
+        factory = InteractionFactory()
+        interactions = [factory.slash("status") for _ in range(count)]
+
+        calls = [asyncio.create_task(wrapped(inter=inter)) for inter in interactions]
+        await asyncio.sleep(0)
+        assert len(coalescer) == 1
+        if before_release is not None:
+            before_release(calls)
+            await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        await container.close()
+        # replayed responses pass every option explicitly, compare what was sent
+        return results, [
+            [(kind, content) for kind, content, _ in inter.response.sent] for inter in interactions
+        ]
+
+    results, sent = asyncio.run(main())
+    assert len(coalescer) == 0
+    return events, results, sent
+
+
+def test_followers_reply_with_the_leader_response():
+    def handler(events, release):
+        async def status(inter: ApplicationCommandInteraction) -> None:
+            events.append("run")
+            await release.wait()
+            await inter.response.send_message("all good")
+
+        return status
+
+    coalescer = Coalescer()
+    events, results, sent = _overlapping(handler, coalescer)
+
+    assert events == ["run"]
+    assert results == [None, None, None]
+    assert sent == [[("send_message", "all good")]] * 3
+    assert (coalescer.stats.executions, coalescer.stats.coalesced) == (1, 2)
+
+
+def test_followers_raise_the_leader_exception():
+    def handler(events, release):
+        async def status(inter: ApplicationCommandInteraction) -> None:
+            events.append("run")
+            await release.wait()
+            raise LookupError("no event")
+
+        return status
+
+    events, results, sent = _overlapping(handler, Coalescer())
+
+    assert events == ["run"]
+    assert [type(result) for result in results] == [LookupError] * 3
+    # the very same exception object
+    assert results[1] is results[0] and results[2] is results[0]
+    assert sent == [[], [], []]
+
+
+def test_followers_run_the_handler_when_the_response_cannot_be_replayed():
+    def handler(events, release):
+        async def status(inter: ApplicationCommandInteraction) -> None:
+            events.append("run")
+            await release.wait()
+            # deferred responses are followed up later, they can't be replayed
+            await inter.response.defer()
+
+        return status
+
+    coalescer = Coalescer()
+    events, results, sent = _overlapping(handler, coalescer)
+
+    assert events == ["run"] * 3
+    assert results == [None, None, None]
+    assert all(len(responses) == 1 and responses[0][0] == "defer" for responses in sent)
+    assert (coalescer.stats.executions, coalescer.stats.coalesced) == (1, 2)
+
+
+def test_followers_run_the_handler_when_the_leader_is_cancelled():
+    def handler(events, release):
+        async def status(inter: ApplicationCommandInteraction) -> None:
+            events.append("run")
+            await release.wait()
+            await inter.response.send_message("all good")
+
+        return status
+
+    def cancel_leader(calls):
+        calls[0].cancel()
+
+    events, results, sent = _overlapping(handler, Coalescer(), before_release=cancel_leader)
+
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == [None, None]
+    assert events == ["run"] * 3
+    assert sent == [[], [("send_message", "all good")], [("send_message", "all good")]]
+
+
+def test_cancelled_follower_leaves_the_leader_running():
+    def handler(events, release):
+        async def status(inter: ApplicationCommandInteraction) -> None:
+            events.append("run")
+            await release.wait()
+            await inter.response.send_message("all good")
+
+        return status
+
+    def cancel_follower(calls):
+        calls[1].cancel()
+
+    events, results, sent = _overlapping(handler, Coalescer(), before_release=cancel_follower)
+
+    assert events == ["run"]
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert results[0] is None and results[2] is None
+    assert sent[1] == []
+
+
+def test_coalesce_true_creates_a_coalescer_per_command():
+    first, second = as_coalescer(True), as_coalescer(True)
+    assert isinstance(first, Coalescer) and first is not second
+
+    shared = Coalescer(scope="guild")
+    assert as_coalescer(shared) is shared
+    assert as_coalescer(False) is None and as_coalescer(None) is None
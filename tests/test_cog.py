@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from dishka import FromDishka, Provider, Scope, make_async_container, provide
+from disnake import ApplicationCommandInteraction
+from disnake.ext import commands
+
+from dishka_disnake.commands import Cog, slash_command
+from dishka_disnake.state_management import State
+from dishka_disnake.testing import InteractionFactory
+
+
+class Repo:
+    __module__ = "bot.services"
+
+
+class SlowProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def repo(self) -> Repo:
+        await asyncio.sleep(0.05)
+        return Repo()
+
+
+class UsersCog(Cog):
+    repo: FromDishka[Repo]
+
+    def __init__(self) -> None:
+        self.seen = []
+
+    @slash_command(name="profile")
+    async def profile(self, inter: ApplicationCommandInteraction) -> None:
+        self.seen.append(self.repo)
+        await inter.response.send_message("ok")
+
+
+@pytest.fixture(autouse=True)
+def state():
+    saved = dict(State._store)
+    yield
+    State._store.clear()
+    State._store.update(saved)
+
+
+def test_interaction_right_after_add_cog_waits_for_dependencies():
+    async def main():
+        State.container = make_async_container(SlowProvider())
+        bot = commands.InteractionBot()
+        cog = UsersCog()
+        bot.add_cog(cog)
+
+        inter = InteractionFactory(bot).slash("profile")
+        await bot.get_slash_command("profile").invoke(inter)
+
+        assert len(cog.seen) == 1 and isinstance(cog.seen[0], Repo)
+        assert inter.response.sent[0][1] == "ok"
+        await State.container.close()
+
+    asyncio.run(main())
+
+
+def test_failed_resolution_is_raised_by_commands():
+    async def main():
+        State.container = make_async_container(Provider())
+        bot = commands.InteractionBot()
+        cog = UsersCog()
+        bot.add_cog(cog)
+
+        inter = InteractionFactory(bot).slash("profile")
+        with pytest.raises(Exception) as info:
+            await bot.get_slash_command("profile").invoke(inter)
+        assert not isinstance(getattr(info.value, "original", info.value), AttributeError)
+        assert cog.seen == []
+        await State.container.close()
+
+    asyncio.run(main())
@@ -0,0 +1,29 @@
+import json
+import subprocess
+import sys
+
+
+def _modules_after(code):
+    script = code + "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_importing_the_package_does_not_import_disnake_or_subpackages():
+    modules = _modules_after("import dishka_disnake")
+
+    assert "disnake" not in modules
+    assert "dishka" not in modules
+    assert [m for m in modules if m.startswith("dishka_disnake")] == [
+        "dishka_disnake",
+        "dishka_disnake.base",
+        "dishka_disnake.base.lazy",
+    ]
+
+
+def test_exports_import_their_submodule_on_first_access():
+    modules = _modules_after("import dishka_disnake\ndishka_disnake.inject")
+
+    assert "dishka_disnake.injector" in modules
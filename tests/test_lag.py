@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+import pytest
+
+from dishka_disnake.admission import AdmissionController
+from dishka_disnake.state_management import State
+from dishka_disnake.watchdog import Watchdog
+
+
+@pytest.fixture(autouse=True)
+def state():
+    saved = dict(State._store)
+    yield
+    State._store.clear()
+    State._store.update(saved)
+
+
+def _monitor_tasks():
+    return [task for task in asyncio.all_tasks() if task.get_name().startswith("dishka-disnake")]
+
+
+def test_watchdog_and_admission_share_one_lag_monitor():
+    async def main():
+        watchdog = Watchdog(interval=0.05, lag_warning=10)
+        admission = AdmissionController(interval=0.02)
+        watchdog.start()
+        admission.start()
+
+        [task] = _monitor_tasks()
+        assert task.get_name() == "dishka-disnake: lag monitor"
+
+        await asyncio.sleep(0.03)  # the monitor now sleeps for the shorter interval
+        time.sleep(0.15)  # blocks the loop
+        await asyncio.sleep(0.05)
+
+        assert watchdog.stats.max_lag > 0.1
+        assert admission.stats.lag == watchdog.stats.lag == State.lag_monitor.lag
+
+        await watchdog.close()
+        assert _monitor_tasks() == [task]
+        await admission.close()
+        assert _monitor_tasks() == []
+
+    asyncio.run(main())
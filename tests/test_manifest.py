@@ -0,0 +1,111 @@
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+from disnake.ext import commands
+
+from dishka_disnake.manifest import load_manifest, write_manifest
+from dishka_disnake.testing import InteractionFactory
+
+
+EXTENSION = """
+from disnake.ext import commands
+
+calls = []
+
+
+class Ping(commands.Cog):
+    @commands.slash_command(name="ping", description="ping")
+    async def ping(self, inter):
+        calls.append(inter)
+        await inter.response.send_message("pong")
+
+
+def setup(bot):
+    bot.add_cog(Ping())
+"""
+
+
+@pytest.fixture
+def extension(tmp_path, monkeypatch):
+    name = f"lazy_ext_{id(tmp_path)}"
+    path = tmp_path / f"{name}.py"
+    path.write_text(textwrap.dedent(EXTENSION))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name, path
+    sys.modules.pop(name, None)
+
+
+def _bot(hooks):
+    bot = commands.InteractionBot()
+
+    @bot.before_slash_command_invoke
+    async def before(inter):
+        hooks.append("before")
+
+    @bot.after_slash_command_invoke
+    async def after(inter):
+        hooks.append("after")
+
+    def check(inter):
+        hooks.append("check")
+        return True
+
+    @bot.listen("on_slash_command")
+    async def on_slash_command(inter):
+        hooks.append("event")
+
+    bot.add_app_command_check(check, slash_commands=True)
+    return bot
+
+
+def _manifest(name, path):
+    bot = commands.InteractionBot()
+    bot.load_extension(name)
+    manifest = path.with_suffix(".json")
+    assert write_manifest(bot, manifest) == 1
+    bot.unload_extension(name)
+    return manifest
+
+
+def test_stub_dispatches_to_real_command_once(extension):
+    name, path = extension
+
+    async def main():
+        manifest = _manifest(name, path)
+        hooks = []
+        bot = _bot(hooks)
+        assert load_manifest(bot, manifest) == [name]
+
+        inter = InteractionFactory(bot).slash("ping")
+        await bot.process_application_commands(inter)
+        await asyncio.sleep(0)  # events are dispatched in tasks
+
+        assert name in bot.extensions
+        assert len(sys.modules[name].calls) == 1
+        assert sorted(hooks) == ["after", "before", "check", "event"]
+        assert inter.response.sent[0][1] == "pong"
+
+    asyncio.run(main())
+
+
+def test_failed_load_keeps_stubs(extension):
+    name, path = extension
+
+    async def main():
+        manifest = _manifest(name, path)
+        sys.modules.pop(name, None)
+        path.write_text("raise RuntimeError('broken')\n")
+
+        bot = _bot([])
+        load_manifest(bot, manifest)
+        stub = bot.get_slash_command("ping")
+        with pytest.raises(commands.ExtensionFailed):
+            await bot.process_application_commands(InteractionFactory(bot).slash("ping"))
+
+        assert bot.get_slash_command("ping") is stub
+        assert name not in bot.extensions
+
+    asyncio.run(main())
@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+
+from dishka import make_async_container
+from disnake import ApplicationCommandInteraction
+
+from dishka_disnake import setup_dishka
+from dishka_disnake.commands.cache import ResponseCache
+from dishka_disnake.commands.coalesce import Coalescer
+from dishka_disnake.injector.wrap import wrap_injector
+from dishka_disnake.metrics import Counter, Histogram, Metrics
+from dishka_disnake.state_management import State
+from dishka_disnake.testing import InteractionFactory
+
+
+@pytest.fixture(autouse=True)
+def state():
+    saved = dict(State._store)
+    yield
+    State._store.clear()
+    State._store.update(saved)
+
+
+def test_render_uses_the_text_exposition_format():
+    metrics = Metrics(namespace="bot", buckets=(1, 0.1))
+    latency = metrics.register(Histogram("bot_latency_seconds", "Gateway latency.", ("shard",), (0.1, 1)))
+    commands = metrics.register(Counter("bot_commands_total", 'Commands "run".', ("name",)))
+
+    for value in (0.05, 0.1, 0.5, 5):
+        latency.labels("0").observe(value)
+    commands.labels('say "hi"\n').inc(3)
+    with pytest.raises(ValueError):
+        commands.labels("a", "b")
+
+    text = metrics.render()
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    start = lines.index("# HELP bot_latency_seconds Gateway latency.")
+    assert lines[start:] == [
+        "# HELP bot_latency_seconds Gateway latency.",
+        "# TYPE bot_latency_seconds histogram",
+        # upper bounds are inclusive, counts cumulative
+        'bot_latency_seconds_bucket{shard="0",le="0.1"} 2',
+        'bot_latency_seconds_bucket{shard="0",le="1"} 3',
+        'bot_latency_seconds_bucket{shard="0",le="+Inf"} 4',
+        'bot_latency_seconds_sum{shard="0"} 5.65',
+        'bot_latency_seconds_count{shard="0"} 4',
+        '# HELP bot_commands_total Commands \\"run\\".',
+        "# TYPE bot_commands_total counter",
+        'bot_commands_total{name="say \\"hi\\"\\n"} 3',
+    ]
+    assert "# TYPE bot_handler_duration_seconds histogram" in lines
+    assert "# TYPE bot_replayed_total counter" in lines
+
+
+def _series(family, *labels):
+    return family.series[labels].value
+
+
+def test_handler_calls_are_counted_and_timed():
+    metrics = Metrics(buckets=(10,))
+
+    async def export(inter: ApplicationCommandInteraction) -> None:
+        if inter.data.name == "fail":
+            raise RuntimeError("boom")
+
+    async def main():
+        container = make_async_container()
+        setup_dishka(container, metrics=metrics)
+        handler = wrap_injector(export)
+        factory = InteractionFactory()
+        await handler(inter=factory.slash("export"))
+        with pytest.raises(RuntimeError):
+            await handler(inter=factory.slash("fail"))
+        await container.close()
+
+    asyncio.run(main())
+
+    labels = (export.__qualname__, "slash")
+    assert _series(metrics.invocations, *labels) == 2
+    assert _series(metrics.scopes, *labels) == 2
+    assert _series(metrics.errors, *labels) == 1
+    duration = metrics.duration.series[labels]
+    assert duration.counts == [2, 0]
+
+
+def test_cached_and_coalesced_calls_are_counted():
+    metrics = Metrics()
+    release = None
+
+    async def leaderboard(inter: ApplicationCommandInteraction) -> None:
+        await release.wait()
+        await inter.response.send_message("top 10")
+
+    async def main():
+        nonlocal release
+        release = asyncio.Event()
+        container = make_async_container()
+        setup_dishka(container, metrics=metrics)
+        handler = wrap_injector(leaderboard, cache=ResponseCache(ttl=60), coalesce=Coalescer())
+        factory = InteractionFactory()
+
+        calls = [asyncio.create_task(handler(inter=factory.slash("leaderboard"))) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*calls)
+        await handler(inter=factory.slash("leaderboard"))
+        await container.close()
+
+    asyncio.run(main())
+
+    qualname = leaderboard.__qualname__
+    assert _series(metrics.invocations, qualname, "slash") == 1
+    assert _series(metrics.replays, qualname, "slash", "coalesced") == 2
+    assert _series(metrics.replays, qualname, "slash", "cached") == 1
+    assert (
+        f'dishka_disnake_replayed_total{{handler="{qualname}",kind="slash",outcome="cached"}} 1'
+        in metrics.render().splitlines()
+    )
+
+
+def test_serve_exposes_render():
+    async def main():
+        metrics = Metrics()
+        metrics.invocations.labels("export", "slash").inc()
+        server = await metrics.serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            responses = []
+            for path in ("/metrics", "/other"):
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+                responses.append(await reader.read())
+                writer.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+        return metrics, responses
+
+    metrics, (found, missing) = asyncio.run(main())
+    head, body = found.split(b"\r\n\r\n", 1)
+    assert head.startswith(b"HTTP/1.1 200 OK")
+    assert b"Content-Type: text/plain; version=0.0.4" in head
+    assert body.decode() == metrics.render()
+    assert missing.startswith(b"HTTP/1.1 404 Not Found")
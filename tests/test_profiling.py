@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from dishka import Provider, Scope, make_async_container, provide
+from dishka.registry import Registry
+
+from dishka_disnake import profiling
+from dishka_disnake.profiling import DependencyProfiler
+
+
+class Config:
+    __module__ = "bot.services"
+
+
+class Database:
+    __module__ = "bot.services"
+
+
+class Repo:
+    __module__ = "bot.services"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(profiling.time, "perf_counter", clock)
+    return clock
+
+
+def make_container(clock):
+    class ServicesProvider(Provider):
+        @provide(scope=Scope.APP)
+        def config(self) -> Config:
+            clock.now += 1.0
+            return Config()
+
+        @provide(scope=Scope.REQUEST)
+        def database(self, config: Config) -> Database:
+            clock.now += 2.0
+            return Database()
+
+        @provide(scope=Scope.REQUEST)
+        def repo(self, database: Database, config: Config) -> Repo:
+            clock.now += 4.0
+            return Repo()
+
+    return make_async_container(ServicesProvider())
+
+
+def test_time_is_attributed_to_the_dependency_and_its_parent(clock):
+    async def main():
+        profiler = DependencyProfiler()
+        container = profiler.install(make_container(clock))
+        for _ in range(2):
+            async with container() as request:
+                await request.get(Repo)
+        await container.close()
+        return profiler
+
+    profiles = asyncio.run(main()).profiles
+
+    repo = profiles[("Repo", "REQUEST", None)]
+    assert (repo.calls, repo.hits) == (2, 0)
+    # 4s of its own, plus the database (2s) and the config (1s, first request only)
+    assert (repo.total, repo.self_total, repo.max) == (13.0, 8.0, 7.0)
+
+    database = profiles[("Database", "REQUEST", "Repo")]
+    assert (database.calls, database.hits, database.self_total) == (2, 0, 4.0)
+    assert database.total == 5.0
+
+    # created once in the APP scope, then served from its cache
+    config = profiles[("Config", "APP", "Database")]
+    assert (config.calls, config.hits, config.created) == (2, 1, 1)
+    assert config.self_total == 1.0
+    assert profiles[("Config", "APP", "Repo")].hits == 2
+
+
+def test_install_refuses_an_unknown_factory_signature(monkeypatch, clock):
+    container = make_container(clock)
+
+    def get_compiled_async(registry, dependency):
+        async def compiled(getter, exits, cache, context):
+            pass
+
+        return compiled
+
+    monkeypatch.setattr(Registry, "get_compiled_async", get_compiled_async)
+    with pytest.raises(RuntimeError, match="does not support dishka"):
+        DependencyProfiler().install(container)
+    # the container was left untouched
+    assert type(container.registry) is Registry
@@ -0,0 +1,110 @@
+import asyncio
+import multiprocessing
+import os
+
+import pytest
+
+from disnake.ext.commands import BucketType, CommandOnCooldown
+
+from dishka_disnake import ratelimit
+from dishka_disnake.ratelimit import SharedCooldown, SharedRateLimiter
+from dishka_disnake.testing import InteractionFactory
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "limits")
+
+
+def test_sliding_window(path, clock):
+    limiter = SharedRateLimiter(path, slots=64, stripes=4)
+
+    assert limiter.hit("k", rate=2, per=10) == 0
+    assert limiter.hit("k", rate=2, per=10) == 0
+    # full until the next window is half over and the previous one weighs 1
+    assert limiter.hit("k", rate=2, per=10) == pytest.approx(15.0)
+    assert limiter.usage("k", per=10) == 2
+
+    clock[0] += 11  # 1s into the next window
+    assert limiter.usage("k", per=10) == pytest.approx(1.8)
+    assert limiter.hit("k", rate=2, per=10) == pytest.approx(4.0)
+    clock[0] += 4
+    assert limiter.hit("k", rate=2, per=10) == 0
+
+    limiter.reset("k")
+    assert limiter.usage("k", per=10) == 0
+    limiter.close()
+
+
+def test_full_probe_sequence_reuses_the_oldest_window(path, clock):
+    limiter = SharedRateLimiter(path, slots=2, stripes=1, max_probe=2)
+
+    limiter.hit("a", rate=5, per=10)
+    clock[0] += 10
+    limiter.hit("b", rate=5, per=10)
+    limiter.hit("c", rate=5, per=10)
+
+    assert limiter.usage("a", per=10) == 0
+    assert limiter.usage("b", per=10) == 1
+    assert limiter.usage("c", per=10) == 1
+    limiter.close()
+
+
+def test_limiters_of_one_process_share_the_file(path, clock):
+    first = SharedRateLimiter(path, slots=64, stripes=4)
+    second = SharedRateLimiter(path, slots=64, stripes=4)
+    assert first._fd == second._fd
+
+    first.hit("k", rate=5, per=10)
+    first.close()
+    # the descriptor and its locks stay with the remaining limiter
+    second.hit("k", rate=5, per=10)
+    assert second.usage("k", per=10) == 2
+    second.close()
+    assert os.path.realpath(path) not in ratelimit._files
+
+
+def _hit_many(path, times):
+    limiter = SharedRateLimiter(path, slots=64, stripes=4)
+    for _ in range(times):
+        limiter.hit("shared", rate=10_000, per=3600)
+    limiter.close()
+
+
+def test_processes_count_together(path):
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_hit_many, args=(path, 200)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    _hit_many(path, 200)
+    for worker in workers:
+        worker.join()
+
+    limiter = SharedRateLimiter(path, slots=64, stripes=4)
+    assert round(limiter.usage("shared", per=3600)) == 800
+    limiter.close()
+
+
+def test_shared_cooldown_raises_command_on_cooldown(path, clock):
+    limiter = SharedRateLimiter(path, slots=64, stripes=4)
+    cooldown = SharedCooldown(limiter, 1, 30, BucketType.user, name="roll")
+
+    async def main():
+        factory = InteractionFactory()
+        assert cooldown(factory.slash("roll", user_id=1))
+        assert cooldown(factory.slash("roll", user_id=2))
+        with pytest.raises(CommandOnCooldown) as info:
+            cooldown(factory.slash("roll", user_id=1))
+        return info.value
+
+    error = asyncio.run(main())
+    assert error.retry_after == pytest.approx(50.0)
+    assert error.type is BucketType.user
+    limiter.close()
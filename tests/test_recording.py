@@ -0,0 +1,78 @@
+import asyncio
+
+from disnake import AllowedMentions, ApplicationCommandInteraction, MessageFlags
+
+from dishka_disnake.commands.cache import ResponseCache
+from dishka_disnake.testing import InteractionFactory
+
+
+def test_replay_keeps_allowed_mentions_tts_and_flags():
+    cache = ResponseCache(ttl=60)
+    mentions = AllowedMentions(everyone=False, users=False)
+    calls = []
+
+    async def handler(inter: ApplicationCommandInteraction) -> None:
+        calls.append(inter)
+        await inter.send(
+            "@everyone hello",
+            allowed_mentions=mentions,
+            tts=True,
+            suppress_embeds=True,
+            flags=MessageFlags(suppress_notifications=True),
+        )
+
+    wrapped = cache.wrap(handler)
+
+    async def main():
+        factory = InteractionFactory()
+        first = factory.slash("hello")
+        second = factory.slash("hello")
+        await wrapped(inter=first)
+        await wrapped(inter=second)
+        return first, second
+
+    first, second = asyncio.run(main())
+
+    assert len(calls) == 1
+    [(_, content, sent)] = second.response.sent
+    assert content == "@everyone hello"
+    assert sent["allowed_mentions"] is mentions
+    assert sent["tts"] is True
+    assert sent["suppress_embeds"] is True
+    assert sent["flags"].suppress_notifications
+    assert first.response.sent[0][2]["flags"] == sent["flags"]
+
+
+def test_edited_or_deferred_responses_are_not_replayed(monkeypatch):
+    edits = []
+
+    async def edit_original_response(self, content=None, **kwargs):
+        edits.append(content)
+
+    monkeypatch.setattr(ApplicationCommandInteraction, "edit_original_response", edit_original_response)
+
+    cache = ResponseCache(ttl=60)
+    calls = []
+
+    async def loading(inter: ApplicationCommandInteraction) -> None:
+        calls.append("loading")
+        await inter.response.send_message("Loading…")
+        await inter.edit_original_response(content="result")
+
+    async def deferred(inter: ApplicationCommandInteraction) -> None:
+        calls.append("deferred")
+        await inter.response.defer()
+        await inter.followup.send("result")
+
+    async def main():
+        factory = InteractionFactory()
+        for handler in (loading, deferred):
+            wrapped = cache.wrap(handler)
+            await wrapped(inter=factory.slash(handler.__name__))
+            await wrapped(inter=factory.slash(handler.__name__))
+
+    asyncio.run(main())
+
+    assert calls == ["loading", "loading", "deferred", "deferred"]
+    assert edits == ["result", "result"]
+    assert len(cache) == 0
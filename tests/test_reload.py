@@ -0,0 +1,79 @@
+import asyncio
+import gc
+import sys
+import textwrap
+import tracemalloc
+
+import pytest
+
+from disnake.ext import commands
+
+from dishka_disnake.injector import iter_handlers
+from dishka_disnake.reload import enable_hot_reload
+
+
+EXTENSION = """
+from disnake import ApplicationCommandInteraction
+from disnake.ext import commands
+
+from dishka_disnake.commands import slash_command
+
+
+class Ping(commands.Cog):
+    @slash_command(name="ping", description="ping")
+    async def ping(self, inter: ApplicationCommandInteraction):
+        await inter.response.send_message("pong")
+
+
+def setup(bot):
+    bot.add_cog(Ping())
+"""
+
+
+@pytest.fixture
+def extension(tmp_path, monkeypatch):
+    name = f"reload_ext_{id(tmp_path)}"
+    path = tmp_path / f"{name}.py"
+    path.write_text(textwrap.dedent(EXTENSION))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name, path
+    sys.modules.pop(name, None)
+
+
+def _handlers(name):
+    return [handler for handler, _ in iter_handlers(name)]
+
+
+def test_repeated_reloads_do_not_grow_and_failed_reload_keeps_handlers(extension):
+    name, path = extension
+
+    async def main():
+        bot = commands.InteractionBot()
+        enable_hot_reload(bot)
+        bot.load_extension(name)
+        assert len(_handlers(name)) == 1
+
+        tracemalloc.start()
+        for _ in range(100):
+            bot.reload_extension(name)
+            await asyncio.sleep(0)  # lets the bot's command sync tasks finish
+        gc.collect()
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(1000):
+            bot.reload_extension(name)
+            await asyncio.sleep(0)
+            assert len(_handlers(name)) == 1
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert current - baseline < 256 * 1024
+
+        [handler] = _handlers(name)
+        path.write_text(EXTENSION + "\nraise RuntimeError('broken')\n")
+        with pytest.raises(commands.ExtensionFailed):
+            bot.reload_extension(name)
+
+        assert _handlers(name) == [handler]
+        assert bot.get_slash_command("ping").callback.__module__ == name
+
+    asyncio.run(main())
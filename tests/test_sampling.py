@@ -0,0 +1,123 @@
+import asyncio
+import os
+import pstats
+import re
+import sys
+import time
+
+import pytest
+
+from dishka import make_async_container
+from disnake import ApplicationCommandInteraction
+
+from dishka_disnake import inject, setup_dishka
+from dishka_disnake.profiling import sampling
+from dishka_disnake.profiling.sampling import HandlerSampler
+from dishka_disnake.state_management import State
+from dishka_disnake.testing import InteractionFactory
+
+
+@pytest.fixture(autouse=True)
+def state():
+    saved = dict(State._store)
+    yield
+    State._store.clear()
+    State._store.update(saved)
+
+
+def spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def export(inter: ApplicationCommandInteraction) -> None:
+    spin(0.02)
+
+
+def _call(sampler, times):
+    async def main():
+        container = make_async_container()
+        setup_dishka(container, sampler=sampler)
+        handler = inject(export)
+        for _ in range(times):
+            await handler(inter=InteractionFactory().slash("export"))
+        await container.close()
+
+    # profiles are written in the default executor, waited for by asyncio.run
+    asyncio.run(main())
+
+
+def test_rate_picks_a_share_of_invocations(monkeypatch, tmp_path):
+    sampler = HandlerSampler(tmp_path)
+    sampler.enable("export", rate=0.25, mode="stack")
+    draws = iter([0.1, 0.25, 0.9])
+    monkeypatch.setattr(sampling.random, "random", lambda: next(draws))
+
+    assert [sampler.sampled("export") for _ in range(3)] == ["stack", None, None]
+    assert sampler.sampled("other") is None
+
+    token = sampling._sampling.set(True)
+    try:
+        sampler.enable("export")
+        # nested in a sampled invocation
+        assert sampler.sampled("export") is None
+    finally:
+        sampling._sampling.reset(token)
+    assert sampler.sampled("export") == "cprofile"
+
+    sampler.disable()
+    assert sampler.sampled("export") is None
+    with pytest.raises(ValueError):
+        sampler.enable("export", rate=0)
+
+
+def test_profiles_are_named_after_the_handler_and_rotated(tmp_path):
+    (tmp_path / "notes.txt").write_text("kept")
+    sampler = HandlerSampler(tmp_path, keep=2)
+    sampler.enable("export")
+
+    _call(sampler, 3)
+
+    assert sampler.written == 3 and sampler.skipped == 0
+    profiles = sorted(name for name in os.listdir(tmp_path) if name != "notes.txt")
+    assert len(profiles) == 2
+    for name in profiles:
+        assert re.fullmatch(rf"export-\d{{8}}-\d{{6}}-\d{{9}}-{os.getpid()}\.pstats", name)
+    assert (tmp_path / "notes.txt").exists()
+
+    stats = pstats.Stats(str(tmp_path / profiles[0]))
+    assert any(function == "spin" for _, _, function in stats.stats)
+
+
+def test_stack_mode_writes_collapsed_stacks(tmp_path):
+    sampler = HandlerSampler(tmp_path, interval=0.001)
+    sampler.enable("export", mode="stack")
+
+    _call(sampler, 1)
+
+    (name,) = os.listdir(tmp_path)
+    assert name.endswith(".collapsed")
+    lines = (tmp_path / name).read_text().splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        # stacks start at the handler's wrapper, not at the event loop
+        assert "_run_once" not in stack
+    assert any("spin (test_sampling.py:" in line for line in lines)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="cProfile uses sys.monitoring from 3.12")
+def test_busy_profiler_writes_nothing(tmp_path):
+    sampler = HandlerSampler(tmp_path)
+    sampler.enable("export")
+
+    sys.monitoring.use_tool_id(sys.monitoring.PROFILER_ID, "another profiler")
+    try:
+        _call(sampler, 1)
+    finally:
+        sys.monitoring.free_tool_id(sys.monitoring.PROFILER_ID)
+
+    assert (sampler.written, sampler.skipped) == (0, 1)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from dishka_disnake.scheduling import FairScheduler
+
+
+def test_cancelled_waiter_is_skipped():
+    async def main():
+        scheduler = FairScheduler(per_guild=1, global_limit=8)
+        await scheduler.acquire(1)
+
+        cancelled = asyncio.create_task(scheduler.acquire(1))
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(scheduler.acquire(1))
+        await asyncio.sleep(0)
+
+        # the waiter is cancelled before its task gets to forget it
+        cancelled.cancel()
+        scheduler.release(1)
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        await asyncio.wait_for(waiting, 1)
+
+        assert scheduler.stats.running == 1
+        assert scheduler.stats.guild(1).depth == 0
+        scheduler.release(1)
+        assert scheduler.stats.running == 0
+        assert not scheduler._queues and not scheduler._ring
+
+    asyncio.run(main())
+
+
+def test_slot_granted_to_cancelled_task_is_handed_back():
+    async def main():
+        scheduler = FairScheduler(per_guild=1, global_limit=8)
+        await scheduler.acquire(1)
+
+        granted = asyncio.create_task(scheduler.acquire(1))
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(scheduler.acquire(1))
+        await asyncio.sleep(0)
+
+        # granted the slot, then cancelled before it resumes
+        scheduler.release(1)
+        granted.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await granted
+        await asyncio.wait_for(waiting, 1)
+        assert scheduler.stats.running == 1
+
+    asyncio.run(main())
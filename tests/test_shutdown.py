@@ -0,0 +1,163 @@
+import asyncio
+
+from typing import AsyncIterator
+
+import pytest
+
+from dishka import Provider, Scope, make_async_container, provide
+from disnake import ApplicationCommandInteraction
+
+from dishka_disnake import inject, setup_dishka
+from dishka_disnake.base.lag import lag_monitor
+from dishka_disnake.shutdown import ShutdownCoordinator
+from dishka_disnake.state_management import State
+from dishka_disnake.testing import InteractionFactory
+from dishka_disnake.watchdog import Watchdog
+
+
+class Settings:
+    __module__ = "bot.services"
+
+
+class Session:
+    __module__ = "bot.services"
+
+
+@pytest.fixture(autouse=True)
+def state():
+    saved = dict(State._store)
+    yield
+    State._store.clear()
+    State._store.update(saved)
+
+
+def make_container(events):
+    class ServicesProvider(Provider):
+        @provide(scope=Scope.APP)
+        async def settings(self) -> AsyncIterator[Settings]:
+            yield Settings()
+            events.append("settings closed")
+
+        @provide(scope=Scope.REQUEST)
+        async def session(self) -> AsyncIterator[Session]:
+            yield Session()
+            events.append("session closed")
+
+    return make_async_container(ServicesProvider())
+
+
+def test_draining_rejects_new_calls_but_runs_nested_ones():
+    events = []
+
+    async def main():
+        shutdown = ShutdownCoordinator(deadline=5, message="restarting")
+        setup_dishka(make_container(events), shutdown=shutdown)
+        factory = InteractionFactory()
+        draining = asyncio.Event()
+
+        @inject
+        async def inner(inter: ApplicationCommandInteraction) -> None:
+            events.append("inner")
+
+        @inject
+        async def outer(inter: ApplicationCommandInteraction, session: Session) -> None:
+            await draining.wait()
+            await inner(inter=inter)
+            events.append("outer")
+
+        running = asyncio.create_task(outer(inter=factory.slash("export")))
+        await asyncio.sleep(0)
+        assert shutdown.running == 1
+
+        drain = asyncio.create_task(shutdown.drain())
+        await asyncio.sleep(0)
+        assert shutdown.closing
+
+        rejected = factory.slash("export")
+        await inner(inter=rejected)
+        assert rejected.response.sent == [("send_message", "restarting", {"ephemeral": True})]
+        assert shutdown.rejected == 1
+
+        draining.set()
+        report = await asyncio.wait_for(drain, 1)
+        await running
+        assert (report.drained, report.cancelled, report.unfinished) == (1, 0, 0)
+        assert shutdown.running == 0
+
+    asyncio.run(main())
+
+    assert events == ["inner", "outer", "session closed"]
+
+
+def test_drain_cancels_handlers_running_past_the_deadline():
+    events = []
+
+    async def main():
+        shutdown = ShutdownCoordinator(deadline=0.05)
+        setup_dishka(make_container(events), shutdown=shutdown)
+        factory = InteractionFactory()
+        finishing = asyncio.Event()
+
+        @inject
+        async def quick(inter: ApplicationCommandInteraction) -> None:
+            await finishing.wait()
+
+        @inject
+        async def stuck(inter: ApplicationCommandInteraction, session: Session) -> None:
+            await asyncio.Event().wait()
+
+        tasks = [
+            asyncio.create_task(quick(inter=factory.slash("quick"))),
+            asyncio.create_task(stuck(inter=factory.slash("stuck"))),
+        ]
+        await asyncio.sleep(0)
+        drain = asyncio.create_task(shutdown.drain())
+        await asyncio.sleep(0)
+        finishing.set()
+
+        report = await drain
+        assert (report.drained, report.cancelled, report.unfinished) == (1, 1, 0)
+        # the stuck handler was waited for until the deadline
+        assert report.elapsed >= 0.05
+        await tasks[0]
+        with pytest.raises(asyncio.CancelledError):
+            await tasks[1]
+
+    asyncio.run(main())
+
+    # cancelling the handler ran the finalizer of its scope
+    assert events == ["session closed"]
+
+
+def test_attach_closes_containers_after_the_bot():
+    events = []
+
+    class Bot:
+        async def close(self) -> None:
+            events.append("bot closed")
+
+    async def main():
+        container = make_container(events)
+        await container.get(Settings)
+        shutdown = ShutdownCoordinator(deadline=1)
+        watchdog = Watchdog(threshold=30)
+        setup_dishka(container, shutdown=shutdown, watchdog=watchdog)
+        assert lag_monitor().running
+
+        bot = Bot()
+        shutdown.attach(bot)
+        await bot.close()
+
+        assert shutdown.closing
+        assert shutdown.report is not None and shutdown.report.containers == 1
+        assert watchdog.closed and not lag_monitor().running
+
+        # a call nested in a handler still running after the shutdown
+        # doesn't start the lag monitor again
+        scope = watchdog.enter("late")
+        watchdog.exit(scope)
+        assert not lag_monitor().running
+
+    asyncio.run(main())
+
+    assert events == ["bot closed", "settings closed"]
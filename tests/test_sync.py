@@ -0,0 +1,52 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from disnake import ApplicationCommandInteraction, HTTPException
+from disnake.app_commands import application_command_factory
+from disnake.custom_warnings import SyncWarning
+from disnake.ext import commands
+
+from dishka_disnake.sync import GLOBAL_SCOPE, command_hashes, enable_sync_cache
+
+
+def _bot(fail):
+    bot = commands.InteractionBot()
+    bot._connection.application_id = 1
+
+    @bot.slash_command(name="ping", description="ping")
+    async def ping(inter: ApplicationCommandInteraction) -> None: ...
+
+    async def bulk_overwrite_global_commands(application_commands):
+        if fail:
+            raise HTTPException(type("Response", (), {"status": 500, "reason": "error"})(), "error")
+        registered = [
+            application_command_factory({**cmd.to_dict(), "id": i + 1, "application_id": 1, "version": 1})
+            for i, cmd in enumerate(application_commands)
+        ]
+        bot._connection._global_application_commands = {cmd.id: cmd for cmd in registered}
+        return registered
+
+    bot.bulk_overwrite_global_commands = bulk_overwrite_global_commands
+    return bot
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_only_synced_scopes_are_remembered(tmp_path, fail):
+    async def main():
+        bot = _bot(fail)
+        cache = enable_sync_cache(bot, tmp_path / "sync.json")
+        cache.load(1)
+        with pytest.warns(SyncWarning) if fail else contextlib.nullcontext():
+            await bot._sync_application_commands()
+        return bot, cache
+
+    bot, cache = asyncio.run(main())
+
+    if fail:
+        assert GLOBAL_SCOPE not in cache.hashes
+    else:
+        assert cache.hashes[GLOBAL_SCOPE] == command_hashes(bot)[GLOBAL_SCOPE]
+        assert [command["name"] for command in cache.commands[GLOBAL_SCOPE]] == ["ping"]
+
@@ -0,0 +1,116 @@
+import asyncio
+
+from typing import AsyncIterator
+
+import pytest
+
+from dishka import Provider, Scope, make_async_container, provide
+from disnake import ApplicationCommandInteraction
+
+from dishka_disnake import DependencyTimeoutError, inject, resolve_timeout, setup_dishka
+from dishka_disnake.state_management import State
+from dishka_disnake.testing import InteractionFactory
+
+
+class Session:
+    __module__ = "bot.services"
+
+
+class Remote:
+    __module__ = "bot.services"
+
+
+class Socket:
+    __module__ = "bot.services"
+
+
+@pytest.fixture(autouse=True)
+def state():
+    saved = dict(State._store)
+    yield
+    State._store.clear()
+    State._store.update(saved)
+
+
+def _run(handler, events, remote_delay, **setup):
+    class ServicesProvider(Provider):
+        @provide(scope=Scope.REQUEST)
+        async def session(self) -> AsyncIterator[Session]:
+            yield Session()
+            events.append("session closed")
+
+        @provide(scope=Scope.REQUEST)
+        async def remote(self) -> Remote:
+            await asyncio.sleep(remote_delay)
+            return Remote()
+
+        @provide(scope=Scope.REQUEST)
+        async def socket(self) -> Socket:
+            raise TimeoutError("socket timed out")
+
+    async def main():
+        container = make_async_container(ServicesProvider())
+        setup_dishka(container, **setup)
+        try:
+            await inject(handler)(inter=InteractionFactory().slash("export"))
+        finally:
+            await container.close()
+
+    asyncio.run(main())
+
+
+def test_timeout_closes_the_scope_and_names_the_dependency():
+    events = []
+
+    async def export(inter: ApplicationCommandInteraction, session: Session, remote: Remote) -> None:
+        events.append("handler")
+
+    with pytest.raises(DependencyTimeoutError) as info:
+        _run(export, events, remote_delay=10, resolve_timeout=0.02)
+
+    error = info.value
+    assert isinstance(error, TimeoutError)
+    assert (error.dependency, error.timeout) == (Remote, 0.02)
+    assert error.handler == export.__qualname__
+    assert str(error) == f"Resolving Remote for {export.__qualname__} timed out after 0.02s"
+    # the session resolved before the timeout was finalized, the handler never ran
+    assert events == ["session closed"]
+
+
+def test_timeout_per_type_overrides_the_handler_one():
+    events = []
+
+    @resolve_timeout(None)
+    async def export(inter: ApplicationCommandInteraction, remote: Remote) -> None:
+        events.append("handler")
+
+    with pytest.raises(DependencyTimeoutError) as info:
+        _run(export, events, remote_delay=10, dependency_timeouts={Remote: 0.02})
+    assert info.value.timeout == 0.02
+
+    @resolve_timeout(0.01)
+    async def export_slowly(inter: ApplicationCommandInteraction, remote: Remote) -> None:
+        events.append("handler")
+
+    _run(export_slowly, events, remote_delay=0.05, dependency_timeouts={Remote: None})
+    assert events == ["handler"]
+
+
+def test_handler_timeout_overrides_the_default():
+    events = []
+
+    @resolve_timeout(1)
+    async def export(inter: ApplicationCommandInteraction, remote: Remote) -> None:
+        events.append("handler")
+
+    _run(export, events, remote_delay=0.05, resolve_timeout=0.01)
+    assert events == ["handler"]
+
+
+def test_timeout_raised_by_a_provider_is_kept():
+    async def export(inter: ApplicationCommandInteraction, socket: Socket) -> None:
+        pass
+
+    with pytest.raises(TimeoutError, match="socket timed out") as info:
+        _run(export, [], remote_delay=0, resolve_timeout=1)
+    assert not isinstance(info.value, DependencyTimeoutError)
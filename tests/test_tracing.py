@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from dishka import Provider, Scope, make_async_container, provide
+from disnake import ApplicationCommandInteraction
+
+from dishka_disnake import inject, setup_dishka
+from dishka_disnake.state_management import State
+from dishka_disnake.testing import InteractionFactory
+from dishka_disnake.tracing import OpenTelemetryTracer
+
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry import trace  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+
+
+class Repo:
+    __module__ = "bot.services"
+
+
+@pytest.fixture(autouse=True)
+def state():
+    saved = dict(State._store)
+    yield
+    State._store.clear()
+    State._store.update(saved)
+
+
+def test_spans_started_by_handlers_are_children_of_the_handler_span():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    otel_tracer = provider.get_tracer("tests")
+
+    class RepoProvider(Provider):
+        @provide(scope=Scope.REQUEST)
+        def repo(self) -> Repo:
+            with otel_tracer.start_as_current_span("repo.connect"):
+                return Repo()
+
+    @inject
+    async def handler(inter: ApplicationCommandInteraction, repo: Repo) -> None:
+        with otel_tracer.start_as_current_span("user.work"):
+            pass
+
+    async def main():
+        container = make_async_container(RepoProvider())
+        setup_dishka(container, tracer=OpenTelemetryTracer(otel_tracer))
+        try:
+            await handler(inter=InteractionFactory().slash("ping"))
+        finally:
+            await container.close()
+
+    asyncio.run(main())
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert spans["user.work"].parent.span_id == spans["dishka.handler"].context.span_id
+    assert spans["repo.connect"].parent.span_id == spans["dishka.resolve"].context.span_id
+    assert spans["dishka.handler"].parent.span_id == spans["dishka.scope"].context.span_id
+    assert spans["dishka.interaction"].parent is None
+    assert not trace.get_current_span().get_span_context().is_valid
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from dishka import Provider, Scope, make_async_container, provide
+
+from dishka_disnake import warmup_dishka
+from dishka_disnake.setup import warmup
+
+
+class Pool:
+    __module__ = "bot.services"
+
+
+class Session:
+    __module__ = "bot.services"
+
+
+class Search:
+    __module__ = "bot.services"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(warmup.time, "perf_counter", clock)
+    return clock
+
+
+def make_provider(clock):
+    class SlowProvider(Provider):
+        scope = Scope.APP
+
+        @provide
+        async def search(self, session: Session) -> Search:
+            clock.now += 4.0
+            return Search()
+
+        @provide
+        async def pool(self) -> Pool:
+            clock.now += 1.0
+            return Pool()
+
+        @provide
+        async def session(self) -> Session:
+            clock.now += 2.0
+            return Session()
+
+    return SlowProvider()
+
+
+def test_each_timing_covers_only_its_own_factory(clock):
+    async def main():
+        container = make_async_container(make_provider(clock))
+        report = await warmup_dishka(container, validate=False)
+        await container.close()
+        return report
+
+    report = asyncio.run(main())
+    # the session is created before the search that depends on it
+    assert report.timings == {Pool: 1.0, Session: 2.0, Search: 4.0}
+    assert report.total == 7.0
@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from dishka import Provider, make_async_container
+from disnake import ApplicationCommandInteraction
+
+from dishka_disnake import setup_dishka
+from dishka_disnake.admission import AdmissionController, Priority
+from dishka_disnake.commands.cache import ResponseCache
+from dishka_disnake.commands.coalesce import Coalescer
+from dishka_disnake.injector.wrap import wrap_injector
+from dishka_disnake.scheduling import FairScheduler
+from dishka_disnake.state_management import State
+from dishka_disnake.testing import InteractionFactory
+
+
+@pytest.fixture(autouse=True)
+def state():
+    saved = dict(State._store)
+    yield
+    State._store.clear()
+    State._store.update(saved)
+
+
+def test_coalesced_followers_and_cache_hits_take_no_slots():
+    release = asyncio.Event()
+    calls = []
+
+    async def handler(inter: ApplicationCommandInteraction) -> None:
+        calls.append(inter)
+        await release.wait()
+        await inter.response.send_message("done")
+
+    async def main():
+        admission = AdmissionController(max_inflight=1, queue_timeout=5)
+        scheduler = FairScheduler(per_guild=1)
+        container = make_async_container(Provider())
+        setup_dishka(container, admission=admission, scheduler=scheduler)
+        cache = ResponseCache(ttl=60)
+        wrapped = wrap_injector(handler, cache=cache, coalesce=Coalescer())
+        factory = InteractionFactory()
+
+        leader = asyncio.create_task(wrapped(inter=factory.slash("stats")))
+        await asyncio.sleep(0)
+        followers = [factory.slash("stats") for _ in range(5)]
+        tasks = [asyncio.create_task(wrapped(inter=inter)) for inter in followers]
+        await asyncio.sleep(0.01)
+
+        assert admission.stats.inflight == 1
+        assert sum(admission.stats.queued.values()) == 0
+        assert scheduler.stats.running == 1
+
+        release.set()
+        await asyncio.gather(leader, *tasks)
+
+        # holds the only slot while a cached response is served
+        release.clear()
+        blocker = asyncio.create_task(wrap_injector(handler)(inter=factory.slash("other")))
+        await asyncio.sleep(0)
+        hit = factory.slash("stats")
+        await asyncio.wait_for(wrapped(inter=hit), 0.5)
+        release.set()
+        await blocker
+
+        await admission.close()
+        await container.close()
+        return followers, hit
+
+    followers, hit = asyncio.run(main())
+
+    assert len(calls) == 2
+    assert [inter.response.sent[0][1] for inter in followers] == ["done"] * 5
+    assert hit.response.sent[0][1] == "done"
+
+
+def test_rejections_are_not_cached():
+    async def handler(inter: ApplicationCommandInteraction) -> None:
+        await inter.response.send_message("done")
+
+    async def main():
+        admission = AdmissionController(max_inflight=0)
+        container = make_async_container(Provider())
+        setup_dishka(container, admission=admission)
+        cache = ResponseCache(ttl=60)
+        wrapped = wrap_injector(handler, cache=cache, priority=Priority.LOW)
+
+        inter = InteractionFactory().slash("stats")
+        await wrapped(inter=inter)
+
+        await admission.close()
+        await container.close()
+        return inter, cache
+
+    inter, cache = asyncio.run(main())
+
+    assert inter.response.sent[0][1] == AdmissionController().busy_message
+    assert len(cache) == 0